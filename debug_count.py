@@ -1,6 +1,17 @@
 #!/usr/bin/env python3
 """Debug the count issue."""
 
+try:
+    import re2 as re  # google-re2: linear-time DFA matching when installed
+except ImportError:
+    import re
+import sys
+from collections import Counter
+
+# Single pattern for every "Chapter 1" header line, capturing the header
+# text as written so all counts come out of one scan of the string.
+HEADER_PATTERN = re.compile(r'(?m)^(##[ \t]+Chapter 1)[ \t]*$')
+
 test_string = """# Main Document
 
 ## Chapter 1
@@ -17,16 +28,15 @@ Content for chapter 2.
 print("Full content:")
 print(repr(test_string))
 print("\nLines:")
-for i, line in enumerate(test_string.split('\n')):
-    print(f"{i}: {repr(line)}")
+out = [f"{i}: {line!r}" for i, line in enumerate(test_string.splitlines())]
+sys.stdout.write("\n".join(out) + "\n")
+
+matches = list(HEADER_PATTERN.finditer(test_string))
+counts = Counter(match.group(1) for match in matches)
 
-print(f"\nCount of '## Chapter 1': {test_string.count('## Chapter 1')}")
-print(f"Count of '##  Chapter 1': {test_string.count('##  Chapter 1')}")
+print()
+for header, count in counts.items():
+    print(f"Count of {header!r}: {count}")
 
-# Find all occurrences manually
-import re
-pattern = r'^##.*Chapter 1.*$'
-matches = re.findall(pattern, test_string, re.MULTILINE)
 print(f"\nRegex matches for header lines: {len(matches)}")
-for match in matches:
-    print(f"  {repr(match)}")
+sys.stdout.write("".join(f"  {match.group(0)!r}\n" for match in matches))
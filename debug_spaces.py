@@ -2,7 +2,6 @@
 """Debug the extra spaces case."""
 
 import sys
-sys.path.insert(0, 'src')
 
 from quantalogic_markdown_mcp.safe_editor import SafeMarkdownEditor
 from quantalogic_markdown_mcp.safe_editor_types import ValidationLevel
@@ -23,20 +22,17 @@ Content for chapter 2.
     
     editor = SafeMarkdownEditor(base_content, ValidationLevel.NORMAL)
     sections = editor.get_sections()
+    lines = editor.to_markdown().splitlines()
     
     # Find Chapter 1
-    chapter1 = None
-    for section in sections:
-        if section.title == "Chapter 1":
-            chapter1 = section
-            break
+    sections_by_title = {section.title: section for section in sections}
+    chapter1 = sections_by_title.get("Chapter 1")
     
     print(f"Chapter 1 section:")
     print(f"  Title: '{chapter1.title}'")
     print(f"  Level: {chapter1.level}")
     
     # Get the original header line
-    lines = editor.to_markdown().split('\n')
     original_header = lines[chapter1.line_start]
     print(f"  Original header line: '{original_header}'")
     
@@ -45,14 +41,14 @@ Content for chapter 2.
 
 Content with header that has extra spaces."""
     
-    print(f"\nTest content first line: '{test_content.split(chr(10))[0]}'")
+    first_line = test_content.split('\n', 1)[0]
+    print(f"\nTest content first line: '{first_line}'")
     
     # Expected header that our code generates
     expected_header = "#" * chapter1.level + " " + chapter1.title
     print(f"Expected header for comparison: '{expected_header}'")
     
     # Check if they match
-    first_line = test_content.split('\n')[0]
     print(f"First line of test content: '{first_line}'")
     print(f"Match check: {first_line == expected_header}")
     
@@ -66,10 +62,10 @@ Content with header that has extra spaces."""
         print(f"\nHeader count: {updated_content.count('## Chapter 1')}")
         
         # Show each line to debug
-        updated_lines = updated_content.split('\n')
-        for i, line in enumerate(updated_lines):
-            if 'Chapter 1' in line:
-                print(f"Line {i}: '{line}'")
+        out = [f"Line {i}: '{line}'"
+               for i, line in enumerate(updated_content.splitlines())
+               if 'Chapter 1' in line]
+        sys.stdout.write("".join(f"{entry}\n" for entry in out))
 
 if __name__ == "__main__":
     debug_extra_spaces()
@@ -1,17 +1,16 @@
 #!/usr/bin/env python3
 """Demo of the stateless MCP server functionality."""
 
-import tempfile
-from pathlib import Path
+from io import StringIO
+
 from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
 
 def main():
     print("🔧 Starting Quantalogic Markdown MCP Server Demo")
     print("=" * 60)
     
-    # Create a temporary markdown file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-        f.write("""# Test Document
+    # Keep the test document in memory; the stateless tools read and write it in place
+    document = StringIO("""# Test Document
 
 ## Introduction
 This is a test document for the stateless server.
@@ -23,9 +22,8 @@ This is a test document for the stateless server.
 ## Conclusion
 The server is working perfectly!
 """)
-        temp_path = f.name
     
-    print(f"📄 Created test document: {temp_path}")
+    print("📄 Created in-memory test document")
     
     try:
         # Initialize the server
@@ -35,57 +33,64 @@ The server is working perfectly!
         
         # Test 1: list_sections
         print("\n📋 Test 1: list_sections")
-        result = server.call_tool_sync("list_sections", {"document_path": temp_path})
+        result = server.list_sections(document_path=document)
         print(f"   Success: {result.get('success', False)}")
         if result.get('success'):
-            sections = result.get('sections', [])
+            sections = server.sections_as_records(result)
             print(f"   Found {len(sections)} sections:")
             for section in sections:
-                print(f"     - {section.get('title', 'Unknown')} (Level {section.get('level', '?')}, ID: {section.get('id', 'Unknown')})")
+                print(f"     - {section.title} (Level {section.level}, ID: {section.id})")
         
-        # Test 2: get_section
+        # Tests 2-6 run as one batch: the document is parsed once and saved once
+        calls = []
         if result.get('success') and result.get('sections'):
-            first_section_id = result['sections'][0]['id']
+            first_section_id = sections[0].id
+            calls.append(("get_section", {"section_id": first_section_id}))
+        calls += [
+            ("insert_section", {
+                "heading": "New Section",
+                "content": "This is a new section added by the stateless server.",
+                "position": 2
+            }),
+            ("list_sections", {}),
+            ("get_document", {}),
+            ("analyze_document", {}),
+        ]
+        batch_result = server.call_tools_sync(document, calls)
+        batch_results = batch_result.get('results', [{}] * len(calls))
+        if len(calls) == 5:
+            get_result = batch_results.pop(0)
             print(f"\n📖 Test 2: get_section (ID: {first_section_id})")
-            get_result = server.call_tool_sync("get_section", {"document_path": temp_path, "section_id": first_section_id})
             print(f"   Success: {get_result.get('success', False)}")
             if get_result.get('success'):
                 section = get_result.get('section', {})
                 print(f"   Retrieved: {section.get('title', 'Unknown')}")
                 print(f"   Content preview: {section.get('content', '')[:50]}...")
+        insert_result, verify_result, doc_result, analyze_result = batch_results
         
         # Test 3: insert_section
         print(f"\n➕ Test 3: insert_section")
-        insert_result = server.call_tool_sync("insert_section", {
-            "document_path": temp_path,
-            "heading": "New Section",
-            "content": "This is a new section added by the stateless server.",
-            "position": 2
-        })
         print(f"   Success: {insert_result.get('success', False)}")
         
         # Test 4: Verify the section was added
         print(f"\n🔍 Test 4: Verifying section was added...")
-        verify_result = server.call_tool_sync("list_sections", {"document_path": temp_path})
         print(f"   Success: {verify_result.get('success', False)}")
         if verify_result.get('success'):
-            sections = verify_result.get('sections', [])
+            sections = server.sections_as_records(verify_result)
             print(f"   Now have {len(sections)} sections:")
             for section in sections:
-                print(f"     - {section.get('title', 'Unknown')} (Level {section.get('level', '?')}, ID: {section.get('id', 'Unknown')})")
+                print(f"     - {section.title} (Level {section.level}, ID: {section.id})")
         
         # Test 5: get_document
         print(f"\n📄 Test 5: get_document")
-        doc_result = server.call_tool_sync("get_document", {"document_path": temp_path})
         print(f"   Success: {doc_result.get('success', False)}")
         if doc_result.get('success'):
             content = doc_result.get('content', '')
-            line_count = len(content.split('\n'))
+            line_count = content.count('\n') + 1
             print(f"   Document has {line_count} lines")
         
         # Test 6: analyze_document
         print(f"\n🔍 Test 6: analyze_document")
-        analyze_result = server.call_tool_sync("analyze_document", {"document_path": temp_path})
         print(f"   Success: {analyze_result.get('success', False)}")
         if analyze_result.get('success'):
             analysis = analyze_result.get('analysis', {})
@@ -104,11 +109,6 @@ The server is working perfectly!
         import traceback
         traceback.print_exc()
         return False
-        
-    finally:
-        # Clean up
-        Path(temp_path).unlink(missing_ok=True)
-        print(f"\n🧹 Cleaned up test file")
 
 if __name__ == "__main__":
     main()
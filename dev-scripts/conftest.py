@@ -0,0 +1,11 @@
+"""Shared pytest fixtures for running the dev-scripts checks under pytest."""
+
+import pytest
+
+from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """One MCP server shared by every dev-script check in the session."""
+    return MarkdownMCPServer()
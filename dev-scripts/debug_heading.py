@@ -2,14 +2,23 @@
 Debug the heading level change issue
 """
 
+try:
+    import re2 as re  # google-re2: linear-time DFA matching when installed
+except ImportError:
+    import re
 import sys
-import os
-
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from quantalogic_markdown_mcp import SafeMarkdownEditor, ValidationLevel
 
+# Compiled once; bounded whitespace classes avoid backtracking on padded
+# lines and absorb surrounding whitespace, so lines need no .strip() first
+_HEADING_RE = re.compile(r'^[ \t]*(#{1,6})[ \t]+(.+?)(?:[ \t]+#+)?[ \t]*$')
+
+
+def _match_heading(line):
+    """Match a heading line, skipping the regex for lines without '#'."""
+    return _HEADING_RE.match(line) if '#' in line else None
+
 def debug_heading_change():
     """Debug why heading level change is failing."""
     
@@ -28,13 +37,11 @@ Content for section B.
     
     editor = SafeMarkdownEditor(markdown_text, ValidationLevel.NORMAL)
     sections = editor.get_sections()
+    line_count = editor.get_line_count()
     
     # Find "Section B"
-    section_b = None
-    for section in sections:
-        if section.title == "Section B":
-            section_b = section
-            break
+    sections_by_title = {section.title: section for section in sections}
+    section_b = sections_by_title.get("Section B")
     
     if section_b:
         print(f"Section B found:")
@@ -44,23 +51,22 @@ Content for section B.
         print(f"  Line end: {section_b.line_end}")
         
         # Check the actual line content
-        lines = editor._current_text.split('\n')
         line_index = section_b.line_start - 1  # Convert to 0-based
         
         print(f"\nDocument lines around Section B:")
-        for i in range(max(0, line_index - 2), min(len(lines), line_index + 3)):
-            marker = " -> " if i == line_index else "    "
-            print(f"{marker}Line {i+1}: {repr(lines[i])}")
+        window_start = max(0, line_index - 2)
+        out = [f"{' -> ' if i == line_index else '    '}Line {i+1}: {editor.get_line(i)!r}"
+               for i in range(window_start, min(line_index + 3, line_count))]
+        sys.stdout.write("\n".join(out) + "\n")
         
         print(f"\nLine content at index {line_index}:")
-        if line_index < len(lines):
-            actual_line = lines[line_index]
+        if 0 <= line_index < line_count:
+            actual_line = editor.get_line(line_index)
             print(f"  Raw: {repr(actual_line)}")
             print(f"  Stripped: {repr(actual_line.strip())}")
             
             # Test the regex
-            import re
-            heading_match = re.match(r'^(#+)\s*(.*)$', actual_line.strip())
+            heading_match = _match_heading(actual_line)
             if heading_match:
                 print("  Regex match found:")
                 print(f"    Level: {len(heading_match.group(1))}")
@@ -71,15 +77,15 @@ Content for section B.
                 # Try a few lines around to find the actual heading
                 for offset in [-1, 0, 1, 2]:
                     test_idx = line_index + offset
-                    if 0 <= test_idx < len(lines):
-                        test_line = lines[test_idx]
-                        test_match = re.match(r'^(#+)\s*(.*)$', test_line.strip())
+                    if 0 <= test_idx < line_count:
+                        test_line = editor.get_line(test_idx)
+                        test_match = _match_heading(test_line)
                         if test_match and "Section B" in test_match.group(2):
                             print(f"  Found Section B heading at line {test_idx + 1}: {repr(test_line)}")
                             break
                 
         else:
-            print(f"  Line index {line_index} is out of bounds (total lines: {len(lines)})")
+            print(f"  Line index {line_index} is out of bounds (total lines: {line_count})")
 
 if __name__ == "__main__":
     debug_heading_change()
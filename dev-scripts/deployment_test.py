@@ -3,24 +3,11 @@
 MCP Server Deployment Test
 Final test to demonstrate the MCP server is ready for deployment.
 """
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
 
-def main():
-    print("🚀 MCP Server Deployment Test")
-    print("=" * 50)
-    
-    print("\n1. Creating MCP Server...")
-    server = MarkdownMCPServer("SafeMarkdownEditor-Production")
-    print("   ✅ Server created successfully")
-    
-    print("\n2. Initializing document...")
-    server.initialize_document("""# Production Test Document
+# Built once at import time and reused by every call to main()
+DEPLOYMENT_DOCUMENT = """# Production Test Document
 
 This is a test document for the MCP server deployment.
 
@@ -61,7 +48,19 @@ The server offers 3 MCP prompts:
 ## Conclusion
 
 The MCP server is fully functional and ready for production use!
-""")
+"""
+
+
+def main():
+    print("🚀 MCP Server Deployment Test")
+    print("=" * 50)
+    
+    print("\n1. Creating MCP Server...")
+    server = MarkdownMCPServer("SafeMarkdownEditor-Production")
+    print("   ✅ Server created successfully")
+    
+    print("\n2. Initializing document...")
+    server.initialize_document(DEPLOYMENT_DOCUMENT)
     print("   ✅ Document initialized with comprehensive content")
     
     print("\n3. Testing document operations...")
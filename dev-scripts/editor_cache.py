@@ -0,0 +1,21 @@
+"""Parse-once editors for the dev-script entry points.
+
+Scripts that start from the same markdown share one parsed template per
+text and validation level; each call hands out an independent copy, so
+edits in one script never leak into another.
+"""
+
+from functools import lru_cache
+
+from quantalogic_markdown_mcp import SafeMarkdownEditor, ValidationLevel
+
+
+@lru_cache(maxsize=8)
+def _template_editor(markdown_text, validation_level):
+    """Parse markdown_text once; the template itself is never edited."""
+    return SafeMarkdownEditor(markdown_text, validation_level)
+
+
+def make_editor(markdown_text, validation_level=ValidationLevel.NORMAL):
+    """Return a fresh editor for markdown_text without parsing it again."""
+    return _template_editor(markdown_text, validation_level).copy()
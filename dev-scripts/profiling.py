@@ -0,0 +1,45 @@
+"""Opt-in profiling and time budgets for the dev-script entry points.
+
+Environment variables:
+    QMCP_PROFILE=1             write a cProfile dump to ``<name>.prof`` (view with snakeviz)
+    QMCP_PROFILE=pyinstrument  write a pyinstrument call tree to ``<name>.html``
+    QMCP_TIME_BUDGET=<seconds> exit with status 1 if the run takes longer
+
+Only the calling process is profiled; work handed to process pools is not.
+"""
+
+import cProfile
+import os
+import sys
+import time
+
+
+def run_profiled(func, name):
+    """Run func(), profiling it and enforcing the time budget when configured."""
+    mode = os.environ.get("QMCP_PROFILE", "")
+    budget = os.environ.get("QMCP_TIME_BUDGET")
+
+    start = time.perf_counter()
+    if mode == "pyinstrument":
+        from pyinstrument import Profiler
+
+        profiler = Profiler()
+        profiler.start()
+        try:
+            result = func()
+        finally:
+            profiler.stop()
+            profiler.write_html(f"{name}.html")
+    elif mode:
+        with cProfile.Profile() as profiler:
+            result = func()
+        profiler.dump_stats(f"{name}.prof")
+    else:
+        result = func()
+    elapsed = time.perf_counter() - start
+
+    if budget is not None and elapsed > float(budget):
+        print(f"\n⏱️  {name} took {elapsed:.3f}s, over the {float(budget):.3f}s budget")
+        sys.exit(1)
+
+    return result
@@ -0,0 +1,6 @@
+"""Console formatting shared by the dev-script entry points."""
+
+
+def format_errors(errors):
+    """Join the messages of errors on one line, or "<none>" when there are none."""
+    return ", ".join(map(str, errors)) or "<none>"
@@ -6,10 +6,6 @@ This script can be used to run the MCP server directly for testing purposes.
 """
 
 import sys
-import os
-
-# Add the src directory to the path to import our modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from quantalogic_markdown_mcp.mcp_server import main
 
@@ -3,18 +3,16 @@ Comprehensive test suite for SafeMarkdownEditor API compliance.
 Tests all major functionality according to the API specification.
 """
 
-import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from quantalogic_markdown_mcp import (
     SafeMarkdownEditor, 
     EditOperation, 
     ValidationLevel
 )
 
+from reporting import format_errors
+
 def test_api_compliance():
     """Test SafeMarkdownEditor API compliance with specification."""
     
@@ -129,7 +127,7 @@ Common issues and solutions.
         )
         print(f"   Update section: {'Success' if update_result.success else 'Failed'}")
         if update_result.errors:
-            print(f"   Update errors: {[str(e) for e in update_result.errors]}")
+            print(f"   Update errors: {format_errors(update_result.errors)}")
     
     # Test insert_section_after
     current_sections = editor.get_sections()
@@ -142,7 +140,7 @@ Common issues and solutions.
         )
         print(f"   Insert section: {'Success' if insert_result.success else 'Failed'}")
         if insert_result.errors:
-            print(f"   Insert errors: {[str(e) for e in insert_result.errors]}")
+            print(f"   Insert errors: {format_errors(insert_result.errors)}")
     
     # Test 5: Transaction Management
     print("\n5. Testing Transaction Management")
@@ -202,28 +200,23 @@ Common issues and solutions.
     
     # Test 8: Thread Safety (Basic Test)
     print("\n8. Testing Thread Safety")
-    import threading
+    from concurrent.futures import ThreadPoolExecutor
     
-    results = []
     def worker_thread(thread_id):
         try:
             # Multiple threads trying to read concurrently
             local_sections = editor.get_sections()
             local_stats = editor.get_statistics()
-            results.append(f"Thread {thread_id}: {len(local_sections)} sections, {local_stats.word_count} words")
+            return f"Thread {thread_id}: {len(local_sections)} sections, {local_stats.word_count} words"
         except Exception as e:
-            results.append(f"Thread {thread_id} error: {e}")
-    
-    threads = []
-    for i in range(3):
-        thread = threading.Thread(target=worker_thread, args=(i,))
-        threads.append(thread)
-        thread.start()
+            return f"Thread {thread_id} error: {e}"
     
-    for thread in threads:
-        thread.join()
+    # Reused workers avoid per-task thread startup; scale readers with the CPUs
+    max_workers = min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(worker_thread, range(4 * max_workers)))
     
-    print(f"   Concurrent read test: {len(results)} threads completed")
+    print(f"   Concurrent read test: {len(results)} reads completed")
     for result in results:
         print(f"     {result}")
     
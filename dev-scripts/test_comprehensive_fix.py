@@ -1,71 +1,85 @@
 #!/usr/bin/env python3
 """Comprehensive test for header duplication fix."""
 
-import re
 import sys
-sys.path.insert(0, 'src')
+from dataclasses import dataclass
+from io import StringIO
 
-from quantalogic_markdown_mcp.safe_editor import SafeMarkdownEditor
-from quantalogic_markdown_mcp.safe_editor_types import ValidationLevel
+import pytest
 
-def test_comprehensive_header_fix():
-    """Test various edge cases for header duplication fix."""
-    
-    test_cases = [
-        {
-            "name": "Exact header match",
-            "content": """## Chapter 1
+from editor_cache import make_editor
+
+# Emoji markers for interactive terminals; plain ASCII when output is piped or
+# logged, which avoids multi-byte encoding and non-UTF-8 console failures
+_INTERACTIVE = sys.stdout.isatty()
+OK = "✅" if _INTERACTIVE else "[OK]"
+FAIL = "❌" if _INTERACTIVE else "[FAIL]"
+DONE = "🎉" if _INTERACTIVE else "[DONE]"
+
+# Interned like the editor's section titles, so lookups compare by identity
+CHAPTER1_TITLE = sys.intern("Chapter 1")
+
+@dataclass(frozen=True, slots=True)
+class HeaderCase:
+    """An update_section_content input and the Chapter 1 header count it should leave."""
+    name: str
+    content: str
+    expected_headers: int
+
+HEADER_CASES = (
+    HeaderCase(
+        "Exact header match",
+        """## Chapter 1
 
 New content with exact header match.""",
-            "expected_headers": 1
-        },
-        {
-            "name": "Header with extra spaces",
-            "content": """##  Chapter 1  
+        1
+    ),
+    HeaderCase(
+        "Header with extra spaces",
+        """##  Chapter 1  
 
 Content with header that has extra spaces.""",
-            "expected_headers": 2  # Should NOT be removed due to different spacing
-        },
-        {
-            "name": "Wrong level header",
-            "content": """### Chapter 1
+        2  # Should NOT be removed due to different spacing
+    ),
+    HeaderCase(
+        "Wrong level header",
+        """### Chapter 1
 
 Content with wrong level header.""",
-            "expected_headers": 2  # Should NOT be removed due to different level
-        },
-        {
-            "name": "Different title",
-            "content": """## Different Title
+        2  # Should NOT be removed due to different level
+    ),
+    HeaderCase(
+        "Different title",
+        """## Different Title
 
 Content with completely different title.""",
-            "expected_headers": 1  # Only original header should remain
-        },
-        {
-            "name": "Header in middle of content",
-            "content": """Some content first.
+        1  # Only original header should remain
+    ),
+    HeaderCase(
+        "Header in middle of content",
+        """Some content first.
 
 ## Chapter 1
 
 More content after header.""",
-            "expected_headers": 2  # Header in middle should NOT be removed
-        },
-        {
-            "name": "Empty content with header",
-            "content": """## Chapter 1""",
-            "expected_headers": 1  # Should remove duplicate
-        },
-        {
-            "name": "Header with empty lines after",
-            "content": """## Chapter 1
-
+        2  # Header in middle should NOT be removed
+    ),
+    HeaderCase(
+        "Empty content with header",
+        """## Chapter 1""",
+        1  # Should remove duplicate
+    ),
+    HeaderCase(
+        "Header with empty lines after",
+        """## Chapter 1
 
 
 Content after empty lines.""",
-            "expected_headers": 1  # Should remove duplicate and empty lines
-        }
-    ]
-    
-    base_content = """# Main Document
+        1  # Should remove duplicate and empty lines
+    ),
+)
+
+BASE_CONTENT = """# Main Document
 
 ## Chapter 1
 
@@ -75,65 +89,51 @@ Original content here.
 
 Content for chapter 2.
 """
-    
+
+@pytest.mark.parametrize("test_case", HEADER_CASES, ids=[case.name for case in HEADER_CASES])
+def test_comprehensive_header_fix(test_case):
+    """Test one edge case for header duplication fix."""
+    editor = make_editor(BASE_CONTENT)
+    chapter1 = editor.get_section_by_title(CHAPTER1_TITLE)
+    assert chapter1 is not None, "Chapter 1 not found"
+    
+    # Update with test content
+    result = editor.update_section_content(chapter1, test_case.content)
+    assert result.success, [str(error) for error in result.errors]
+    
+    # Count headers from the parsed sections, catching extra spacing and
+    # wrong-level variants too
+    header_count = sum(1 for section in editor.get_sections()
+                       if section.level >= 2 and 'Chapter 1' in section.title)
+    assert header_count == test_case.expected_headers, (
+        f"Expected headers: {test_case.expected_headers}, Found: {header_count}\n"
+        f"Updated content:\n{editor.to_markdown()}"
+    )
+
+def run_header_cases():
+    """Run every header case outside pytest, reporting each outcome with one write."""
     all_passed = True
-    
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n=== Test {i}: {test_case['name']} ===")
-        
-        # Create fresh editor for each test
-        editor = SafeMarkdownEditor(base_content, ValidationLevel.NORMAL)
-        sections = editor.get_sections()
-        
-        # Find Chapter 1
-        chapter1 = None
-        for section in sections:
-            if section.title == "Chapter 1":
-                chapter1 = section
-                break
-        
-        if not chapter1:
-            print("❌ Chapter 1 not found")
-            all_passed = False
-            continue
-        
-        # Update with test content
-        result = editor.update_section_content(chapter1, test_case["content"])
-        
-        if not result.success:
-            print("❌ Update failed")
-            for error in result.errors:
-                print(f"  Error: {error}")
+    out = []
+    for i, test_case in enumerate(HEADER_CASES, 1):
+        out.append(f"\n=== Test {i}: {test_case.name} ===")
+        try:
+            test_comprehensive_header_fix(test_case)
+        except AssertionError as error:
+            out.append(f"{FAIL} Test failed")
+            out.append(str(error))
+            out.append("-" * 50)
             all_passed = False
-            continue
-        
-        # Check result
-        updated_content = editor.to_markdown()
-        
-        # Count headers more accurately using regex to catch all variants
-        header_pattern = r'^##.*Chapter 1.*$'
-        header_matches = re.findall(header_pattern, updated_content, re.MULTILINE)
-        header_count = len(header_matches)
-        
-        print(f"Expected headers: {test_case['expected_headers']}, Found: {header_count}")
-        
-        if header_count == test_case["expected_headers"]:
-            print("✅ Test passed")
         else:
-            print("❌ Test failed")
-            print("Updated content:")
-            print(updated_content)
-            print("-" * 50)
-            all_passed = False
+            out.append(f"{OK} Test passed")
+    
+    sys.stdout.write("\n".join(out) + "\n")
     
     return all_passed
 
-def test_mcp_server_fix():
+def test_mcp_server_fix(mcp_server):
     """Test the fix through MCP server interface."""
-    from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
-    
-    # Create test document
-    test_content = """# Test Document
+    # Keep the test document in memory; the stateless tools read and write it in place
+    document = StringIO("""# Test Document
 
 ## Introduction
 
@@ -142,40 +142,27 @@ Original intro content.
 ## Chapter 1
 
 Original chapter 1 content.
-"""
-    
-    # Write test document
-    with open('test_mcp_fix.md', 'w') as f:
-        f.write(test_content)
+""")
     
     print("\n" + "=" * 60)
     print("=== MCP Server Test ===")
     print("=" * 60)
     
-    server = MarkdownMCPServer()
-    
     # Get document sections (using the fixed MCP implementation)
-    get_doc_result = server.call_tool_sync("get_document", {
-        "document_path": "test_mcp_fix.md"
+    get_doc_result = mcp_server.call_tool_sync("get_document", {
+        "document_path": document
     })
     
-    if not get_doc_result.get("success"):
-        print("❌ Failed to get document")
-        return False
+    assert get_doc_result.get("success"), "Failed to get document"
     
     sections = get_doc_result.get("sections", [])
     print(f"Found {len(sections)} sections")
     
     # Find Chapter 1
-    chapter1_id = None
-    for section in sections:
-        if section['title'] == 'Chapter 1':
-            chapter1_id = section['id']
-            break
+    sections_by_title = {section['title']: section for section in sections}
+    chapter1_id = sections_by_title.get('Chapter 1', {}).get('id')
     
-    if not chapter1_id:
-        print("❌ Chapter 1 not found")
-        return False
+    assert chapter1_id, "Chapter 1 not found"
     
     # Test update with duplicate header
     update_content = """## Chapter 1
@@ -183,50 +170,41 @@ Original chapter 1 content.
 This content includes the header and should not cause duplication.
 Testing through MCP server interface."""
     
-    update_result = server.call_tool_sync("update_section", {
-        "document_path": "test_mcp_fix.md",
+    update_result = mcp_server.call_tool_sync("update_section", {
+        "document_path": document,
         "section_id": chapter1_id,
         "content": update_content
     })
     
-    if not update_result.get("success"):
-        print("❌ Update failed")
-        print(update_result)
-        return False
+    assert update_result.get("success"), f"Update failed: {update_result}"
     
     # Check result
-    with open('test_mcp_fix.md', 'r') as f:
-        updated_content = f.read()
+    updated_content = document.getvalue()
     
     header_count = updated_content.count("## Chapter 1")
     print(f"Header count after MCP update: {header_count}")
     
-    # Cleanup
-    import os
-    try:
-        os.remove('test_mcp_fix.md')
-    except:
-        pass
-    
-    if header_count == 1:
-        print("✅ MCP server test passed")
-        return True
-    else:
-        print("❌ MCP server test failed")
-        print("Updated content:")
-        print(updated_content)
-        return False
+    assert header_count == 1, f"Updated content:\n{updated_content}"
+    print(f"{OK} MCP server test passed")
 
 if __name__ == "__main__":
+    from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
+    from profiling import run_profiled
+    
     print("Running comprehensive header duplication tests...")
     
-    direct_tests_passed = test_comprehensive_header_fix()
-    mcp_tests_passed = test_mcp_server_fix()
+    direct_tests_passed = run_profiled(run_header_cases, "test_comprehensive_header_fix")
+    try:
+        test_mcp_server_fix(MarkdownMCPServer())
+        mcp_tests_passed = True
+    except AssertionError as error:
+        print(f"{FAIL} MCP server test failed: {error}")
+        mcp_tests_passed = False
     
     if direct_tests_passed and mcp_tests_passed:
-        print("\n🎉 ALL TESTS PASSED! Header duplication issue is fixed.")
+        print(f"\n{DONE} ALL TESTS PASSED! Header duplication issue is fixed.")
     else:
-        print("\n❌ Some tests failed. Fix needs more work.")
+        print(f"\n{FAIL} Some tests failed. Fix needs more work.")
         if not direct_tests_passed:
             print("  - Direct editor tests failed")
         if not mcp_tests_passed:
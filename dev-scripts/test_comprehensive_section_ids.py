@@ -7,11 +7,9 @@ across all MCP operations and handles various edge cases properly.
 """
 
 import sys
-sys.path.insert(0, 'src')
+from io import StringIO
 
 from quantalogic_markdown_mcp.safe_editor import SafeMarkdownEditor
-from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
-import os
 
 
 def test_basic_id_generation():
@@ -126,12 +124,11 @@ Unicode test.
     print("✅ Edge cases handled correctly")
 
 
-def test_mcp_server_functionality():
+def test_mcp_server_functionality(mcp_server):
     """Test MCP server operations with new IDs."""
     print("🧪 Testing MCP server functionality...")
     
-    test_file = 'test_comprehensive.md'
-    test_content = '''# Project Documentation
+    document = StringIO('''# Project Documentation
 
 ## Overview
 Project overview section.
@@ -144,105 +141,87 @@ Usage instructions.
 
 ## Overview
 Duplicate overview section.
-'''
-    
-    # Write test file
-    with open(test_file, 'w') as f:
-        f.write(test_content)
+''')
     
-    try:
-        server = MarkdownMCPServer()
-        
-        # Test list_sections
-        result = server.call_tool_sync('list_sections', {'document_path': test_file})
-        assert result.get('success'), f"list_sections failed: {result}"
-        
-        sections = result.get('sections', [])
-        assert len(sections) == 5, f"Expected 5 sections, got {len(sections)}"
-        
-        # Verify human-readable IDs
-        ids = [s['id'] for s in sections]
-        expected_ids = ['project-documentation', 'overview', 'installation', 'usage', 'project-documentation-overview']
-        assert ids == expected_ids, f"Expected {expected_ids}, got {ids}"
-        
-        # Test get_section with human-readable ID
-        result = server.call_tool_sync('get_section', {
-            'document_path': test_file,
-            'section_id': 'installation'
-        })
-        assert result.get('success'), f"get_section failed: {result}"
-        
-        section = result.get('section', {})
-        assert section.get('id') == 'installation', f"Wrong section returned: {section}"
-        assert section.get('title') == 'Installation', f"Wrong title: {section}"
-        
-        # Test update_section with human-readable ID
-        result = server.call_tool_sync('update_section', {
-            'document_path': test_file,
+    # Run list_sections, get_section and update_section against one parse of the document
+    batch = mcp_server.call_tools_sync(document, [
+        ('list_sections', {}),
+        ('get_section', {'section_id': 'installation'}),
+        ('update_section', {
             'section_id': 'usage',
             'content': '''## Usage
 
 This is the UPDATED usage section with new content!
 '''
-        })
-        assert result.get('success'), f"update_section failed: {result}"
-        
-        # Verify the update
-        with open(test_file, 'r') as f:
-            updated_content = f.read()
-        
-        assert 'UPDATED usage section' in updated_content, "Update not applied correctly"
-        
-        print("✅ MCP server functionality works correctly")
-        
-    finally:
-        # Clean up
-        if os.path.exists(test_file):
-            os.remove(test_file)
+        }),
+    ])
+    list_result, get_result, update_result = batch['results']
+    
+    # Test list_sections
+    assert list_result.get('success'), f"list_sections failed: {list_result}"
+    
+    sections = list_result.get('sections', [])
+    assert len(sections) == 5, f"Expected 5 sections, got {len(sections)}"
+    
+    # Verify human-readable IDs
+    ids = [s['id'] for s in sections]
+    expected_ids = ['project-documentation', 'overview', 'installation', 'usage', 'project-documentation-overview']
+    assert ids == expected_ids, f"Expected {expected_ids}, got {ids}"
+    
+    # Test get_section with human-readable ID
+    assert get_result.get('success'), f"get_section failed: {get_result}"
+    
+    section = get_result.get('section', {})
+    assert section.get('id') == 'installation', f"Wrong section returned: {section}"
+    assert section.get('title') == 'Installation', f"Wrong title: {section}"
+    
+    # Test update_section with human-readable ID
+    assert update_result.get('success'), f"update_section failed: {update_result}"
+    assert batch['saved'], "Batch changes were not saved"
+    
+    # Verify the update
+    updated_content = document.getvalue()
+    
+    assert 'UPDATED usage section' in updated_content, "Update not applied correctly"
+    
+    print("✅ MCP server functionality works correctly")
 
 
-def test_section_operations():
+def test_section_operations(mcp_server):
     """Test section insert, delete, and move operations."""
     print("🧪 Testing section operations...")
     
-    test_file = 'test_operations.md'
-    test_content = '''# Document
+    document = StringIO('''# Document
 
 ## Section A
 Content A.
 
 ## Section B
 Content B.
-'''
+''')
     
-    with open(test_file, 'w') as f:
-        f.write(test_content)
-    
-    try:
-        server = MarkdownMCPServer()
-        
-        # Test insert_section
-        result = server.call_tool_sync('insert_section', {
-            'document_path': test_file,
+    # Insert and list in one batch, so the document is parsed once
+    batch = mcp_server.call_tools_sync(document, [
+        ('insert_section', {
             'heading': 'New Section',
             'content': 'New section content.',
             'position': 2
-        })
-        assert result.get('success'), f"insert_section failed: {result}"
-        
-        # Verify the section was inserted with a human-readable ID
-        result = server.call_tool_sync('list_sections', {'document_path': test_file})
-        sections = result.get('sections', [])
-        
-        new_section_ids = [s['id'] for s in sections if s['title'] == 'New Section']
-        assert len(new_section_ids) == 1, f"New section not found: {sections}"
-        assert new_section_ids[0] == 'new-section', f"Wrong ID for new section: {new_section_ids[0]}"
-        
-        print("✅ Section operations work correctly")
-        
-    finally:
-        if os.path.exists(test_file):
-            os.remove(test_file)
+        }),
+        ('list_sections', {}),
+    ])
+    insert_result, list_result = batch['results']
+    
+    # Test insert_section
+    assert insert_result.get('success'), f"insert_section failed: {insert_result}"
+    
+    # Verify the section was inserted with a human-readable ID
+    sections = list_result.get('sections', [])
+    
+    new_section_ids = [s['id'] for s in sections if s['title'] == 'New Section']
+    assert len(new_section_ids) == 1, f"New section not found: {sections}"
+    assert new_section_ids[0] == 'new-section', f"Wrong ID for new section: {new_section_ids[0]}"
+    
+    print("✅ Section operations work correctly")
 
 
 def run_all_tests():
@@ -253,8 +232,12 @@ def run_all_tests():
         test_basic_id_generation()
         test_duplicate_handling()
         test_edge_cases()
-        test_mcp_server_functionality()
-        test_section_operations()
+        
+        # Share one server between the MCP checks, as the pytest fixture does
+        from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
+        mcp_server = MarkdownMCPServer()
+        test_mcp_server_functionality(mcp_server)
+        test_section_operations(mcp_server)
         
         print("\n🎉 All tests passed! The new section ID system is working perfectly!")
         return True
@@ -267,5 +250,7 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    success = run_all_tests()
+    from profiling import run_profiled
+    
+    success = run_profiled(run_all_tests, "test_comprehensive_section_ids")
     sys.exit(0 if success else 1)
@@ -3,7 +3,6 @@
 
 import tempfile
 from pathlib import Path
-from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
 
 def main():
     print("🔧 Starting stateless server test...")
@@ -29,6 +28,7 @@ End of document.
     try:
         # Initialize the server
         print("🚀 Initializing MCP server...")
+        from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
         server = MarkdownMCPServer()
         print("✅ Server initialized successfully!")
         
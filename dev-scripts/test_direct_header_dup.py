@@ -2,11 +2,13 @@
 """Direct test of the header duplication issue."""
 
 import sys
-sys.path.insert(0, 'src')
 
 from quantalogic_markdown_mcp.safe_editor import SafeMarkdownEditor
 from quantalogic_markdown_mcp.safe_editor_types import ValidationLevel
 
+# Interned like the editor's section titles, so lookups compare by identity
+CHAPTER1_TITLE = sys.intern("Chapter 1")
+
 def test_direct_header_duplication():
     """Test header duplication directly with the editor."""
     
@@ -36,11 +38,7 @@ Content for chapter 2.
         print(f"  {section.title} (level {section.level}, lines {section.line_start}-{section.line_end})")
     
     # Find Chapter 1
-    chapter1 = None
-    for section in sections:
-        if section.title == "Chapter 1":
-            chapter1 = section
-            break
+    chapter1 = editor.get_section_by_title(CHAPTER1_TITLE)
     
     if not chapter1:
         print("❌ Chapter 1 not found")
@@ -90,12 +88,7 @@ This might cause duplication."""
     
     # Reset for test 2
     editor = SafeMarkdownEditor(test_content, ValidationLevel.NORMAL)
-    sections = editor.get_sections()
-    chapter1 = None
-    for section in sections:
-        if section.title == "Chapter 1":
-            chapter1 = section
-            break
+    chapter1 = editor.get_section_by_title(CHAPTER1_TITLE)
     
     # Test case 2: Update with content WITHOUT header (should be correct)
     print(f"\n=== Test 2: Update without header in content ===")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""pytest-benchmark measurements for the main MCP tool paths.
+
+Run with ``pytest dev-scripts/test_mcp_benchmark.py --benchmark-autosave`` to
+store a baseline under ``.benchmarks/``, then compare later runs against it
+with ``--benchmark-compare --benchmark-compare-fail=mean:10%``.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+SECTION_COUNT = 100
+
+BASE_DOCUMENT = """# Performance Test Document
+
+Base content.
+"""
+
+def build_document(section_count):
+    """Return the base document followed by section_count level 2 sections."""
+    sections = [
+        f"## Performance Test Section {i}\n\nContent for performance test section {i}\n"
+        for i in range(section_count)
+    ]
+    return "\n".join([BASE_DOCUMENT, *sections])
+
+@pytest.fixture
+def sectioned_document(tmp_path):
+    """A document on disk with SECTION_COUNT sections to read back."""
+    document_path = tmp_path / "sections.md"
+    document_path.write_text(build_document(SECTION_COUNT))
+    return document_path
+
+def test_bench_insert(benchmark, mcp_server, tmp_path):
+    """Insert SECTION_COUNT sections one call at a time into a fresh document."""
+    document_path = tmp_path / "insert.md"
+    
+    def reset_document():
+        # Each round starts from the same small document
+        document_path.write_text(BASE_DOCUMENT)
+        return (), {}
+    
+    # Build the tool arguments before timing, so rounds measure only the inserts
+    payloads = [
+        {
+            "document_path": str(document_path),
+            "heading": f"Performance Test Section {i}",
+            "content": f"Content for performance test section {i}",
+            "backup": False
+        }
+        for i in range(SECTION_COUNT)
+    ]
+    
+    def insert_sections():
+        for arguments in payloads:
+            result = mcp_server.call_tool_sync("insert_section", arguments)
+            assert result["success"], result
+    
+    benchmark.pedantic(insert_sections, setup=reset_document, rounds=10, warmup_rounds=2)
+    
+    assert document_path.read_text().count("# Performance Test Section") == SECTION_COUNT
+
+def test_bench_read(benchmark, mcp_server, sectioned_document):
+    """Read every section of the document back with get_section."""
+    listed = mcp_server.call_tool_sync("list_sections", {"document_path": str(sectioned_document)})
+    section_ids = [section["id"] for section in listed["sections"]]
+    payloads = [
+        {"document_path": str(sectioned_document), "section_id": section_id}
+        for section_id in section_ids
+    ]
+    
+    def read_sections():
+        for arguments in payloads:
+            mcp_server.call_tool_sync("get_section", arguments)
+    
+    benchmark(read_sections)
+    
+    assert len(section_ids) == SECTION_COUNT + 1
+
+def test_bench_doc(benchmark, mcp_server, sectioned_document):
+    """Fetch the whole document with get_document."""
+    result = benchmark(mcp_server.call_tool_sync, "get_document", {"document_path": str(sectioned_document)})
+    
+    assert result["success"]
+    assert len(result["sections"]) == SECTION_COUNT + 1
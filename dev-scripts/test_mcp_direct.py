@@ -2,11 +2,6 @@
 """
 Test MCP Server Direct Functionality
 """
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
 
@@ -1,16 +1,24 @@
 #!/usr/bin/env python3
 """Test script to reproduce header duplication through MCP tools."""
 
-import sys
-sys.path.insert(0, 'src')
+import re
+import tempfile
+from pathlib import Path
 
-from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
+import pytest
 
-def test_mcp_header_duplication():
-    """Test header duplication through MCP tools."""
-    
-    # Create test document
-    test_content = """# Test Document
+# The cases use the session mcp_server fixture; with `pytest -n auto
+# --dist loadgroup` keep them on one worker so it is built only once there
+pytestmark = pytest.mark.xdist_group("mcp_duplication")
+
+# Heading lines mentioning Chapter 1, matched without splitting the document
+CHAPTER1_HEADER_RE = re.compile(r'^[ \t]*#.*Chapter 1.*$', re.MULTILINE)
+
+# (name, initial document, Chapter 1 update, expected Chapter 1 headers afterwards)
+DUPLICATION_CASES = [
+    (
+        "full document",
+        """# Test Document
 
 This is a test document.
 
@@ -27,185 +35,99 @@ Some more text in chapter 1.
 ## Chapter 2
 
 This is chapter 2.
-"""
-    
-    # Write test document
-    with open('test_mcp_duplication.md', 'w') as f:
-        f.write(test_content)
-    
-    print("=== Original Document ===")
-    print(test_content)
-    print("=" * 50)
-    
-    # Initialize MCP server
-    server = MarkdownMCPServer()
-    
-    # List sections to get section IDs
-    list_result = server.call_tool_sync("list_sections", {
-        "document_path": "test_mcp_duplication.md"
-    })
-    
-    if not list_result.get("success"):
-        print("❌ Failed to list sections")
-        print(list_result)
-        return
-    
-    sections = list_result.get("metadata", {}).get("sections", [])
-    print(f"Found {len(sections)} sections:")
-    for section in sections:
-        print(f"  ID: {section['id']}, Title: {section['title']}, Level: {section['level']}")
-    
-    # Find Chapter 1 section
-    chapter1_section = None
-    for section in sections:
-        if section['title'] == 'Chapter 1':
-            chapter1_section = section
-            break
-    
-    if not chapter1_section:
-        print("❌ Chapter 1 not found")
-        return
-    
-    print(f"\n=== Updating Chapter 1 via MCP ===")
-    print(f"Section ID: {chapter1_section['id']}")
-    print(f"Title: {chapter1_section['title']}")
-    
-    # Update using MCP tool
-    new_content = """## Chapter 1
+""",
+        """## Chapter 1
 
 This is completely new content for Chapter 1.
 Updated through MCP server.
-Let's see what happens to the header."""
-    
-    update_result = server.call_tool_sync("update_section", {
-        "document_path": "test_mcp_duplication.md",
-        "section_id": chapter1_section['id'],
-        "content": new_content
-    })
-    
-    print(f"Update result: {update_result}")
-    
-    if update_result.get("success"):
-        print("✅ Update successful")
-        
-        # Read the updated document
-        with open('test_mcp_duplication.md', 'r') as f:
-            updated_content = f.read()
-        
-        print("\n=== Updated Document ===")
-        print(updated_content)
-        print("=" * 50)
-        
-        # Check for header duplication
-        lines = updated_content.split('\n')
-        chapter1_lines = []
-        for i, line in enumerate(lines):
-            if 'Chapter 1' in line and line.strip().startswith('#'):
-                chapter1_lines.append((i, line))
-        
-        print(f"\nHeader lines containing 'Chapter 1': {len(chapter1_lines)}")
-        for line_num, line in chapter1_lines:
-            print(f"  Line {line_num}: {line}")
-            
-        if len(chapter1_lines) > 1:
-            print("🔴 ISSUE DETECTED: Header duplication found!")
-            return True
-        else:
-            print("✅ No header duplication detected")
-            return False
-    else:
-        print("❌ Update failed")
-        for error in update_result.get("errors", []):
-            print(f"  Error: {error}")
-        return False
-
-def test_with_header_in_content():
-    """Test specifically with header included in the content."""
-    
-    # Create test document
-    test_content = """# Test Document
+Let's see what happens to the header.""",
+        1,
+    ),
+    (
+        "header in content",
+        """# Test Document
 
 ## Chapter 1
 
 Original content here.
-"""
-    
-    # Write test document
-    with open('test_header_in_content.md', 'w') as f:
-        f.write(test_content)
-    
-    print("\n" + "=" * 60)
-    print("=== Test 2: Header in Content ===")
-    print("=" * 60)
-    print(test_content)
-    
-    server = MarkdownMCPServer()
-    
-    # List sections
-    list_result = server.call_tool_sync("list_sections", {
-        "document_path": "test_header_in_content.md"
+""",
+        """## Chapter 1
+
+This new content includes the header.
+This might cause duplication!""",
+        1,
+    ),
+]
+
+def update_chapter1(mcp_server, document_path, initial, update):
+    """Write initial to document_path, replace Chapter 1 with update, and return its heading lines."""
+    # tmp_path is unique per test, so parallel workers never share the file
+    document_path.write_text(initial)
+    
+    list_result = mcp_server.call_tool_sync("list_sections", {
+        "document_path": str(document_path)
     })
-    
-    sections = list_result.get("metadata", {}).get("sections", [])
-    chapter1_section = None
-    for section in sections:
-        if section['title'] == 'Chapter 1':
-            chapter1_section = section
-            break
-    
+    sections = list_result.get("sections", [])
+    chapter1_section = next((section for section in sections if section['title'] == 'Chapter 1'), None)
     if not chapter1_section:
         print("❌ Chapter 1 not found")
-        return False
-    
-    # Update with content that includes a header - this might cause duplication
-    new_content_with_header = """## Chapter 1
-
-This new content includes the header.
-This might cause duplication!"""
+        return None
     
-    print(f"Updating with content that includes header:\n{new_content_with_header}")
-    
-    update_result = server.call_tool_sync("update_section", {
-        "document_path": "test_header_in_content.md", 
+    update_result = mcp_server.call_tool_sync("update_section", {
+        "document_path": str(document_path),
         "section_id": chapter1_section['id'],
-        "content": new_content_with_header
+        "content": update
     })
+    if not update_result.get("success"):
+        print(f"❌ Update failed: {update_result}")
+        return None
+    
+    updated_content = document_path.read_text()
+    print("\n=== Updated Document ===")
+    print(updated_content)
+    print("=" * 50)
+    
+    return [(updated_content.count('\n', 0, match.start()), match.group())
+            for match in CHAPTER1_HEADER_RE.finditer(updated_content)]
+
+@pytest.mark.parametrize(
+    "initial,update,expected_headers",
+    [case[1:] for case in DUPLICATION_CASES],
+    ids=[case[0] for case in DUPLICATION_CASES],
+)
+def test_header_duplication(mcp_server, tmp_path, initial, update, expected_headers):
+    """Updating Chapter 1 with content that repeats its header must not duplicate it."""
+    chapter1_lines = update_chapter1(mcp_server, tmp_path / "doc.md", initial, update)
+    
+    assert chapter1_lines is not None
+    assert len(chapter1_lines) == expected_headers, chapter1_lines
+
+if __name__ == "__main__":
+    from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
     
-    if update_result.get("success"):
-        with open('test_header_in_content.md', 'r') as f:
-            updated_content = f.read()
+    server = MarkdownMCPServer()
+    issue_found = False
+    for name, initial, update, expected_headers in DUPLICATION_CASES:
+        print(f"\n=== {name} ===")
+        # Each case gets its own scratch directory, removed on exit
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            chapter1_lines = update_chapter1(server, Path(scratch_dir) / "doc.md", initial, update)
         
-        print("\n=== Updated Document ===")
-        print(updated_content)
-        print("=" * 50)
+        if chapter1_lines is None:
+            issue_found = True
+            continue
         
-        # Check for duplication
-        chapter1_count = updated_content.count('## Chapter 1')
-        print(f"Number of '## Chapter 1' headers: {chapter1_count}")
+        print(f"Header lines containing 'Chapter 1': {len(chapter1_lines)}")
+        for line_num, line in chapter1_lines:
+            print(f"  Line {line_num}: {line}")
         
-        if chapter1_count > 1:
+        if len(chapter1_lines) != expected_headers:
             print("🔴 ISSUE DETECTED: Header duplication found!")
-            return True
+            issue_found = True
         else:
             print("✅ No header duplication detected")
-            return False
-    else:
-        print("❌ Update failed")
-        return False
-
-if __name__ == "__main__":
-    issue1 = test_mcp_header_duplication()
-    issue2 = test_with_header_in_content()
     
-    if issue1 or issue2:
+    if issue_found:
         print("\n🔴 HEADER DUPLICATION ISSUE FOUND!")
     else:
         print("\n✅ No header duplication issues detected")
-        
-    # Cleanup
-    import os
-    try:
-        os.remove('test_mcp_duplication.md')
-        os.remove('test_header_in_content.md')
-    except:
-        pass
@@ -2,19 +2,13 @@
 Basic test for SafeMarkdownEditor functionality.
 """
 
-import sys
-import os
+from quantalogic_markdown_mcp import EditOperation
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from editor_cache import make_editor
+from reporting import format_errors
 
-from quantalogic_markdown_mcp import SafeMarkdownEditor, EditOperation
-
-def test_basic_functionality():
-    """Test basic SafeMarkdownEditor functionality."""
-    
-    # Test markdown content
-    markdown_text = """# Introduction
+# Sample document; make_editor parses it once and hands out copies
+MARKDOWN_TEXT = """# Introduction
 
 This is the introduction section.
 
@@ -30,12 +24,15 @@ Advanced content here.
 
 More details.
 """
+
+def test_basic_functionality():
+    """Test basic SafeMarkdownEditor functionality."""
     
     print("=== Testing SafeMarkdownEditor ===")
     
     # Create editor
     try:
-        editor = SafeMarkdownEditor(markdown_text)
+        editor = make_editor(MARKDOWN_TEXT)
         print("✓ SafeMarkdownEditor created successfully")
     except Exception as e:
         print(f"✗ Failed to create SafeMarkdownEditor: {e}")
@@ -68,13 +65,15 @@ More details.
             preview_result = editor.preview_operation(
                 EditOperation.UPDATE_SECTION,
                 section_ref=sections[0],
-                content="This is updated introduction content with **bold** text."
+                content="This is updated introduction content with **bold** text.",
+                scope="section"
             )
             print(f"✓ Preview operation: {'Success' if preview_result.success else 'Failed'}")
             if preview_result.success:
-                print("  Preview generated successfully")
+                # Only the edited section is rebuilt and returned
+                print(f"  Preview generated successfully ({len(preview_result.preview)} characters)")
             else:
-                print(f"  Errors: {[str(e) for e in preview_result.errors]}")
+                print(f"  Errors: {format_errors(preview_result.errors)}")
         except Exception as e:
             print(f"✗ Failed to preview operation: {e}")
             return
@@ -92,7 +91,7 @@ More details.
                 print("  Final document:")
                 print(editor.to_markdown()[:200] + "...")
             else:
-                print(f"  Errors: {[str(e) for e in update_result.errors]}")
+                print(f"  Errors: {format_errors(update_result.errors)}")
         except Exception as e:
             print(f"✗ Failed to update section: {e}")
             return
@@ -3,20 +3,16 @@ Test the new section operations: delete_section, move_section, change_heading_le
 """
 
 import sys
-import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from quantalogic_markdown_mcp import ValidationLevel
 
-from quantalogic_markdown_mcp import SafeMarkdownEditor, ValidationLevel
+from editor_cache import make_editor
 
-def test_new_section_operations():
-    """Test the newly implemented section operations."""
-    
-    print("=== Testing New Section Operations ===\n")
-    
-    # Test markdown with multiple sections
-    markdown_text = """# Main Document
+# Indentation per heading level (1-6), built once rather than per line
+INDENTS = tuple("  " * depth for depth in range(6))
+
+# Test markdown with multiple sections, shared with make_editor's parse cache
+MARKDOWN_TEXT = """# Main Document
 
 This is the main document content.
 
@@ -40,19 +36,22 @@ Content for section B.
 
 Content for section C.
 """
+
+def test_new_section_operations():
+    """Test the newly implemented section operations."""
+    
+    print("=== Testing New Section Operations ===\n")
+    
+    editor = make_editor(MARKDOWN_TEXT, ValidationLevel.NORMAL)
     
-    editor = SafeMarkdownEditor(markdown_text, ValidationLevel.NORMAL)
+    # Sections are looked up through the editor's title index, which is
+    # rebuilt once per edit, instead of re-listing and scanning every section
     
     # Test 1: Change heading level
     print("1. Testing change_heading_level")
-    sections = editor.get_sections()
     
     # Find "Section B" (should be level 2)
-    section_b = None
-    for section in sections:
-        if section.title == "Section B":
-            section_b = section
-            break
+    section_b = editor.get_section_by_title("Section B")
     
     if section_b:
         print(f"   Found 'Section B' at level {section_b.level}")
@@ -66,23 +65,16 @@ Content for section C.
                 print(f"     Error: {error.message}")
         
         # Verify the change
-        updated_sections = editor.get_sections()
-        for section in updated_sections:
-            if section.title == "Section B":
-                print(f"   New level for 'Section B': {section.level}")
-                break
+        updated_section_b = editor.get_section_by_title("Section B")
+        if updated_section_b:
+            print(f"   New level for 'Section B': {updated_section_b.level}")
     
     # Test 2: Delete section
     print("\n2. Testing delete_section")
-    current_sections = editor.get_sections()
-    print(f"   Sections before deletion: {len(current_sections)}")
+    print(f"   Sections before deletion: {len(editor.get_sections())}")
     
     # Find "Subsection A1" to delete
-    subsection_a1 = None
-    for section in current_sections:
-        if section.title == "Subsection A1":
-            subsection_a1 = section
-            break
+    subsection_a1 = editor.get_section_by_title("Subsection A1")
     
     if subsection_a1:
         result = editor.delete_section(subsection_a1)
@@ -93,25 +85,18 @@ Content for section C.
                 print(f"     Error: {error.message}")
         
         # Verify deletion
-        updated_sections = editor.get_sections()
-        print(f"   Sections after deletion: {len(updated_sections)}")
+        print(f"   Sections after deletion: {len(editor.get_sections())}")
         
         # Check if subsection A1 is gone
-        a1_still_exists = any(s.title == "Subsection A1" for s in updated_sections)
+        a1_still_exists = editor.get_section_by_title("Subsection A1") is not None
         print(f"   'Subsection A1' still exists: {a1_still_exists}")
     
     # Test 3: Move section (simplified implementation)
     print("\n3. Testing move_section")
-    current_sections = editor.get_sections()
     
     # Find "Section C" and "Section A"
-    section_c = None
-    section_a = None
-    for section in current_sections:
-        if section.title == "Section C":
-            section_c = section
-        elif section.title == "Section A":
-            section_a = section
+    section_c = editor.get_section_by_title("Section C")
+    section_a = editor.get_section_by_title("Section A")
     
     if section_c and section_a:
         result = editor.move_section(section_c, section_a, "before")
@@ -126,9 +111,9 @@ Content for section C.
     final_sections = editor.get_sections()
     print(f"   Total sections: {len(final_sections)}")
     
-    for section in final_sections:
-        indent = "  " * (section.level - 1)
-        print(f"     {indent}- {section.title} (L{section.level})")
+    # Emit the structure with a single write
+    sys.stdout.write("".join(f"     {INDENTS[section.level - 1]}- {section.title} (L{section.level})\n"
+                             for section in final_sections))
     
     # Test 5: Show final document content
     print("\n5. Final Document Content")
@@ -142,10 +127,14 @@ Content for section C.
     history = editor.get_transaction_history()
     print(f"   Total transactions: {len(history)}")
     
+    # Collect every transaction and operation line, then emit them with one write
+    lines = []
     for i, txn in enumerate(history):
-        print(f"   Transaction {i+1}: {txn.transaction_id} ({len(txn.operations)} operations)")
-        for op in txn.operations:
-            print(f"     - {op['operation'].value} on section {op.get('section_id', 'N/A')}")
+        lines.append(f"   Transaction {i+1}: {txn.transaction_id} ({len(txn.operations)} operations)")
+        lines.extend(f"     - {op['operation'].value} on section {op.get('section_id', 'N/A')}"
+                     for op in txn.operations)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
     
     print("\n=== New Section Operations Test Complete ===")
 
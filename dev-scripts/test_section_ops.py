@@ -3,18 +3,14 @@ Extended test for SafeMarkdownEditor functionality including section insertion.
 """
 
 import sys
-import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from quantalogic_markdown_mcp import EditOperation
 
-from quantalogic_markdown_mcp import SafeMarkdownEditor, EditOperation
+from editor_cache import make_editor
+from reporting import format_errors
 
-def test_section_operations():
-    """Test section insertion and other operations."""
-    
-    # Test markdown content
-    markdown_text = """# Introduction
+# Sample document; every make_editor call with this text reuses the same parse
+MARKDOWN_TEXT = """# Introduction
 
 This is the introduction section.
 
@@ -26,12 +22,15 @@ Here's how to get started.
 
 Advanced content here.
 """
+
+def test_section_operations():
+    """Test section insertion and other operations."""
     
     print("=== Testing SafeMarkdownEditor Section Operations ===")
     
     # Create editor
     try:
-        editor = SafeMarkdownEditor(markdown_text)
+        editor = make_editor(MARKDOWN_TEXT)
         print("✓ SafeMarkdownEditor created successfully")
     except Exception as e:
         print(f"✗ Failed to create SafeMarkdownEditor: {e}")
@@ -40,8 +39,8 @@ Advanced content here.
     # Get initial sections
     sections = editor.get_sections()
     print(f"✓ Initial sections: {len(sections)}")
-    for i, section in enumerate(sections):
-        print(f"  {i}: {section.title} (Level {section.level})")
+    sys.stdout.write("".join(f"  {i}: {section.title} (Level {section.level})\n"
+                             for i, section in enumerate(sections)))
     
     # Test section insertion
     try:
@@ -59,7 +58,7 @@ Advanced content here.
             print(f"  New section added at level {insert_result.metadata.get('final_level', 'unknown')}")
             print(f"  Transaction ID: {insert_result.metadata.get('transaction_id', 'none')}")
         else:
-            print(f"  Errors: {[str(e) for e in insert_result.errors]}")
+            print(f"  Errors: {format_errors(insert_result.errors)}")
     except Exception as e:
         print(f"✗ Failed to insert section: {e}")
         return
@@ -67,17 +66,13 @@ Advanced content here.
     # Show updated sections
     updated_sections = editor.get_sections()
     print(f"✓ Updated sections: {len(updated_sections)}")
-    for i, section in enumerate(updated_sections):
-        print(f"  {i}: {section.title} (Level {section.level}, Lines {section.line_start}-{section.line_end})")
+    sys.stdout.write("".join(f"  {i}: {section.title} (Level {section.level}, Lines {section.line_start}-{section.line_end})\n"
+                             for i, section in enumerate(updated_sections)))
     
     # Test update of the new section
     try:
-        # Find the Configuration section
-        config_section = None
-        for section in updated_sections:
-            if section.title == "Configuration":
-                config_section = section
-                break
+        # Find the Configuration section through the editor's title index
+        config_section = editor.get_section_by_title("Configuration")
         
         if config_section:
             update_result = editor.update_section_content(
@@ -92,8 +87,8 @@ Advanced content here.
     
     # Show final document
     print("\n=== Final Document ===")
-    final_doc = editor.to_markdown()
-    print(final_doc)
+    # to_markdown() returns the editor's stored text; write it as is
+    sys.stdout.write(editor.to_markdown())
     
     # Show statistics
     stats = editor.get_statistics()
@@ -7,9 +7,6 @@ from pathlib import Path
 
 print("🔧 Starting test script...")
 
-# Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
 
 def test_stateless_server():
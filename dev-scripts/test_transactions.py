@@ -2,14 +2,10 @@
 Test transaction and rollback functionality for SafeMarkdownEditor.
 """
 
-import sys
-import os
-
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from quantalogic_markdown_mcp import SafeMarkdownEditor
 
+from reporting import format_errors
+
 def test_transaction_rollback():
     """Test transaction history and rollback functionality."""
     
@@ -67,7 +63,7 @@ Here's how to get started.
     )
     print(f"Insert: {'Success' if result2.success else 'Failed'}")
     if result2.errors:
-        print(f"Insert errors: {[str(e) for e in result2.errors]}")
+        print(f"Insert errors: {format_errors(result2.errors)}")
     
     # Check state after two operations
     current_sections = editor.get_sections()
@@ -107,7 +103,7 @@ Here's how to get started.
             history3 = editor.get_transaction_history()
             print(f"Transaction history after rollback: {len(history3)}")
         else:
-            print(f"Rollback errors: {rollback_result.errors}")
+            print(f"Rollback errors: {format_errors(rollback_result.errors)}")
     
     # Test document validation
     print("\n--- Document Validation ---")
@@ -41,13 +41,12 @@ def hello():
     print(f"Warnings: {len(result.warnings)}")
     print(f"Parser: {result.metadata['parser']}")
     
-    # Get AST wrapper for analysis
-    ast_wrapper = parser.get_ast_wrapper(result)
-    headings = ast_wrapper.get_headings()
+    # Headings are collected while parsing, so no extra pass is needed
+    headings = result.headings
     
     print(f"Found {len(headings)} headings:")
     for heading in headings:
-        print(f"  Level {heading['level']}: {heading['content']}")
+        print(f"  Level {heading.level}: {heading.content}")
 
 
 def multi_format_rendering_example():
@@ -59,10 +58,11 @@ def multi_format_rendering_example():
     parser = QuantalogicMarkdownParser()
     result = parser.parse(markdown_text)
     
-    # Render to different formats
-    html = parser.render(result, 'html')
-    latex = parser.render(result, 'latex')
-    json_output = parser.render(result, 'json')
+    # Render to different formats from the one parse result
+    outputs = parser.render_many(result, ('html', 'latex', 'json'))
+    html = outputs['html']
+    latex = outputs['latex']
+    json_output = outputs['json']
     
     print("HTML Output:")
     print(html[:100] + "...")
@@ -113,8 +113,8 @@ Another paragraph.
     print(f"Errors found: {len(result.errors)}")
     print(f"Warnings found: {len(result.warnings)}")
     
-    # Validate markdown
-    issues = parser.validate_markdown(problematic_text)
+    # Validate the result we already have rather than parsing the text again
+    issues = parser.validate(result)
     print(f"Validation issues: {len(issues)}")
     
     for issue in issues:
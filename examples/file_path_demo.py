@@ -10,16 +10,30 @@ This script shows how to:
 """
 
 import asyncio
-import sys
-import os
 from pathlib import Path
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Decode tool responses with orjson when it is installed; it accepts str directly
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
 
 from fastmcp import Client
 from quantalogic_markdown_mcp.mcp_server import server
 
+async def call_tool(client, name, arguments):
+    """Call one tool and decode its JSON reply."""
+    result = await client.call_tool(name, arguments)
+    return loads(result.content[0].text)
+
+async def call_tools(client, calls):
+    """Issue (tool name, arguments) calls concurrently and decode their JSON replies.
+    
+    A call that raises yields its exception in place of a reply.
+    """
+    return await asyncio.gather(*[call_tool(client, name, arguments) for name, arguments in calls],
+                                return_exceptions=True)
+
 async def demonstrate_path_operations():
     """Demonstrate various file path operations."""
     print("🚀 SafeMarkdownEditor MCP Server - File Path Demo")
@@ -36,17 +50,21 @@ async def demonstrate_path_operations():
             "$HOME/env_test.md"            # Environment variable
         ]
         
-        for path in paths_to_test:
-            result = await client.call_tool("test_path_resolution", {"path": path})
-            content = result.content[0].text
-            import json
-            parsed = json.loads(content)
+        # The lookups are independent, so issue them together
+        results = await call_tools(client, [
+            ("test_path_resolution", {"path": path}) for path in paths_to_test
+        ])
+        
+        for path, parsed in zip(paths_to_test, results):
+            if isinstance(parsed, Exception):
+                print(f"  Path: {path}\n    Error: {parsed}\n")
+                continue
             
-            print(f"  Path: {path}")
-            print(f"    Resolves to: {parsed['resolved_path']}")
-            print(f"    Exists: {parsed['exists']}")
-            print(f"    Tilde expanded: {parsed['expansion_info']['tilde_expanded']}")
-            print()
+            # One block per path, followed by a blank line
+            print(f"  Path: {path}\n"
+                  f"    Resolves to: {parsed['resolved_path']}\n"
+                  f"    Exists: {parsed['exists']}\n"
+                  f"    Tilde expanded: {parsed['expansion_info']['tilde_expanded']}\n")
         
         # 2. Create a sample document and save it
         print("📝 Creating and Saving Document:")
@@ -75,36 +93,43 @@ File path handling works great!
             "/tmp/mcp_temp_demo.md"        # Absolute path
         ]
         
-        for location in save_locations:
-            try:
-                # Create parent directory if needed
-                parent = Path(location).expanduser().parent
-                parent.mkdir(parents=True, exist_ok=True)
-                
-                result = await client.call_tool("save_document", {
-                    "file_path": location,
-                    "backup": True
-                })
-                content = result.content[0].text
-                parsed = json.loads(content)
-                
-                if parsed['success']:
-                    print(f"  ✅ Saved to: {location}")
-                    print(f"      Actual path: {parsed['file_path']}")
-                else:
-                    print(f"  ❌ Failed to save to: {location}")
-                    print(f"      Error: {parsed['error']}")
-                    
-            except Exception as e:
-                print(f"  ❌ Error saving to {location}: {e}")
+        # Create the parent directories without blocking the event loop; one
+        # unwritable location is reported below instead of ending the demo
+        mkdir_results = await asyncio.gather(*[
+            asyncio.to_thread(Path(location).expanduser().parent.mkdir, parents=True, exist_ok=True)
+            for location in save_locations
+        ], return_exceptions=True)
+        writable_locations = [
+            location for location, created in zip(save_locations, mkdir_results)
+            if not isinstance(created, Exception)
+        ]
+        
+        # Save to every writable location at once; a failure is reported, not raised
+        save_results = dict(zip(writable_locations, await call_tools(client, [
+            ("save_document", {"file_path": location, "backup": True})
+            for location in writable_locations
+        ])))
+        
+        for location, created in zip(save_locations, mkdir_results):
+            if isinstance(created, Exception):
+                print(f"  ❌ Could not create the directory for {location}: {created}")
+                continue
+            
+            parsed = save_results[location]
+            if isinstance(parsed, Exception):
+                print(f"  ❌ Error saving to {location}: {parsed}")
+            elif parsed['success']:
+                print(f"  ✅ Saved to: {location}")
+                print(f"      Actual path: {parsed['file_path']}")
+            else:
+                print(f"  ❌ Failed to save to: {location}")
+                print(f"      Error: {parsed['error']}")
         
         # 3. Load a document and get file info
         print("\n📂 Loading Document and Getting Info:")
         
-        # Load the README.md file
-        result = await client.call_tool("load_document", {"file_path": "./README.md"})
-        content = result.content[0].text
-        parsed = json.loads(content)
+        # Load the README.md file; get_file_info reads the loaded document, so it waits for this
+        parsed = await call_tool(client, "load_document", {"file_path": "./README.md"})
         
         if parsed['success']:
             print(f"  ✅ Loaded: {parsed['file_path']}")
@@ -112,9 +137,7 @@ File path handling works great!
             print(f"      Size: {parsed['file_size']} bytes")
             
             # Get detailed file info
-            info_result = await client.call_tool("get_file_info", {})
-            info_content = info_result.content[0].text
-            info_parsed = json.loads(info_content)
+            info_parsed = await call_tool(client, "get_file_info", {})
             
             print(f"      File name: {info_parsed['file_name']}")
             print(f"      Readable: {info_parsed['is_readable']}")
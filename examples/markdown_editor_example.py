@@ -507,7 +507,7 @@ class SafeMarkdownEditor:
                 return next_heading.get('line', current_line) - 1
         
         # If no next heading, section goes to end of document
-        return len(self._current_text.split('\n')) - 1
+        return self._current_text.count('\n')
     
     def rollback_transaction(self, transaction_index: int = -1) -> EditResult:
         """Rollback to a specific transaction."""
@@ -573,7 +573,7 @@ class SafeMarkdownEditor:
         return {
             'total_sections': len(sections),
             'heading_levels': {f'h{i}': len([s for s in sections if s.level == i]) for i in range(1, 7)},
-            'total_lines': len(self._current_text.split('\n')),
+            'total_lines': self._current_text.count('\n') + 1,
             'total_characters': len(self._current_text),
             'edit_count': len(self._transaction_log),
             'version': self._version,
@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 """Final verification of the header duplication fix through MCP."""
 
-import sys
-sys.path.insert(0, 'src')
+import re
+import tempfile
+from pathlib import Path
 
 from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
 
-def final_verification():
-    """Final test of the header duplication fix."""
+CHAPTER1_HEADER_RE = re.compile(r'^##.*Chapter 1.*$', re.MULTILINE)
+
+def final_verification(document_path):
+    """Final test of the header duplication fix, using a scratch file at document_path."""
     
     # Create test document
     test_content = """# Test Document for Header Duplication Fix
@@ -26,8 +29,7 @@ This is content for Chapter 2.
 """
     
     # Write test document
-    with open('test_final_verification.md', 'w') as f:
-        f.write(test_content)
+    document_path.write_text(test_content)
     
     print("=== Final Verification Test ===")
     print("Original document:")
@@ -38,7 +40,7 @@ This is content for Chapter 2.
     
     # Get document sections
     doc_result = server.call_tool_sync("get_document", {
-        "document_path": "test_final_verification.md"
+        "document_path": str(document_path)
     })
     
     if not doc_result.get("success"):
@@ -69,7 +71,7 @@ This is NEW content for Chapter 1 that includes the header.
 This should NOT cause duplication."""
     
     update_result = server.call_tool_sync("update_section", {
-        "document_path": "test_final_verification.md",
+        "document_path": str(document_path),
         "section_id": chapter1_id,
         "content": content_with_header
     })
@@ -80,15 +82,13 @@ This should NOT cause duplication."""
         return False
     
     # Check result
-    with open('test_final_verification.md', 'r') as f:
-        updated_content = f.read()
+    updated_content = document_path.read_text()
     
     print("Updated document:")
     print(updated_content)
     
     # Count Chapter 1 headers
-    import re
-    chapter1_headers = re.findall(r'^##.*Chapter 1.*$', updated_content, re.MULTILINE)
+    chapter1_headers = CHAPTER1_HEADER_RE.findall(updated_content)
     print(f"\nChapter 1 headers found: {len(chapter1_headers)}")
     for i, header in enumerate(chapter1_headers, 1):
         print(f"  {i}: '{header}'")
@@ -105,7 +105,7 @@ This should NOT cause duplication."""
 The header should be preserved by the editor."""
     
     update_result2 = server.call_tool_sync("update_section", {
-        "document_path": "test_final_verification.md",
+        "document_path": str(document_path),
         "section_id": chapter1_id,
         "content": normal_content
     })
@@ -115,13 +115,12 @@ The header should be preserved by the editor."""
         return False
     
     # Check result
-    with open('test_final_verification.md', 'r') as f:
-        updated_content2 = f.read()
+    updated_content2 = document_path.read_text()
     
     print("Updated document:")
     print(updated_content2)
     
-    chapter1_headers2 = re.findall(r'^##.*Chapter 1.*$', updated_content2, re.MULTILINE)
+    chapter1_headers2 = CHAPTER1_HEADER_RE.findall(updated_content2)
     print(f"\nChapter 1 headers found: {len(chapter1_headers2)}")
     
     if len(chapter1_headers2) == 1:
@@ -131,17 +130,12 @@ The header should be preserved by the editor."""
         print("❌ Test 2 FAILED - Header not preserved correctly!")
         test2_passed = False
     
-    # Cleanup
-    import os
-    try:
-        os.remove('test_final_verification.md')
-    except:
-        pass
-    
     return test2_passed
 
 if __name__ == "__main__":
-    success = final_verification()
+    # The scratch directory is removed on exit, including after early failures
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        success = final_verification(Path(scratch_dir) / "test_final_verification.md")
     if success:
         print("\n🎉 HEADER DUPLICATION FIX VERIFIED SUCCESSFULLY!")
         print("The MCP markdown editor now correctly handles header duplication.")
@@ -1,5 +1,7 @@
 """Quantalogic Markdown Parser - A flexible and extensible Markdown parser with AST support.""" 
 
+from typing import Any
+
 from .parser import (
     QuantalogicMarkdownParser,
     parse_markdown,
@@ -15,13 +17,15 @@ from .renderers import (
     MultiFormatRenderer,
 )
 from .ast_utils import ASTWrapper
-from .types import ParseResult, ParseError, ErrorLevel
+from .types import Heading, ParseResult, ParseError, ErrorLevel
 from .safe_editor import SafeMarkdownEditor
 from .safe_editor_types import (
     SectionReference,
+    SectionSummary,
     EditOperation,
     EditResult,
     EditTransaction,
+    TextDelta,
     ValidationLevel,
     ErrorCategory,
     DocumentStatistics,
@@ -29,7 +33,17 @@ from .safe_editor_types import (
     LinkError,
     SafeParseError,
 )
-from .mcp_server import MarkdownMCPServer, server, mcp
+
+# The MCP server pulls in the mcp SDK and builds a global server instance, so
+# it is imported on first access rather than with the parser and editor
+_MCP_SERVER_EXPORTS = ("MarkdownMCPServer", "server", "mcp")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _MCP_SERVER_EXPORTS:
+        from . import mcp_server
+        return getattr(mcp_server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __version__ = "0.1.0"
 __author__ = "Raphael Mansuy"
@@ -57,15 +71,18 @@ __all__ = [
     
     # Types
     "ParseResult",
+    "Heading",
     "ParseError",
     "ErrorLevel",
     
     # Safe Editor
     "SafeMarkdownEditor",
     "SectionReference",
+    "SectionSummary",
     "EditOperation",
     "EditResult",
     "EditTransaction",
+    "TextDelta",
     "ValidationLevel",
     "ErrorCategory",
     "DocumentStatistics",
@@ -15,8 +15,11 @@ class EnhancedMarkdownMCPServer(MarkdownMCPServer):
         """Initialize the enhanced MCP server."""
         super().__init__(server_name)
         self.processor = StatelessMarkdownProcessor()
-        self._setup_enhanced_tools()
     
+    def _setup_app(self) -> None:
+        """Register the base server's tools, then the enhanced tools over them."""
+        super()._setup_app()
+        self._setup_enhanced_tools()
     
     def _setup_enhanced_tools(self) -> None:
         """Register enhanced MCP tools."""
@@ -33,14 +36,16 @@ class EnhancedMarkdownMCPServer(MarkdownMCPServer):
                 validation_enum = validation_map.get(validation_level.upper(), ValidationLevel.NORMAL)
                 editor = self.processor.load_document(document_path, validation_enum)
                 sections = editor.get_sections()
-                content_preview = editor.to_markdown()[:200] + "..." if len(editor.to_markdown()) > 200 else editor.to_markdown()
+                # Read the text once; slicing it copies only the preview
+                content = editor.to_markdown()
+                content_preview = content[:200] + "..." if len(content) > 200 else content
                 return {
                     "success": True,
                     "message": f"Successfully analyzed document at {document_path}",
                     "document_path": document_path,
                     "sections_count": len(sections),
                     "content_preview": content_preview,
-                    "file_size": len(editor.to_markdown()),
+                    "file_size": len(content),
                     "stateless": True
                 }
             except Exception as e:
@@ -6,13 +6,19 @@ the SafeMarkdownEditor functionality as stateless MCP tools, where each
 operation requires a document_path parameter.
 """
 
-from typing import Any, Dict, Optional
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from weakref import WeakKeyDictionary
 
 from mcp.server.fastmcp import FastMCP
 
 from .safe_editor import SafeMarkdownEditor
-from .safe_editor_types import ValidationLevel
-from .stateless_processor import StatelessMarkdownProcessor
+from .safe_editor_types import (
+    EditOperation, EditResult, ErrorCategory, SafeParseError, SectionSummary, ValidationLevel
+)
+from .stateless_processor import DocumentSource, StatelessMarkdownProcessor
 
 
 class MarkdownMCPServer:
@@ -23,11 +29,78 @@ class MarkdownMCPServer:
     as stateless operations where each tool requires a document_path parameter.
     """
     
+    # Parsed editors kept for read-only tools, keyed on file identity
+    EDITOR_CACHE_SIZE = 64
+    
     def __init__(self, server_name: str = "SafeMarkdownEditor"):
         """Initialize the stateless MCP server."""
-        self.mcp = FastMCP(server_name)
+        self._server_name = server_name
+        # The FastMCP app is built on first use of the mcp property
+        self._mcp: Optional[FastMCP] = None
+        self._mcp_ready = False
+        self._mcp_lock = threading.RLock()
         self.processor = StatelessMarkdownProcessor()
+        self._editor_cache: "OrderedDict[Tuple[str, int, int, ValidationLevel], SafeMarkdownEditor]" = OrderedDict()
+        # Guards the cache's LRU bookkeeping; loading and parsing happen outside it
+        self._editor_cache_lock = threading.Lock()
+        # get_document data per editor, valid while the editor's text object is unchanged
+        self._document_data_cache: "WeakKeyDictionary[SafeMarkdownEditor, Tuple[str, Dict[str, Any]]]" = WeakKeyDictionary()
         
+        # Dispatch tables are bound once here rather than rebuilt per call
+        self._tool_impls: Dict[str, Callable[..., Dict[str, Any]]] = {
+            "load_document": self._load_document_impl,
+            "list_sections": self._list_sections_impl,
+            "get_section": self._get_section_impl,
+            "insert_section": self._insert_section_impl,
+            "bulk_insert_sections": self._bulk_insert_sections_impl,
+            "update_section": self._update_section_impl,
+            "delete_section": self._delete_section_impl,
+            "move_section": self._move_section_impl,
+            "get_document": self._get_document_impl,
+            "save_document": self._save_document_impl,
+            "analyze_document": self._analyze_document_impl,
+        }
+        self._operation_factories: Dict[str, Callable[..., Callable[[SafeMarkdownEditor], Any]]] = {
+            "list_sections": self._list_sections_operation,
+            "get_section": self._get_section_operation,
+            "insert_section": self._insert_section_operation,
+            "bulk_insert_sections": self._bulk_insert_sections_operation,
+            "update_section": self._update_section_operation,
+            "delete_section": self._delete_section_operation,
+            "move_section": self._move_section_operation,
+            "get_document": self._get_document_operation,
+            "analyze_document": self._analyze_document_operation,
+        }
+    
+    @property
+    def mcp(self) -> FastMCP:
+        """
+        The FastMCP app serving this server's tools, resources and prompts.
+        
+        Registering the tools is the costly part of setting up a server and
+        only the MCP protocol needs it, so it happens on first access. Servers
+        used through call_tool_sync or the direct methods never pay for it.
+        """
+        app = self._mcp
+        if self._mcp_ready and app is not None:
+            return app
+        
+        with self._mcp_lock:
+            # Registration reads self.mcp again; the lock is reentrant, so that
+            # sees the app being built while other threads wait for it
+            app = self._mcp
+            if app is None:
+                app = self._mcp = FastMCP(self._server_name)
+                try:
+                    self._setup_app()
+                except BaseException:
+                    self._mcp = None
+                    raise
+                self._mcp_ready = True
+            return app
+    
+    def _setup_app(self) -> None:
+        """Register everything the FastMCP app serves."""
         self._setup_tools()
         self._setup_resources()
         self._setup_prompts()
@@ -56,7 +129,9 @@ class MarkdownMCPServer:
                 # Load document without server state
                 editor = self.processor.load_document(document_path, validation_enum)
                 sections = editor.get_sections()
-                content_preview = editor.to_markdown()[:200] + "..." if len(editor.to_markdown()) > 200 else editor.to_markdown()
+                # Read the text once; slicing it copies only the preview
+                content = editor.to_markdown()
+                content_preview = content[:200] + "..." if len(content) > 200 else content
                 
                 return {
                     "success": True,
@@ -64,7 +139,7 @@ class MarkdownMCPServer:
                     "document_path": document_path,
                     "sections_count": len(sections),
                     "content_preview": content_preview,
-                    "file_size": len(editor.to_markdown()),
+                    "file_size": len(content),
                     "stateless": True
                 }
                 
@@ -74,7 +149,7 @@ class MarkdownMCPServer:
         @self.mcp.tool()
         def insert_section(document_path: str, heading: str, content: str, position: int,
                           auto_save: bool = True, backup: bool = True,
-                          validation_level: str = "NORMAL") -> Dict[str, Any]:
+                          validation_level: str = "NORMAL", return_section: bool = False) -> Dict[str, Any]:
             """
             Insert a new section at a specified location.
             The document will be saved after the operation if successful and auto_save is True.
@@ -90,6 +165,7 @@ class MarkdownMCPServer:
                 auto_save: Whether to automatically save the document
                 backup: Whether to create a backup before saving
                 validation_level: Validation strictness - "STRICT", "NORMAL", or "PERMISSIVE"
+                return_section: Include the inserted section, as get_section returns it
             """
             def operation(editor):
                 sections = editor.get_sections()
@@ -132,10 +208,35 @@ class MarkdownMCPServer:
                             warnings=[]
                         )
             
+            if return_section:
+                operation = self._returning_section(operation)
+            
             validation_map = {"STRICT": ValidationLevel.STRICT, "NORMAL": ValidationLevel.NORMAL, "PERMISSIVE": ValidationLevel.PERMISSIVE}
             validation_enum = validation_map.get(validation_level.upper(), ValidationLevel.NORMAL)
             
-            return self.processor.execute_operation(document_path, operation, auto_save, backup, validation_enum)
+            return self._execute_edit(document_path, operation, auto_save, backup, validation_enum)
+        
+        @self.mcp.tool()
+        def bulk_insert_sections(document_path: str, sections: List[Dict[str, str]], position: Optional[int] = None,
+                                 auto_save: bool = True, backup: bool = True,
+                                 validation_level: str = "NORMAL") -> Dict[str, Any]:
+            """
+            Insert several new sections, in order, as one edit.
+            
+            Args:
+                document_path: Path to the Markdown file
+                sections: List of {"heading": ..., "content": ...} objects
+                position: Insert after the section at position-1; omit to append at the end
+                auto_save: Whether to automatically save the document
+                backup: Whether to create a backup before saving
+                validation_level: Validation strictness - "STRICT", "NORMAL", or "PERMISSIVE"
+            """
+            operation = self._bulk_insert_sections_operation(sections, position)
+            
+            validation_map = {"STRICT": ValidationLevel.STRICT, "NORMAL": ValidationLevel.NORMAL, "PERMISSIVE": ValidationLevel.PERMISSIVE}
+            validation_enum = validation_map.get(validation_level.upper(), ValidationLevel.NORMAL)
+            
+            return self._execute_edit(document_path, operation, auto_save, backup, validation_enum)
         
         @self.mcp.tool()
         def delete_section(document_path: str, section_id: Optional[str] = None, heading: Optional[str] = None,
@@ -171,9 +272,8 @@ class MarkdownMCPServer:
                         )
                 elif heading:
                     # Find section by heading
-                    sections = editor.get_sections()
-                    matching_sections = [s for s in sections if s.title == heading]
-                    if not matching_sections:
+                    section_ref = editor.get_section_by_title(heading)
+                    if not section_ref:
                         from .safe_editor_types import EditResult, OperationType
                         return EditResult(
                             success=False,
@@ -182,7 +282,6 @@ class MarkdownMCPServer:
                             errors=[f"Section with heading '{heading}' not found"],
                             warnings=[]
                         )
-                    section_ref = matching_sections[0]
                 else:
                     from .safe_editor_types import EditResult, OperationType
                     return EditResult(
@@ -198,12 +297,12 @@ class MarkdownMCPServer:
             validation_map = {"STRICT": ValidationLevel.STRICT, "NORMAL": ValidationLevel.NORMAL, "PERMISSIVE": ValidationLevel.PERMISSIVE}
             validation_enum = validation_map.get(validation_level.upper(), ValidationLevel.NORMAL)
             
-            return self.processor.execute_operation(document_path, operation, auto_save, backup, validation_enum)
+            return self._execute_edit(document_path, operation, auto_save, backup, validation_enum)
         
         @self.mcp.tool()
         def update_section(document_path: str, section_id: str, content: str,
                           auto_save: bool = True, backup: bool = True,
-                          validation_level: str = "NORMAL") -> Dict[str, Any]:
+                          validation_level: str = "NORMAL", return_section: bool = False) -> Dict[str, Any]:
             """
             Update the content of an existing section.
             The document will be saved after the operation if successful and auto_save is True.
@@ -218,6 +317,7 @@ class MarkdownMCPServer:
                 auto_save: Whether to automatically save the document
                 backup: Whether to create a backup before saving
                 validation_level: Validation strictness - "STRICT", "NORMAL", or "PERMISSIVE"
+                return_section: Include the updated section, as get_section returns it
             """
             def operation(editor):
                 section_ref = editor.get_section_by_id(section_id)
@@ -233,10 +333,13 @@ class MarkdownMCPServer:
                 
                 return editor.update_section_content(section_ref, content)
             
+            if return_section:
+                operation = self._returning_section(operation)
+            
             validation_map = {"STRICT": ValidationLevel.STRICT, "NORMAL": ValidationLevel.NORMAL, "PERMISSIVE": ValidationLevel.PERMISSIVE}
             validation_enum = validation_map.get(validation_level.upper(), ValidationLevel.NORMAL)
             
-            return self.processor.execute_operation(document_path, operation, auto_save, backup, validation_enum)
+            return self._execute_edit(document_path, operation, auto_save, backup, validation_enum)
         
         @self.mcp.tool()
         def get_section(document_path: str, section_id: str, validation_level: str = "NORMAL") -> Dict[str, Any]:
@@ -263,10 +366,7 @@ class MarkdownMCPServer:
                     }
                 
                 # Extract section content using line ranges
-                full_content = editor.to_markdown()
-                lines = full_content.split('\n')
-                section_lines = lines[section_ref.line_start:section_ref.line_end+1]
-                section_content = '\n'.join(section_lines)
+                section_content = editor.get_section_markdown(section_ref)
                 
                 return {
                     "success": True,
@@ -299,17 +399,12 @@ class MarkdownMCPServer:
                 editor = self.processor.load_document(document_path, validation_enum)
                 sections = editor.get_sections()
                 
-                # Get full content to extract section content
-                full_content = editor.to_markdown()
-                lines = full_content.split('\n')
-                
                 # Build section list with content preview
                 section_list = []
                 for section in sections:
                     # Extract section content using line ranges
                     try:
-                        section_lines = lines[section.line_start:section.line_end+1]
-                        section_content = '\n'.join(section_lines)
+                        section_content = editor.get_section_markdown(section)
                         content_preview = section_content[:100] + "..." if len(section_content) > 100 else section_content
                     except (IndexError, AttributeError):
                         # Fallback if line extraction fails
@@ -381,7 +476,7 @@ class MarkdownMCPServer:
             validation_map = {"STRICT": ValidationLevel.STRICT, "NORMAL": ValidationLevel.NORMAL, "PERMISSIVE": ValidationLevel.PERMISSIVE}
             validation_enum = validation_map.get(validation_level.upper(), ValidationLevel.NORMAL)
             
-            return self.processor.execute_operation(document_path, operation, auto_save, backup, validation_enum)
+            return self._execute_edit(document_path, operation, auto_save, backup, validation_enum)
         
         @self.mcp.tool()
         def get_document(document_path: str, validation_level: str = "NORMAL") -> Dict[str, Any]:
@@ -416,7 +511,7 @@ class MarkdownMCPServer:
                     ],
                     "metadata": {
                         "total_sections": len(sections),
-                        "total_lines": len(content.split('\n')),
+                        "total_lines": content.count('\n') + 1,
                         "file_size": len(content),
                         "validation_level": validation_level
                     }
@@ -532,6 +627,7 @@ This MCP server provides stateless tools for editing Markdown documents. Each op
 - `list_sections(document_path)` - List all sections
 - `get_section(document_path, section_id)` - Get specific section
 - `insert_section(document_path, heading, content, position)` - Insert new section
+- `bulk_insert_sections(document_path, sections, position)` - Insert several sections as one edit
 - `update_section(document_path, section_id, content)` - Update existing section
 - `delete_section(document_path, section_id|heading)` - Delete section
 - `move_section(document_path, section_id, target_position)` - Move section
@@ -613,30 +709,157 @@ All operations support both section IDs and heading-based lookups where appropri
     
     def call_tool_sync(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Synchronously call a tool for testing purposes."""
-        # Get the tool function from the mcp instance
-        tools = {
-            "load_document": self._load_document_impl,
-            "list_sections": self._list_sections_impl,
-            "get_section": self._get_section_impl,
-            "insert_section": self._insert_section_impl,
-            "update_section": self._update_section_impl,
-            "delete_section": self._delete_section_impl,
-            "move_section": self._move_section_impl,
-            "get_document": self._get_document_impl,
-            "save_document": self._save_document_impl,
-            "analyze_document": self._analyze_document_impl,
-        }
-        
-        if tool_name not in tools:
+        tool = self._tool_impls.get(tool_name)
+        if tool is None:
             return {"success": False, "error": f"Tool '{tool_name}' not found"}
         
         try:
-            return tools[tool_name](**arguments)
+            return tool(**arguments)
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    def call_tools_sync(self, document_path: DocumentSource, calls: List[Tuple[str, Dict[str, Any]]],
+                        auto_save: bool = True, backup: bool = True) -> Dict[str, Any]:
+        """
+        Synchronously run several tools against one document in a single pass.
+        
+        The document is read and parsed once, every call is applied to the same
+        in-memory editor, and the result is saved once at the end if it changed
+        and every call succeeded.
+        
+        Args:
+            document_path: Path to the Markdown file, or an in-memory text stream
+            calls: Sequence of (tool_name, arguments) pairs; arguments omit document_path
+            auto_save: Whether to save the document after the batch
+            backup: Whether to create a backup before saving
+        """
+        operation_factories = self._operation_factories
+        
+        operations = []
+        for tool_name, arguments in calls:
+            if tool_name not in operation_factories:
+                return {"success": False, "error": f"Tool '{tool_name}' cannot be batched"}
+            # Per-call save options are superseded by the batch-level ones
+            arguments = {key: value for key, value in arguments.items()
+                         if key not in ("document_path", "auto_save", "backup")}
+            try:
+                operations.append(operation_factories[tool_name](**arguments))
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+        
+        return self.processor.execute_operations(document_path, operations, auto_save, backup)
+    
+    @staticmethod
+    def sections_as_records(result: Dict[str, Any]) -> List[SectionSummary]:
+        """
+        Convert the section dicts of a tool response into typed records.
+        
+        Tool responses stay dict-based for the MCP wire format; this gives local
+        Python callers attribute access instead of repeated dict lookups.
+        """
+        return [
+            SectionSummary(
+                id=section["id"],
+                title=section["title"],
+                level=section["level"],
+                line_start=section.get("start_line", section.get("line_start", 0)),
+                line_end=section.get("end_line", section.get("line_end", 0))
+            )
+            for section in result.get("sections", [])
+        ]
+    
+    def _load_cached_editor(self, document_path: DocumentSource,
+                            validation_level: ValidationLevel = ValidationLevel.NORMAL) -> SafeMarkdownEditor:
+        """
+        Load a document, reusing the parse of an unchanged file.
+        
+        Files are keyed on (path, mtime_ns, size), so any rewrite of the file
+        invalidates its entry. Callers must not modify the returned editor:
+        read-only tools use it as is, while _execute_edit edits a copy() of it
+        and caches that copy under the file's new identity after saving.
+        """
+        if self.processor.is_stream(document_path):
+            return self.processor.load_document(document_path, validation_level)
+        
+        try:
+            resolved_path = str(self.processor.resolve_path(cast(str, document_path)))
+            stat = os.stat(resolved_path)
+        except (OSError, ValueError):
+            # Let the processor raise its usual error for missing files
+            return self.processor.load_document(document_path, validation_level)
+        
+        key = (resolved_path, stat.st_mtime_ns, stat.st_size, validation_level)
+        with self._editor_cache_lock:
+            editor = self._editor_cache.get(key)
+            if editor is not None:
+                self._editor_cache.move_to_end(key)
+                return editor
+        
+        editor = self.processor.load_document(document_path, validation_level)
+        self._store_cached_editor(key, editor)
+        return editor
+    
+    def _store_cached_editor(self, key: Tuple[str, int, int, ValidationLevel], editor: SafeMarkdownEditor) -> None:
+        """Add an editor to the cache, evicting the least recently used entry when full."""
+        with self._editor_cache_lock:
+            self._editor_cache[key] = editor
+            if len(self._editor_cache) > self.EDITOR_CACHE_SIZE:
+                self._editor_cache.popitem(last=False)
+    
+    def _execute_read_only(self, document_path: DocumentSource,
+                           operation: Callable[[SafeMarkdownEditor], Any]) -> Dict[str, Any]:
+        """Run a non-modifying operation against the cached editor for a document."""
+        try:
+            editor = self._load_cached_editor(document_path)
+        except Exception as e:
+            return self.processor.create_error_response(str(e), type(e).__name__)
+        return self.processor.execute_operation(document_path, operation, auto_save=False, editor=editor)
+    
+    def _execute_edit(self, document_path: DocumentSource, operation: Callable[[SafeMarkdownEditor], Any],
+                      auto_save: bool = True, backup: bool = True,
+                      validation_level: ValidationLevel = ValidationLevel.NORMAL) -> Dict[str, Any]:
+        """
+        Run a modifying operation on a copy of the cached editor for a document.
+        
+        Copying shares the cached parse, so an edit to an unchanged file skips
+        reading and reparsing it. After a save a history-free copy of the
+        edited editor is cached under the file's new identity, so the next
+        call starts from it too.
+        """
+        if self.processor.is_stream(document_path):
+            return self.processor.execute_operation(document_path, operation, auto_save, backup, validation_level)
+        
+        try:
+            lock = self.processor.document_lock(document_path)
+        except Exception as e:
+            return self.processor.create_error_response(str(e), type(e).__name__)
+        
+        # Hold the document's lock from load to save, as the processor would
+        with lock:
+            try:
+                editor = self._load_cached_editor(document_path, validation_level).copy()
+            except Exception as e:
+                return self.processor.create_error_response(str(e), type(e).__name__)
+            
+            response = self.processor.execute_operation(document_path, operation, auto_save, backup,
+                                                        validation_level, editor=editor)
+            
+            if response.get("saved"):
+                try:
+                    resolved_path = str(self.processor.resolve_path(cast(str, document_path)))
+                    stat = os.stat(resolved_path)
+                except (OSError, ValueError):
+                    pass
+                else:
+                    # Cache it as a fresh load of the saved file, so no version or history
+                    # carries over into the next stateless call
+                    self._store_cached_editor((resolved_path, stat.st_mtime_ns, stat.st_size, validation_level),
+                                              editor.copy(with_history=False))
+            
+            return response
+    
     # Implementation methods for testing
-    def _load_document_impl(self, document_path: str, validation_level: str = "NORMAL") -> Dict[str, Any]:
+    def _load_document_impl(self, document_path: DocumentSource, validation_level: str = "NORMAL") -> Dict[str, Any]:
         """Implementation for load_document tool."""
         try:
             # Convert string validation level to enum
@@ -647,17 +870,8 @@ All operations support both section IDs and heading-based lookups where appropri
             }
             validation_enum = validation_map.get(validation_level, ValidationLevel.NORMAL)
             
-            # Load document content first
-            from pathlib import Path
-            doc_path = Path(document_path).expanduser().resolve()
-            
-            if not doc_path.exists():
-                return self.processor.create_error_response(f"Path does not exist: {doc_path}", "DocumentNotFoundError")
-            
-            content = doc_path.read_text(encoding='utf-8')
-            
-            # Create editor with content and validation level
-            editor = SafeMarkdownEditor(content, validation_level=validation_enum)
+            # Load from a file path or an in-memory text stream
+            editor = self.processor.load_document(document_path, validation_enum)
             
             sections = editor.get_sections()
             
@@ -672,8 +886,13 @@ All operations support both section IDs and heading-based lookups where appropri
         except Exception as e:
             return self.processor.create_error_response(str(e), type(e).__name__)
 
-    def _list_sections_impl(self, document_path: str) -> Dict[str, Any]:
+    def _list_sections_impl(self, document_path: DocumentSource) -> Dict[str, Any]:
         """Implementation for list_sections tool."""
+        operation = self._list_sections_operation()
+        return self._execute_read_only(document_path, operation)
+    
+    def _list_sections_operation(self) -> Callable[[SafeMarkdownEditor], Any]:
+        """Build the editor operation for the list_sections tool."""
         def operation(editor):
             from .safe_editor_types import EditResult, EditOperation
             
@@ -681,17 +900,10 @@ All operations support both section IDs and heading-based lookups where appropri
             
             section_list = []
             for section in sections:
-                # Extract content for the section by using line ranges
-                content = ""
+                # Slice each section out of the document; nothing is split
                 try:
-                    markdown_text = editor.to_markdown()
-                    lines = markdown_text.split('\n')
-                    
-                    # Extract section content from line_start to line_end
-                    if section.line_start < len(lines) and section.line_end < len(lines):
-                        content_lines = lines[section.line_start:section.line_end + 1]
-                        content = '\n'.join(content_lines)
-                except Exception:
+                    content = editor.get_section_markdown(section)
+                except IndexError:
                     content = ""
                 
                 section_list.append({
@@ -712,10 +924,15 @@ All operations support both section IDs and heading-based lookups where appropri
                 metadata={"sections": section_list}
             )
         
-        return self.processor.execute_operation(document_path, operation, auto_save=False)
+        return operation
     
-    def _get_section_impl(self, document_path: str, section_id: str) -> Dict[str, Any]:
+    def _get_section_impl(self, document_path: DocumentSource, section_id: str) -> Dict[str, Any]:
         """Implementation for get_section tool."""
+        operation = self._get_section_operation(section_id)
+        return self._execute_read_only(document_path, operation)
+    
+    def _get_section_operation(self, section_id: str) -> Callable[[SafeMarkdownEditor], Any]:
+        """Build the editor operation for the get_section tool."""
         def operation(editor):
             from .safe_editor_types import EditResult, EditOperation, SafeParseError, ErrorCategory
             
@@ -734,41 +951,58 @@ All operations support both section IDs and heading-based lookups where appropri
                     warnings=[]
                 )
             
-            # Extract content for the section
-            content = ""
-            try:
-                markdown_text = editor.to_markdown()
-                lines = markdown_text.split('\n')
-                
-                # Extract section content from line_start to line_end
-                if section.line_start < len(lines) and section.line_end < len(lines):
-                    content_lines = lines[section.line_start:section.line_end + 1]
-                    content = '\n'.join(content_lines)
-            except Exception:
-                content = ""
-            
-            section_data = {
-                "id": section.id,
-                "title": section.title,
-                "level": section.level,
-                "start_line": section.line_start,
-                "end_line": section.line_end,
-                "content": content
-            }
-            
             return EditResult(
                 success=True,
                 operation=EditOperation.BATCH_OPERATIONS,
                 modified_sections=[],
                 errors=[],
                 warnings=[],
-                metadata={"section": section_data}
+                metadata={"section": self._section_data(editor, section)}
             )
         
-        return self.processor.execute_operation(document_path, operation, auto_save=False)
+        return operation
+    
+    @staticmethod
+    def _section_data(editor: SafeMarkdownEditor, section: Any) -> Dict[str, Any]:
+        """Describe a section the way the get_section tool returns it."""
+        # Extract content for the section
+        try:
+            content = editor.get_section_markdown(section)
+        except IndexError:
+            content = ""
+        
+        return {
+            "id": section.id,
+            "title": section.title,
+            "level": section.level,
+            "start_line": section.line_start,
+            "end_line": section.line_end,
+            "content": content
+        }
     
-    def _insert_section_impl(self, document_path: str, heading: str, content: str = "", position: Optional[int] = None, auto_save: bool = True, backup: bool = True) -> Dict[str, Any]:
+    def _returning_section(self, operation: Callable[[SafeMarkdownEditor], Any]) -> Callable[[SafeMarkdownEditor], Any]:
+        """
+        Wrap an editing operation so a successful result also carries the section it edited.
+        
+        The section is read from the editor the operation just changed, so
+        callers need no get_section call afterwards.
+        """
+        def returning_section(editor: SafeMarkdownEditor) -> Any:
+            result = operation(editor)
+            if isinstance(result, EditResult) and result.success and result.modified_sections:
+                result.metadata["section"] = self._section_data(editor, result.modified_sections[0])
+            return result
+        
+        return returning_section
+    
+    def _insert_section_impl(self, document_path: DocumentSource, heading: str, content: str = "", position: Optional[int] = None, auto_save: bool = True, backup: bool = True, return_section: bool = False) -> Dict[str, Any]:
         """Implementation for insert_section tool."""
+        operation = self._insert_section_operation(heading, content, position, return_section)
+        validation_enum = ValidationLevel.NORMAL
+        return self._execute_edit(document_path, operation, auto_save, backup, validation_enum)
+    
+    def _insert_section_operation(self, heading: str, content: str = "", position: Optional[int] = None, return_section: bool = False) -> Callable[[SafeMarkdownEditor], Any]:
+        """Build the editor operation for the insert_section tool."""
         def operation(editor):
             sections = editor.get_sections()
             
@@ -795,34 +1029,102 @@ All operations support both section IDs and heading-based lookups where appropri
                 after_section = sections[position - 1]
                 level = after_section.level if after_section.level < 6 else 1
                 return editor.insert_section_after(after_section, level, heading, content)
-            
+        
+        return self._returning_section(operation) if return_section else operation
+    
+    def _bulk_insert_sections_impl(self, document_path: DocumentSource, sections: List[Dict[str, str]], position: Optional[int] = None, auto_save: bool = True, backup: bool = True) -> Dict[str, Any]:
+        """Implementation for bulk_insert_sections tool."""
+        operation = self._bulk_insert_sections_operation(sections, position)
         validation_enum = ValidationLevel.NORMAL
-        return self.processor.execute_operation(document_path, operation, auto_save, backup, validation_enum)
+        return self._execute_edit(document_path, operation, auto_save, backup, validation_enum)
+    
+    def _bulk_insert_sections_operation(self, sections: List[Dict[str, str]], position: Optional[int] = None) -> Callable[[SafeMarkdownEditor], Any]:
+        """
+        Build the editor operation for the bulk_insert_sections tool.
+        
+        Sections are placed like insert_section places one, but the whole block
+        is parsed once and recorded as a single transaction.
+        """
+        def operation(editor: SafeMarkdownEditor) -> Any:
+            existing = editor.get_sections()
+            
+            # Reported as EditResults, which the processor turns into error responses
+            if not existing:
+                return EditResult(
+                    success=False,
+                    operation=EditOperation.INSERT_SECTION,
+                    errors=[SafeParseError(
+                        message="Cannot insert into empty document - use save_document first",
+                        error_code="EMPTY_DOCUMENT",
+                        category=ErrorCategory.OPERATION
+                    )]
+                )
+            if position == 0:
+                return EditResult(
+                    success=False,
+                    operation=EditOperation.INSERT_SECTION,
+                    errors=[SafeParseError(
+                        message="Inserting at position 0 not supported - use position >= 1",
+                        error_code="INVALID_POSITION",
+                        category=ErrorCategory.VALIDATION,
+                        suggestions=["Use a position of 1 or more"]
+                    )]
+                )
+            
+            if position is None or position >= len(existing):
+                after_section = existing[-1]
+                level = 1
+            else:
+                after_section = existing[position - 1]
+                level = after_section.level if after_section.level < 6 else 1
+            
+            return editor.insert_sections_after(after_section, [
+                {"level": level, "title": section["heading"], "content": section.get("content", "")}
+                for section in sections
+            ])
+        
+        return operation
     
-    def _update_section_impl(self, document_path: str, section_id: str, content: str, auto_save: bool = True, backup: bool = True) -> Dict[str, Any]:
+    def _update_section_impl(self, document_path: DocumentSource, section_id: str, content: str, auto_save: bool = True, backup: bool = True, return_section: bool = False) -> Dict[str, Any]:
         """Implementation for update_section tool."""
+        operation = self._update_section_operation(section_id, content, return_section)
+        validation_enum = ValidationLevel.NORMAL
+        return self._execute_edit(document_path, operation, auto_save, backup, validation_enum)
+    
+    def _update_section_operation(self, section_id: str, content: str, return_section: bool = False) -> Callable[[SafeMarkdownEditor], Any]:
+        """Build the editor operation for the update_section tool."""
         def operation(editor):
             section = editor.get_section_by_id(section_id)
             if not section:
                 return {"success": False, "error": f"Section '{section_id}' not found"}
             return editor.update_section_content(section, content)
-            
-        validation_enum = ValidationLevel.NORMAL
-        return self.processor.execute_operation(document_path, operation, auto_save, backup, validation_enum)
+        
+        return self._returning_section(operation) if return_section else operation
     
-    def _delete_section_impl(self, document_path: str, section_id: str, auto_save: bool = True, backup: bool = True) -> Dict[str, Any]:
+    def _delete_section_impl(self, document_path: DocumentSource, section_id: str, auto_save: bool = True, backup: bool = True) -> Dict[str, Any]:
         """Implementation for delete_section tool."""
+        operation = self._delete_section_operation(section_id)
+        validation_enum = ValidationLevel.NORMAL
+        return self._execute_edit(document_path, operation, auto_save, backup, validation_enum)
+    
+    def _delete_section_operation(self, section_id: str) -> Callable[[SafeMarkdownEditor], Any]:
+        """Build the editor operation for the delete_section tool."""
         def operation(editor):
             section = editor.get_section_by_id(section_id)
             if not section:
                 return {"success": False, "error": f"Section '{section_id}' not found"}
             return editor.delete_section(section)
-            
-        validation_enum = ValidationLevel.NORMAL
-        return self.processor.execute_operation(document_path, operation, auto_save, backup, validation_enum)
+        
+        return operation
     
-    def _move_section_impl(self, document_path: str, section_id: str, target_position: int, auto_save: bool = True, backup: bool = True) -> Dict[str, Any]:
+    def _move_section_impl(self, document_path: DocumentSource, section_id: str, target_position: int, auto_save: bool = True, backup: bool = True) -> Dict[str, Any]:
         """Implementation for move_section tool."""
+        operation = self._move_section_operation(section_id, target_position)
+        validation_enum = ValidationLevel.NORMAL
+        return self._execute_edit(document_path, operation, auto_save, backup, validation_enum)
+    
+    def _move_section_operation(self, section_id: str, target_position: int) -> Callable[[SafeMarkdownEditor], Any]:
+        """Build the editor operation for the move_section tool."""
         def operation(editor):
             section = editor.get_section_by_id(section_id)
             if not section:
@@ -834,33 +1136,46 @@ All operations support both section IDs and heading-based lookups where appropri
                 
             target_section = sections[target_position]
             return editor.move_section(section, target_section, "after")
-            
-        validation_enum = ValidationLevel.NORMAL
-        return self.processor.execute_operation(document_path, operation, auto_save, backup, validation_enum)
+        
+        return operation
     
-    def _get_document_impl(self, document_path: str) -> Dict[str, Any]:
+    def _get_document_impl(self, document_path: DocumentSource) -> Dict[str, Any]:
         """Implementation for get_document tool."""
+        operation = self._get_document_operation()
+        return self._execute_read_only(document_path, operation)
+    
+    def _get_document_operation(self) -> Callable[[SafeMarkdownEditor], Any]:
+        """Build the editor operation for the get_document tool."""
         def operation(editor):
             from .safe_editor_types import EditResult, EditOperation
             
             content = editor.to_markdown()
-            sections = editor.get_sections()
             
-            document_data = {
-                "content": content,
-                "sections": [
-                    {
-                        "id": section.id,
-                        "title": section.title,
-                        "level": section.level,
-                        "start_line": section.line_start,
-                        "end_line": section.line_end
-                    }
-                    for section in sections
-                ],
-                "word_count": len(content.split()),
-                "character_count": len(content)
-            }
+            # Every edit replaces the editor's text object, so an identity
+            # match means nothing changed since the data was built
+            cached = self._document_data_cache.get(editor)
+            if cached is not None and cached[0] is content:
+                document_data = cached[1]
+            else:
+                document_data = {
+                    "content": content,
+                    "sections": [
+                        {
+                            "id": section.id,
+                            "title": section.title,
+                            "level": section.level,
+                            "start_line": section.line_start,
+                            "end_line": section.line_end
+                        }
+                        for section in editor.get_sections()
+                    ],
+                    "word_count": len(content.split()),
+                    "character_count": len(content)
+                }
+                self._document_data_cache[editor] = (content, document_data)
+            
+            # Hand out copies of the section dicts so callers cannot alter the cache
+            document_data = {**document_data, "sections": [dict(section) for section in document_data["sections"]]}
             
             return EditResult(
                 success=True,
@@ -871,9 +1186,9 @@ All operations support both section IDs and heading-based lookups where appropri
                 metadata=document_data
             )
         
-        return self.processor.execute_operation(document_path, operation, auto_save=False)
+        return operation
     
-    def _save_document_impl(self, document_path: str, target_path: Optional[str] = None, backup: bool = True, validation_level: str = "NORMAL") -> Dict[str, Any]:
+    def _save_document_impl(self, document_path: DocumentSource, target_path: Optional[str] = None, backup: bool = True, validation_level: str = "NORMAL") -> Dict[str, Any]:
         """Implementation for save_document tool."""
         try:
             validation_map = {"STRICT": ValidationLevel.STRICT, "NORMAL": ValidationLevel.NORMAL, "PERMISSIVE": ValidationLevel.PERMISSIVE}
@@ -888,8 +1203,13 @@ All operations support both section IDs and heading-based lookups where appropri
         except Exception as e:
             return self.processor.create_error_response(str(e), type(e).__name__)
     
-    def _analyze_document_impl(self, document_path: str) -> Dict[str, Any]:
+    def _analyze_document_impl(self, document_path: DocumentSource) -> Dict[str, Any]:
         """Implementation for analyze_document tool."""
+        operation = self._analyze_document_operation()
+        return self._execute_read_only(document_path, operation)
+    
+    def _analyze_document_operation(self) -> Callable[[SafeMarkdownEditor], Any]:
+        """Build the editor operation for the analyze_document tool."""
         def operation(editor):
             from .safe_editor_types import EditResult, EditOperation
             
@@ -897,7 +1217,6 @@ All operations support both section IDs and heading-based lookups where appropri
             sections = editor.get_sections()
             
             # Basic document analysis
-            lines = content.split('\n')
             word_count = len(content.split())
             char_count = len(content)
             
@@ -913,7 +1232,7 @@ All operations support both section IDs and heading-based lookups where appropri
                     "section_levels": section_levels,
                     "word_count": word_count,
                     "character_count": char_count,
-                    "line_count": len(lines),
+                    "line_count": content.count('\n') + 1,
                     "heading_structure": [
                         {
                             "id": section.id,
@@ -934,13 +1253,34 @@ All operations support both section IDs and heading-based lookups where appropri
                 metadata=analysis_data
             )
         
-        return self.processor.execute_operation(document_path, operation, auto_save=False)
+        return operation
+    
+    # Direct entry points for Python callers, skipping the name-based dispatch
+    # of call_tool_sync; these do not catch argument errors
+    load_document = _load_document_impl
+    list_sections = _list_sections_impl
+    get_section = _get_section_impl
+    insert_section = _insert_section_impl
+    bulk_insert_sections = _bulk_insert_sections_impl
+    update_section = _update_section_impl
+    delete_section = _delete_section_impl
+    move_section = _move_section_impl
+    get_document = _get_document_impl
+    save_document = _save_document_impl
+    analyze_document = _analyze_document_impl
 
 
 # Global instances for backward compatibility and direct usage
 server = MarkdownMCPServer()
-mcp = server.mcp
+
+
+def __getattr__(name: str) -> Any:
+    # The module-level mcp app is built on first access, not on import
+    if name == "mcp":
+        return server.mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
     print("Starting SafeMarkdownEditor MCP Server (Stateless Mode)...")
-    mcp.run()
+    server.mcp.run()
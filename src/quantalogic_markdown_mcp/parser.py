@@ -1,6 +1,6 @@
 """Main parser interface and factory."""
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 import logging
 
 from .parsers import MarkdownItParser
@@ -118,6 +118,30 @@ class QuantalogicMarkdownParser:
 
         return self.renderer.render(ast, format_name, options)
 
+    def render_many(
+        self,
+        ast_or_result: Union[Any, ParseResult],
+        format_names: Iterable[str] = ('html', 'latex', 'json'),
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, str]:
+        """
+        Render AST to several formats from a single parse.
+
+        Args:
+            ast_or_result: AST or ParseResult to render
+            format_names: Output formats
+            options: Format-specific options
+
+        Returns:
+            Mapping of format name to rendered content
+        """
+        if isinstance(ast_or_result, ParseResult):
+            ast = ast_or_result.ast
+        else:
+            ast = ast_or_result
+
+        return self.renderer.render_many(ast, format_names, options)
+
     def parse_and_render(
         self,
         text: str,
@@ -179,7 +203,21 @@ class QuantalogicMarkdownParser:
         Returns:
             List of validation messages
         """
-        result = self.parse(text)
+        return self.validate(self.parse(text))
+
+    def validate(self, result: ParseResult) -> List[str]:
+        """
+        Return the validation issues of an existing parse result.
+
+        Use this instead of validate_markdown when the text has already
+        been parsed, so it is not parsed a second time.
+
+        Args:
+            result: Parse result to validate
+
+        Returns:
+            List of validation messages
+        """
         issues = []
         
         for error in result.errors:
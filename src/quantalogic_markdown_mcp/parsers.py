@@ -8,7 +8,7 @@ from markdown_it.token import Token
 from mdit_py_plugins.footnote import footnote_plugin
 from mdit_py_plugins.front_matter import front_matter_plugin
 
-from .types import ParseResult, ParseError, ErrorLevel
+from .types import Heading, ParseResult, ParseError, ErrorLevel
 
 
 logger = logging.getLogger(__name__)
@@ -64,31 +64,15 @@ class MarkdownItParser:
         Returns:
             ParseResult with tokens, errors, and metadata
         """
-        result = ParseResult(
-            ast=[],
-            errors=[],
-            warnings=[],
-            metadata={
-                'parser': 'markdown-it-py',
-                'preset': self.preset,
-                'plugins': self.plugins
-            },
-            source_text=text
-        )
-
         try:
             # Parse text to tokens
             tokens = self.md.parse(text)
-            result.ast = tokens
-            result.metadata['token_count'] = len(tokens)
-
-            # Validate token structure
-            validation_errors = self._validate_tokens(tokens, text)
-            result.errors.extend(validation_errors)
+            result = self.build_result(tokens, text)
 
             logger.info(f"Parsed {len(tokens)} tokens with {len(result.errors)} errors")
 
         except Exception as e:
+            result = self._empty_result(text)
             error = ParseError(
                 message=f"Parsing failed: {str(e)}",
                 level=ErrorLevel.CRITICAL
@@ -98,13 +82,60 @@ class MarkdownItParser:
 
         return result
 
-    def _validate_tokens(self, tokens: List[Token], source_text: str) -> List[ParseError]:
+    def build_result(self, tokens: List[Token], text: str) -> ParseResult:
+        """
+        Wrap tokens already parsed from text in a validated ParseResult.
+
+        Used by parse() and by callers that assemble the token stream of an
+        edited document from pieces parsed separately.
+
+        Args:
+            tokens: Tokens for the whole of text
+            text: Markdown text the tokens describe
+
+        Returns:
+            ParseResult with tokens, errors, and metadata
+        """
+        result = self._empty_result(text)
+        result.ast = tokens
+        result.metadata['token_count'] = len(tokens)
+
+        # Validate token structure, collecting the headings in the same pass
+        headings: List[Heading] = []
+        validation_errors = self._validate_tokens(tokens, text, headings)
+        result.errors.extend(validation_errors)
+        result._headings = headings
+
+        return result
+
+    def _empty_result(self, text: str) -> ParseResult:
+        """Create a ParseResult for text with no tokens yet."""
+        return ParseResult(
+            ast=[],
+            errors=[],
+            warnings=[],
+            metadata={
+                'parser': 'markdown-it-py',
+                'preset': self.preset,
+                'plugins': self.plugins
+            },
+            source_text=text
+        )
+
+    def _validate_tokens(
+        self,
+        tokens: List[Token],
+        source_text: str,
+        headings: Optional[List[Heading]] = None
+    ) -> List[ParseError]:
         """
         Validate token structure and detect issues.
 
         Args:
             tokens: List of tokens to validate
             source_text: Original source text
+            headings: If given, a Heading for each heading is appended to it
+                while the tokens are walked
 
         Returns:
             List of validation errors
@@ -112,8 +143,24 @@ class MarkdownItParser:
         errors = []
         nesting_stack = []
         source_lines = source_text.splitlines()
+        heading_open = None
+        heading_content = ''
 
         for i, token in enumerate(tokens):
+            if headings is not None:
+                if token.type == 'heading_open':
+                    heading_open = token
+                    heading_content = ''
+                elif token.type == 'inline' and heading_open is not None:
+                    heading_content = token.content
+                elif token.type == 'heading_close' and heading_open is not None:
+                    headings.append(Heading(
+                        level=int(heading_open.tag[1]) if heading_open.tag.startswith('h') else 1,
+                        content=heading_content,
+                        line=heading_open.map[0] + 1 if heading_open.map else None
+                    ))
+                    heading_open = None
+
             # Check line mapping
             if token.map and len(token.map) >= 2:
                 line_start, line_end = token.map[0], token.map[1]
@@ -1,7 +1,7 @@
 """Rendering implementations for different output formats."""
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
@@ -371,6 +371,38 @@ class MultiFormatRenderer:
         renderer = self.renderers[format_name.lower()]
         return renderer.render(ast, options)
 
+    def render_many(
+        self,
+        ast: Any,
+        format_names: Iterable[str],
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, str]:
+        """
+        Render the same AST to several formats.
+
+        Every format is checked before anything is rendered, so an unsupported
+        name fails fast instead of after the other outputs have been built.
+
+        Args:
+            ast: AST to render
+            format_names: Target formats, in the order they should be rendered
+            options: Format-specific options passed to every renderer
+
+        Returns:
+            Mapping of each requested format name to its rendered content
+
+        Raises:
+            ValueError: If any format is not supported
+        """
+        renderers = {}
+        for format_name in format_names:
+            if format_name.lower() not in self.renderers:
+                supported = ', '.join(self.renderers.keys())
+                raise ValueError(f"Unsupported format '{format_name}'. Supported: {supported}")
+            renderers[format_name] = self.renderers[format_name.lower()]
+
+        return {name: renderer.render(ast, options) for name, renderer in renderers.items()}
+
     def get_supported_formats(self) -> List[str]:
         """Return list of supported output formats."""
         return list(self.renderers.keys())
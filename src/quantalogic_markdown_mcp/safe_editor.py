@@ -1,9 +1,11 @@
 """Safe Markdown Editor - Main implementation."""
 
 import re
+import sys
 import threading 
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from .ast_utils import ASTWrapper
 from .parser import QuantalogicMarkdownParser
@@ -16,9 +18,98 @@ from .safe_editor_types import (
     ErrorCategory,
     SafeParseError,
     SectionReference,
+    TextDelta,
     ValidationLevel,
 )
-from .types import ErrorLevel
+from .types import ErrorLevel, ParseResult
+
+
+# Titles up to this length are interned so equality checks against other
+# interned titles reduce to an identity check; longer ones are left alone
+_MAX_INTERNED_TITLE_LENGTH = 64
+
+# An ATX heading line: the run of #s and the title after it
+_HEADING_LINE_RE = re.compile(r'^(#+)\s*(.*)$')
+
+# Top-level fences and HTML blocks can run past the next heading, so a region
+# containing one is never reparsed on its own
+_OPEN_ENDED_BLOCK_RE = re.compile(r'^ {0,3}(?:```|~~~|<)', re.MULTILINE)
+
+# Markup that makes content more than plain prose: block-level headings,
+# fences, quotes, reference definitions, and inline HTML or links
+_MARKUP_RE = re.compile(r'^[ \t]*(?:#|```|~~~|>|\[[^\]\n]*\]:)|<[a-zA-Z/!]|\]\(', re.MULTILINE)
+
+# A run of whitespace-only lines, each with its newline
+_BLANK_LINES_RE = re.compile(r'(?:[^\S\n]*\n)*')
+
+# Parsers keep no per-document state, so editors share one unless given their own
+_DEFAULT_PARSER = QuantalogicMarkdownParser()
+
+
+def _looks_like_plain_text(text: str) -> bool:
+    """Return True if text has none of the markup a validating parse could object to."""
+    return _MARKUP_RE.search(text) is None
+
+
+def _line_offsets(text: str) -> List[int]:
+    """Return the start offset of every line in text."""
+    offsets = [0]
+    find = text.find
+    position = find('\n')
+    while position != -1:
+        offsets.append(position + 1)
+        position = find('\n', position + 1)
+    return offsets
+
+
+def _common_prefix_length(a: str, b: str, limit: int) -> int:
+    """Length of the common prefix of a and b, at most limit; O(limit)."""
+    low, high = 0, limit
+    while low < high:
+        # Only the part past the known common prefix needs comparing
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of a and b, at most limit; O(limit)."""
+    low, high = 0, limit
+    a_end, b_end = len(a), len(b)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[a_end - mid:a_end - low] == b[b_end - mid:b_end - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _text_delta(old_text: str, new_text: str) -> TextDelta:
+    """
+    Return the TextDelta that turns new_text back into old_text.
+    
+    Only the lines between the unchanged text at either end are split, so an
+    edit to a large document costs two string comparisons plus the size of
+    the edit rather than a list of every line in both texts.
+    """
+    shorter = min(len(old_text), len(new_text))
+    # Back up to the start of the line the texts first differ in
+    start = old_text.rfind('\n', 0, _common_prefix_length(old_text, new_text, shorter)) + 1
+    old_stop = old_text.find('\n', len(old_text) - _common_suffix_length(old_text, new_text, shorter - start))
+    if old_stop == -1:
+        old_stop = len(old_text)
+    new_stop = old_stop + len(new_text) - len(old_text)
+    
+    delta = TextDelta.between(old_text[start:old_stop], new_text[start:new_stop])
+    return TextDelta(
+        start_line=old_text.count('\n', 0, start) + delta.start_line,
+        old_text=delta.old_text,
+        new_line_count=delta.new_line_count
+    )
 
 
 class DocumentStructureError(Exception):
@@ -26,6 +117,86 @@ class DocumentStructureError(Exception):
     pass
 
 
+class _LockSide:
+    """Context manager for one side (read or write) of a _ReadWriteLock."""
+    
+    __slots__ = ("_acquire", "_release")
+    
+    def __init__(self, acquire: Callable[[], None], release: Callable[[], None]) -> None:
+        self._acquire = acquire
+        self._release = release
+    
+    def __enter__(self) -> None:
+        self._acquire()
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self._release()
+
+
+class _ReadWriteLock:
+    """
+    Reader-writer lock: readers share it, a writer holds it alone.
+    
+    Both sides are reentrant per thread, and a thread holding the write lock
+    may also take the read lock, so mutators can call the read accessors.
+    Upgrading from read to write is not supported. Waiting writers block new
+    readers so a steady stream of reads cannot starve edits.
+    """
+    
+    def __init__(self) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._write_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+        self.read_lock = _LockSide(self._acquire_read, self._release_read)
+        self.write_lock = _LockSide(self._acquire_write, self._release_write)
+    
+    def _acquire_read(self) -> None:
+        depth = getattr(self._local, "read_depth", 0)
+        if depth or self._writer == threading.get_ident():
+            # Nested inside a read or write this thread already holds
+            self._local.read_depth = depth + 1
+            return
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        self._local.read_depth = 1
+    
+    def _release_read(self) -> None:
+        depth = self._local.read_depth - 1
+        self._local.read_depth = depth
+        if depth or self._writer == threading.get_ident():
+            return
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+    
+    def _acquire_write(self) -> None:
+        me = threading.get_ident()
+        if self._writer == me:
+            self._write_depth += 1
+            return
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = me
+        self._write_depth = 1
+    
+    def _release_write(self) -> None:
+        self._write_depth -= 1
+        if self._write_depth:
+            return
+        with self._condition:
+            self._writer = None
+            self._condition.notify_all()
+
+
 class SafeMarkdownEditor:
     """
     Thread-safe, atomic Markdown editor with comprehensive validation.
@@ -38,10 +209,14 @@ class SafeMarkdownEditor:
     - Preview functionality for all operations
     """
     
+    # Recently parsed texts kept for previews, applies and rollbacks
+    PARSE_CACHE_SIZE = 8
+    
     def __init__(self, 
                  markdown_text: str,
                  validation_level: ValidationLevel = ValidationLevel.NORMAL,
-                 max_transaction_history: int = 100) -> None:
+                 max_transaction_history: int = 100,
+                 parser: Optional[QuantalogicMarkdownParser] = None) -> None:
         """
         Initialize safe markdown editor.
         
@@ -49,24 +224,26 @@ class SafeMarkdownEditor:
             markdown_text: Initial markdown document content
             validation_level: Strictness of validation (STRICT, NORMAL, PERMISSIVE)
             max_transaction_history: Maximum number of transactions to retain
+            parser: Parser to use; defaults to one shared by all editors
             
         Raises:
             ValueError: If markdown_text contains critical parsing errors
             DocumentStructureError: If document structure is invalid
         """
-        self._lock = threading.RLock()  # Reentrant lock for thread safety
+        self._lock = _ReadWriteLock()  # Shared for reads, exclusive for edits
         self._validation_level = validation_level
         self._max_transaction_history = max_transaction_history
         
-        # Initialize parser
-        self._parser = QuantalogicMarkdownParser()
+        self._parser = parser or _DEFAULT_PARSER
         
         # Store initial state
         self._original_text = markdown_text
         self._current_text = markdown_text
         
         # Parse and validate initial document
-        self._current_result = self._parser.parse(markdown_text)
+        self._parse_cache: "OrderedDict[str, ParseResult]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        self._current_result = self._parse(markdown_text)
         if self._current_result.has_errors:
             critical_errors = [e for e in self._current_result.errors 
                              if e.level == ErrorLevel.CRITICAL]
@@ -75,6 +252,20 @@ class SafeMarkdownEditor:
         
         self._wrapper = ASTWrapper(self._current_result)
         
+        # Section references are rebuilt lazily, once per parsed document state
+        self._section_cache: List[SectionReference] = []
+        self._sections_by_level: Dict[int, List[SectionReference]] = {}
+        self._sections_by_id: Dict[str, SectionReference] = {}
+        self._sections_by_title: Dict[str, SectionReference] = {}
+        self._section_cache_wrapper: Optional[ASTWrapper] = None
+        
+        # Line start offsets, rebuilt lazily whenever the text is replaced
+        self._line_offsets: List[int] = []
+        self._line_offsets_text: Optional[str] = None
+        
+        # Rendered HTML and the parse result it came from, rebuilt lazily
+        self._html_cache: Optional[Tuple[ParseResult, str]] = None
+        
         # Transaction and state management
         self._transaction_history: List[EditTransaction] = []
         self._version = 1
@@ -82,7 +273,10 @@ class SafeMarkdownEditor:
         
         # Validate initial structure
         if validation_level in [ValidationLevel.STRICT, ValidationLevel.NORMAL]:
-            structure_errors = self._validate_document_structure()
+            # Only strict validation reports the errors, so otherwise stop at the first
+            structure_errors = self._validate_document_structure(
+                fail_fast=validation_level != ValidationLevel.STRICT
+            )
             if structure_errors and validation_level == ValidationLevel.STRICT:
                 raise DocumentStructureError(f"Invalid document structure: {structure_errors}")
     
@@ -96,8 +290,8 @@ class SafeMarkdownEditor:
         Complexity: O(n) where n is number of headings
         Thread Safety: Safe for concurrent access
         """
-        with self._lock:
-            return self._build_section_references()
+        with self._lock.read_lock:
+            return list(self._get_section_snapshot())
     
     def get_section_by_id(self, section_id: str) -> Optional[SectionReference]:
         """
@@ -109,14 +303,27 @@ class SafeMarkdownEditor:
         Returns:
             SectionReference if found, None otherwise
             
-        Complexity: O(n) where n is number of sections
+        Complexity: O(1) once the section snapshot is built
         """
-        with self._lock:
-            sections = self._build_section_references()
-            for section in sections:
-                if section.id == section_id:
-                    return section
-            return None
+        with self._lock.read_lock:
+            self._get_section_snapshot()
+            return self._sections_by_id.get(section_id)
+    
+    def get_section_by_title(self, title: str) -> Optional[SectionReference]:
+        """
+        Find the first section with the given heading text.
+        
+        Args:
+            title: Exact section heading text
+            
+        Returns:
+            SectionReference if found, None otherwise
+            
+        Complexity: O(1) once the section snapshot is built
+        """
+        with self._lock.read_lock:
+            self._get_section_snapshot()
+            return self._sections_by_title.get(title)
     
     def get_sections_by_level(self, level: int) -> List[SectionReference]:
         """
@@ -128,15 +335,17 @@ class SafeMarkdownEditor:
         Returns:
             List of sections at specified level
             
+        Complexity: O(k) where k is number of sections at the level
+            
         Raises:
             ValueError: If level not in range 1-6
         """
         if not (1 <= level <= 6):
             raise ValueError(f"Heading level must be between 1 and 6, got {level}")
         
-        with self._lock:
-            sections = self._build_section_references()
-            return [s for s in sections if s.level == level]
+        with self._lock.read_lock:
+            self._get_section_snapshot()
+            return list(self._sections_by_level.get(level, []))
     
     def get_child_sections(self, parent: SectionReference) -> List[SectionReference]:
         """
@@ -148,8 +357,8 @@ class SafeMarkdownEditor:
         Returns:
             List of immediate child sections
         """
-        with self._lock:
-            sections = self._build_section_references()
+        with self._lock.read_lock:
+            sections = self._get_section_snapshot()
             children = []
             
             for section in sections:
@@ -173,27 +382,110 @@ class SafeMarkdownEditor:
     
     def to_markdown(self) -> str:
         """Get current document as markdown string."""
-        with self._lock:
+        with self._lock.read_lock:
             return self._current_text
     
+    def copy(self, with_history: bool = True) -> 'SafeMarkdownEditor':
+        """
+        Create an independent editor for the current document state.
+        
+        The copy shares the parse result and section snapshot, which edits
+        replace rather than mutate, so no reparse is needed. The parse cache
+        is shared too, so texts parsed by one editor are reused by the other. It gets its own
+        lock and transaction history; edits to either editor do not affect
+        the other.
+        
+        Args:
+            with_history: Whether the copy keeps the transaction history and
+                version. If False, it starts as an editor newly created from
+                the current text would: version 1, no history to roll back.
+        
+        Returns:
+            New SafeMarkdownEditor with the same content and settings
+            
+        Complexity: O(h) where h is the transaction history length
+        """
+        with self._lock.read_lock:
+            clone = self.__class__.__new__(self.__class__)
+            clone.__dict__.update(self.__dict__)
+            clone._lock = _ReadWriteLock()
+            if with_history:
+                clone._transaction_history = list(self._transaction_history)
+            else:
+                clone._transaction_history = []
+                clone._version = 1
+                clone._original_text = self._current_text
+            return clone
+    
+    def get_line_count(self) -> int:
+        """Get the number of lines in the current document."""
+        with self._lock.read_lock:
+            return len(self._get_line_offsets())
+    
+    def get_line(self, line_number: int) -> str:
+        """
+        Get a single line of the current document without splitting it.
+        
+        Args:
+            line_number: Line number (0-indexed), as in SectionReference.line_start
+            
+        Returns:
+            The line text without its trailing newline
+            
+        Raises:
+            IndexError: If line_number is out of range
+            
+        Complexity: O(1) after the line offsets are built once per edit
+        """
+        with self._lock.read_lock:
+            offsets = self._get_line_offsets()
+            if not 0 <= line_number < len(offsets):
+                raise IndexError(f"Line {line_number} out of range (0-{len(offsets) - 1})")
+            start = offsets[line_number]
+            if line_number + 1 < len(offsets):
+                return self._current_text[start:offsets[line_number + 1] - 1]
+            return self._current_text[start:]
+    
+    def get_section_markdown(self, section_ref: SectionReference) -> str:
+        """
+        Get the markdown of one section, heading included, without splitting the document.
+        
+        Args:
+            section_ref: Section to extract, as returned by get_sections
+            
+        Returns:
+            Lines line_start to line_end of the section, joined by newlines
+            
+        Raises:
+            IndexError: If the section's lines are outside the current document
+            
+        Complexity: O(section length) after the line offsets are built once per edit
+        """
+        with self._lock.read_lock:
+            offsets = self._get_line_offsets()
+            start_line, end_line = section_ref.line_start, section_ref.line_end
+            if not 0 <= start_line <= end_line < len(offsets):
+                raise IndexError(f"Lines {start_line}-{end_line} out of range (0-{len(offsets) - 1})")
+            start = offsets[start_line]
+            if end_line + 1 < len(offsets):
+                return self._current_text[start:offsets[end_line + 1] - 1]
+            return self._current_text[start:]
+    
     def get_statistics(self) -> DocumentStatistics:
         """Get comprehensive document statistics."""
-        with self._lock:
-            lines = self._current_text.split('\n')
-            sections = self._build_section_references()
+        with self._lock.read_lock:
+            sections = self._get_section_snapshot()
             
-            # Calculate section distribution by level
-            section_distribution = {}
-            for section in sections:
-                level = section.level
-                section_distribution[level] = section_distribution.get(level, 0) + 1
+            # The snapshot already buckets sections by level, so the distribution
+            # and the deepest level come from the buckets instead of the sections
+            section_distribution = {level: len(bucket) for level, bucket in self._sections_by_level.items()}
             
             return DocumentStatistics(
                 total_sections=len(sections),
                 word_count=len(self._current_text.split()),
                 character_count=len(self._current_text),
-                line_count=len(lines),
-                max_heading_depth=max([s.level for s in sections]) if sections else 0,
+                line_count=self._current_text.count('\n') + 1,
+                max_heading_depth=max(section_distribution, default=0),
                 edit_count=len(self._transaction_history),
                 section_distribution=section_distribution,
                 last_modified=self._last_modified
@@ -205,15 +497,33 @@ class SafeMarkdownEditor:
         
         Args:
             operation: Type of operation to preview
-            **params: Operation-specific parameters
+            **params: Operation-specific parameters. Pass scope="section" to
+                preview only the lines the operation writes: the preview is
+                then that fragment, validated on its own, and metadata holds
+                the replaced text under "before_fragment".
             
         Returns:
             EditResult with preview content and validation results
         """
-        with self._lock:
+        with self._lock.read_lock:
             try:
+                scope = params.get('scope', 'document')
+                if scope not in ('document', 'section'):
+                    return EditResult(
+                        success=False,
+                        operation=operation,
+                        modified_sections=(),
+                        errors=[SafeParseError(
+                            message=f"Invalid preview scope '{scope}': use 'document' or 'section'",
+                            error_code="INVALID_SCOPE",
+                            category=ErrorCategory.OPERATION
+                        )],
+                        warnings=()
+                    )
+                
                 # Create a copy of the current state for preview
                 preview_text = self._current_text
+                metadata = {}
                 
                 if operation == EditOperation.UPDATE_SECTION:
                     section_ref = params.get('section_ref')
@@ -222,27 +532,27 @@ class SafeMarkdownEditor:
                         return EditResult(
                             success=False,
                             operation=operation,
-                            modified_sections=[],
+                            modified_sections=(),
                             errors=[SafeParseError(
                                 message="Missing required parameters: section_ref and content",
                                 error_code="MISSING_PARAMS",
                                 category=ErrorCategory.OPERATION
                             )],
-                            warnings=[]
+                            warnings=()
                         )
                     
-                    # Preview the section update
-                    lines = preview_text.split('\n')
-                    start_line = section_ref.line_start
-                    end_line = section_ref.line_end
+                    if scope == 'section':
+                        # Rebuild only the section: its heading followed by the new content
+                        metadata = {"scope": scope, "before_fragment": self.get_section_markdown(section_ref)}
+                        preview_text = self.get_line(section_ref.line_start) + '\n' + content
+                        return self._preview_result(operation, self._parse_fragment(preview_text, content),
+                                                    preview_text, metadata)
                     
-                    # Replace content while preserving heading
-                    if start_line < len(lines):
-                        new_content_lines = content.split('\n')
-                        new_lines = (lines[:start_line + 1] + 
-                                   new_content_lines + 
-                                   lines[end_line + 1:])
-                        preview_text = '\n'.join(new_lines)
+                    # Preview the section update exactly as update_section_content writes it
+                    if section_ref.line_start < len(self._get_line_offsets()):
+                        preview_text = self._updated_section_text(
+                            section_ref, content, params.get('preserve_subsections', False)
+                        )
                 
                 elif operation == EditOperation.INSERT_SECTION:
                     after_section = params.get('after_section')
@@ -254,17 +564,16 @@ class SafeMarkdownEditor:
                         return EditResult(
                             success=False,
                             operation=operation,
-                            modified_sections=[],
+                            modified_sections=(),
                             errors=[SafeParseError(
                                 message="Missing required parameters: after_section, level, title",
                                 error_code="MISSING_PARAMS",
                                 category=ErrorCategory.OPERATION
                             )],
-                            warnings=[]
+                            warnings=()
                         )
                     
                     # Preview section insertion
-                    lines = preview_text.split('\n')
                     insert_line = after_section.line_end + 1
                     
                     new_section_lines = [
@@ -274,47 +583,68 @@ class SafeMarkdownEditor:
                         ""
                     ]
                     
-                    new_lines = (lines[:insert_line] + 
-                               new_section_lines + 
-                               lines[insert_line:])
-                    preview_text = '\n'.join(new_lines)
+                    if scope == 'section':
+                        # Only the inserted lines are new; nothing is replaced
+                        metadata = {"scope": scope, "before_fragment": ""}
+                        preview_text = '\n'.join(new_section_lines)
+                        return self._preview_result(operation, self._parse_fragment(preview_text, content),
+                                                    preview_text, metadata)
+                    
+                    preview_text = self._splice_lines(insert_line, insert_line, new_section_lines)
                 
                 # Validate the preview
-                preview_result = self._parser.parse(preview_text)
-                validation_errors = []
-                
-                if preview_result.has_errors:
-                    for error in preview_result.errors:
-                        validation_errors.append(SafeParseError(
-                            message=error.message,
-                            line_number=error.line_number,
-                            level=error.level,
-                            error_code="PREVIEW_VALIDATION",
-                            category=ErrorCategory.VALIDATION
-                        ))
-                
-                return EditResult(
-                    success=len(validation_errors) == 0,
-                    operation=operation,
-                    modified_sections=[],  # Preview doesn't modify anything yet
-                    errors=validation_errors,
-                    warnings=[],
-                    preview=preview_text
-                )
+                return self._preview_result(operation, self._parse(preview_text), preview_text, metadata)
                 
             except Exception as e:
                 return EditResult(
                     success=False,
                     operation=operation,
-                    modified_sections=[],
+                    modified_sections=(),
                     errors=[SafeParseError(
                         message=f"Preview operation failed: {str(e)}",
                         error_code="PREVIEW_ERROR",
                         category=ErrorCategory.SYSTEM
                     )],
-                    warnings=[]
+                    warnings=()
                 )
     
+    def _parse_fragment(self, fragment: str, content: str) -> Optional[ParseResult]:
+        """
+        Parse a section fragment built around content, to validate it.
+        
+        Returns None without parsing when content is plain prose: a heading
+        followed by paragraphs always parses cleanly, and the whole document
+        is parsed again when the edit is applied anyway.
+        """
+        if _looks_like_plain_text(content):
+            return None
+        return self._parser.parse(fragment)
+    
+    def _preview_result(self, operation: EditOperation, parse_result: Optional[ParseResult],
+                        preview_text: str, metadata: Dict[str, Any]) -> EditResult:
+        """Build a preview EditResult, reporting the preview's parse errors, if it was parsed."""
+        validation_errors = []
+        
+        if parse_result is not None and parse_result.has_errors:
+            for error in parse_result.errors:
+                validation_errors.append(SafeParseError(
+                    message=error.message,
+                    line_number=error.line_number,
+                    level=error.level,
+                    error_code="PREVIEW_VALIDATION",
+                    category=ErrorCategory.VALIDATION
+                ))
+        
+        return EditResult(
+            success=len(validation_errors) == 0,
+            operation=operation,
+            modified_sections=(),  # Preview doesn't modify anything yet
+            errors=validation_errors,
+            warnings=(),
+            preview=preview_text,
+            metadata=metadata
+        )
+    
     def update_section_content(self, section_ref: SectionReference, content: str,
                              preserve_subsections: bool = True) -> EditResult:
         """
@@ -328,13 +658,14 @@ class SafeMarkdownEditor:
         Returns:
             EditResult with operation status and details
         """
-        with self._lock:
+        with self._lock.write_lock:
             try:
                 # First validate the operation
                 preview_result = self.preview_operation(
                     EditOperation.UPDATE_SECTION,
                     section_ref=section_ref,
-                    content=content
+                    content=content,
+                    preserve_subsections=preserve_subsections
                 )
                 
                 if not preview_result.success:
@@ -349,50 +680,21 @@ class SafeMarkdownEditor:
                 }])
                 
                 # Apply the changes
-                lines = self._current_text.split('\n')
-                start_line = section_ref.line_start
-                end_line = section_ref.line_end
-                
-                if preserve_subsections:
-                    # Find where section content ends and subsections begin
-                    section_content_end = self._find_section_content_end(section_ref)
-                    end_line = section_content_end
-                
-                # Replace content while preserving heading
-                if start_line < len(lines):
-                    new_content_lines = content.split('\n')
-                    
-                    # Check if the new content starts with a duplicate header
-                    # If so, remove it to prevent duplication
-                    if new_content_lines and new_content_lines[0].strip():
-                        first_line = new_content_lines[0]
-                        expected_header = "#" * section_ref.level + " " + section_ref.title
-                        # Only remove if it's an EXACT match (including spacing)
-                        if first_line == expected_header:
-                            # Skip the duplicate header and any following empty lines
-                            skip_lines = 1
-                            while (skip_lines < len(new_content_lines) and 
-                                   not new_content_lines[skip_lines].strip()):
-                                skip_lines += 1
-                            new_content_lines = new_content_lines[skip_lines:]
-                    
-                    new_lines = (lines[:start_line + 1] + 
-                               new_content_lines + 
-                               lines[end_line + 1:])
-                    
-                    # Update state
-                    self._current_text = '\n'.join(new_lines)
-                    self._current_result = self._parser.parse(self._current_text)
+                if section_ref.line_start < len(self._get_line_offsets()):
+                    # The preview built and parsed exactly the updated text, so reuse it
+                    new_text = preview_result.preview
+                    assert new_text is not None  # A successful preview always carries its text
+                    self._current_text = new_text
+                    self._current_result = self._parse(new_text)
                     self._wrapper = ASTWrapper(self._current_result)
                     self._last_modified = datetime.now()
                     self._version += 1
                     
                     # Add transaction to history
-                    self._transaction_history.append(transaction)
-                    self._trim_transaction_history()
+                    self._commit_transaction(transaction)
                     
                     # Get updated section reference
-                    updated_sections = self._build_section_references()
+                    updated_sections = self._get_section_snapshot()
                     updated_section = None
                     for section in updated_sections:
                         if section.title == section_ref.title and section.level == section_ref.level:
@@ -402,9 +704,9 @@ class SafeMarkdownEditor:
                     return EditResult(
                         success=True,
                         operation=EditOperation.UPDATE_SECTION,
-                        modified_sections=[updated_section] if updated_section else [],
-                        errors=[],
-                        warnings=[],
+                        modified_sections=[updated_section] if updated_section else (),
+                        errors=(),
+                        warnings=(),
                         metadata={
                             'transaction_id': transaction.transaction_id,
                             'version': self._version,
@@ -415,26 +717,26 @@ class SafeMarkdownEditor:
                 return EditResult(
                     success=False,
                     operation=EditOperation.UPDATE_SECTION,
-                    modified_sections=[],
+                    modified_sections=(),
                     errors=[SafeParseError(
                         message="Section not found or invalid line range",
                         error_code="SECTION_NOT_FOUND",
                         category=ErrorCategory.OPERATION
                     )],
-                    warnings=[]
+                    warnings=()
                 )
                 
             except Exception as e:
                 return EditResult(
                     success=False,
                     operation=EditOperation.UPDATE_SECTION,
-                    modified_sections=[],
+                    modified_sections=(),
                     errors=[SafeParseError(
                         message=f"Update operation failed: {str(e)}",
                         error_code="UPDATE_ERROR",
                         category=ErrorCategory.SYSTEM
                     )],
-                    warnings=[]
+                    warnings=()
                 )
     
     def insert_section_after(self, 
@@ -456,35 +758,35 @@ class SafeMarkdownEditor:
         Returns:
             EditResult with new section reference in modified_sections
         """
-        with self._lock:
+        with self._lock.write_lock:
             try:
                 # Validate parameters
                 if not (1 <= level <= 6):
                     return EditResult(
                         success=False,
                         operation=EditOperation.INSERT_SECTION,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message=f"Invalid heading level: {level}. Must be between 1 and 6.",
                             error_code="INVALID_LEVEL",
                             category=ErrorCategory.VALIDATION,
                             suggestions=["Use a heading level between 1 and 6"]
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 if not title.strip():
                     return EditResult(
                         success=False,
                         operation=EditOperation.INSERT_SECTION,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message="Section title cannot be empty",
                             error_code="EMPTY_TITLE",
                             category=ErrorCategory.VALIDATION,
                             suggestions=["Provide a non-empty title for the section"]
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 # Auto-adjust level if requested
@@ -520,36 +822,23 @@ class SafeMarkdownEditor:
                     'auto_adjust_level': auto_adjust_level
                 }])
                 
-                # Apply the changes
-                lines = self._current_text.split('\n')
+                # Apply the changes; the preview already built and parsed the new text
                 insert_line = after_section.line_end + 1
                 
-                # Create new section lines
-                new_section_lines = [
-                    f"{'#' * level} {title}",
-                    "",
-                    content,
-                    ""
-                ]
-                
-                # Insert the new section
-                new_lines = (lines[:insert_line] + 
-                           new_section_lines + 
-                           lines[insert_line:])
-                
                 # Update state
-                self._current_text = '\n'.join(new_lines)
-                self._current_result = self._parser.parse(self._current_text)
+                new_text = preview_result.preview
+                assert new_text is not None  # A successful preview always carries its text
+                self._current_text = new_text
+                self._current_result = self._parse(new_text)
                 self._wrapper = ASTWrapper(self._current_result)
                 self._last_modified = datetime.now()
                 self._version += 1
                 
                 # Add transaction to history
-                self._transaction_history.append(transaction)
-                self._trim_transaction_history()
+                self._commit_transaction(transaction)
                 
                 # Find the newly created section
-                updated_sections = self._build_section_references()
+                updated_sections = self._get_section_snapshot()
                 new_section = None
                 for section in updated_sections:
                     if (section.title == title and 
@@ -561,9 +850,9 @@ class SafeMarkdownEditor:
                 return EditResult(
                     success=True,
                     operation=EditOperation.INSERT_SECTION,
-                    modified_sections=[new_section] if new_section else [],
-                    errors=[],
-                    warnings=[],
+                    modified_sections=[new_section] if new_section else (),
+                    errors=(),
+                    warnings=(),
                     metadata={
                         'transaction_id': transaction.transaction_id,
                         'version': self._version,
@@ -576,13 +865,167 @@ class SafeMarkdownEditor:
                 return EditResult(
                     success=False,
                     operation=EditOperation.INSERT_SECTION,
-                    modified_sections=[],
+                    modified_sections=(),
                     errors=[SafeParseError(
                         message=f"Insert section operation failed: {str(e)}",
                         error_code="INSERT_ERROR",
                         category=ErrorCategory.SYSTEM
                     )],
-                    warnings=[]
+                    warnings=()
+                )
+    
+    def insert_sections_after(self,
+                              after_section: SectionReference,
+                              sections: List[Dict[str, Any]],
+                              auto_adjust_level: bool = True) -> EditResult:
+        """
+        Insert several new sections, in order, after specified section.
+        
+        The sections keep their given order at the end of after_section. With
+        auto_adjust_level, each level is adjusted as insert_section_after would
+        adjust it against the section the entry lands in: after_section, with
+        the entries already placed under it counting as its children, or the
+        previous entry once an entry closes after_section. The document is
+        re-parsed once and the whole block is recorded as one transaction, so
+        a single rollback removes it.
+        
+        Args:
+            after_section: Reference section for insertion point
+            sections: Dicts with 'level', 'title' and optional 'content' keys
+            auto_adjust_level: Auto-adjust levels to maintain hierarchy
+        
+        Returns:
+            EditResult with the new section references in modified_sections
+        """
+        with self._lock.write_lock:
+            try:
+                # Validate every section before touching the document
+                for index, section in enumerate(sections):
+                    level = section.get('level')
+                    title = section.get('title', '')
+                    if not isinstance(level, int) or not (1 <= level <= 6):
+                        return EditResult(
+                            success=False,
+                            operation=EditOperation.INSERT_SECTION,
+                            modified_sections=(),
+                            errors=[SafeParseError(
+                                message=f"Invalid heading level for section {index}: {level}. Must be between 1 and 6.",
+                                error_code="INVALID_LEVEL",
+                                category=ErrorCategory.VALIDATION,
+                                suggestions=["Use a heading level between 1 and 6"]
+                            )],
+                            warnings=()
+                        )
+                    if not title.strip():
+                        return EditResult(
+                            success=False,
+                            operation=EditOperation.INSERT_SECTION,
+                            modified_sections=(),
+                            errors=[SafeParseError(
+                                message=f"Section title cannot be empty (section {index})",
+                                error_code="EMPTY_TITLE",
+                                category=ErrorCategory.VALIDATION,
+                                suggestions=["Provide a non-empty title for the section"]
+                            )],
+                            warnings=()
+                        )
+                
+                # Level of the section each entry lands in, and of its shallowest child so far
+                parent_level = after_section.level
+                child_level = None
+                if auto_adjust_level:
+                    child_sections = self.get_child_sections(after_section)
+                    if child_sections:
+                        child_level = min(s.level for s in child_sections)
+                
+                operations = []
+                new_section_lines = []
+                for section in sections:
+                    level = section['level']
+                    if auto_adjust_level:
+                        if child_level is not None:
+                            level = max(parent_level + 1, child_level)
+                        else:
+                            level = min(level, parent_level + 1)
+                        if level > parent_level:
+                            child_level = level if child_level is None else min(child_level, level)
+                        else:
+                            # This entry closes the parent, so the entries after it nest under it
+                            parent_level, child_level = level, None
+                    title = section['title']
+                    content = section.get('content', '')
+                    operations.append({
+                        'operation': EditOperation.INSERT_SECTION,
+                        'after_section': after_section,
+                        'level': level,
+                        'title': title,
+                        'content': content,
+                        'auto_adjust_level': auto_adjust_level
+                    })
+                    new_section_lines.extend([f"{'#' * level} {title}", "", content, ""])
+                
+                insert_line = after_section.line_end + 1
+                new_text = self._splice_lines(insert_line, insert_line, new_section_lines)
+                
+                # Parse once; the result both validates the edit and becomes the new state
+                new_result = self._parse(new_text)
+                if new_result.has_errors:
+                    return EditResult(
+                        success=False,
+                        operation=EditOperation.INSERT_SECTION,
+                        modified_sections=(),
+                        errors=[SafeParseError(
+                            message=error.message,
+                            line_number=error.line_number,
+                            level=error.level,
+                            error_code="PREVIEW_VALIDATION",
+                            category=ErrorCategory.VALIDATION
+                        ) for error in new_result.errors],
+                        warnings=(),
+                        preview=new_text
+                    )
+                
+                transaction = self._create_transaction(operations)
+                
+                # Update state
+                self._current_text = new_text
+                self._current_result = new_result
+                self._wrapper = ASTWrapper(self._current_result)
+                self._last_modified = datetime.now()
+                self._version += 1
+                
+                self._commit_transaction(transaction)
+                
+                # The new sections are the headings inside the inserted block
+                block_end = insert_line + len(new_section_lines)
+                new_sections = [section for section in self._get_section_snapshot()
+                                if insert_line <= section.line_start < block_end]
+                
+                return EditResult(
+                    success=True,
+                    operation=EditOperation.INSERT_SECTION,
+                    modified_sections=new_sections,
+                    errors=(),
+                    warnings=(),
+                    metadata={
+                        'transaction_id': transaction.transaction_id,
+                        'version': self._version,
+                        'auto_adjusted_level': auto_adjust_level,
+                        'inserted_count': len(sections)
+                    }
+                )
+            
+            except Exception as e:
+                return EditResult(
+                    success=False,
+                    operation=EditOperation.INSERT_SECTION,
+                    modified_sections=(),
+                    errors=[SafeParseError(
+                        message=f"Insert sections operation failed: {str(e)}",
+                        error_code="INSERT_ERROR",
+                        category=ErrorCategory.SYSTEM
+                    )],
+                    warnings=()
                 )
     
     def delete_section(self, section_ref: SectionReference, preserve_subsections: bool = False) -> EditResult:
@@ -596,68 +1039,48 @@ class SafeMarkdownEditor:
         Returns:
             EditResult with operation details
         """
-        with self._lock:
+        with self._lock.write_lock:
             try:
                 # Validate section exists
                 if not self._is_valid_section_reference(section_ref):
                     return EditResult(
                         success=False,
                         operation=EditOperation.DELETE_SECTION,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message=f"Section not found: {section_ref.title}",
                             error_code="SECTION_NOT_FOUND",
                             category=ErrorCategory.VALIDATION,
                             suggestions=["Verify section ID", "Refresh section references"]
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 # Store rollback data
                 rollback_data = self._current_text
                 
-                # Get current sections
-                current_sections = self.get_sections()
-                
                 # Find section to delete
-                target_section = None
-                for section in current_sections:
-                    if section.id == section_ref.id:
-                        target_section = section
-                        break
+                target_section = self.get_section_by_id(section_ref.id)
                 
                 if not target_section:
                     return EditResult(
                         success=False,
                         operation=EditOperation.DELETE_SECTION,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message="Target section not found in current document",
                             error_code="SECTION_NOT_FOUND",
                             category=ErrorCategory.VALIDATION
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
-                # Calculate deletion bounds
-                lines = self._current_text.split('\n')
-                
-                # Find next section at same or higher level to determine end bound
-                delete_end_line = len(lines)
-                for section in current_sections:
-                    if (section.line_start > target_section.line_start and 
-                        section.level <= target_section.level):
-                        delete_end_line = section.line_start - 1
-                        break
-                
                 # Simple deletion - remove entire section and subsections
-                new_lines = (lines[:target_section.line_start - 1] + 
-                            lines[delete_end_line:])
+                new_text = self._splice_lines(*self._section_delete_range(target_section), [])
                 
                 # Update document
-                new_text = '\n'.join(new_lines)
                 self._current_text = new_text
-                self._current_result = self._parser.parse(new_text)
+                self._current_result = self._parse(new_text)
                 self._wrapper = ASTWrapper(self._current_result)
                 
                 # Record transaction
@@ -679,8 +1102,8 @@ class SafeMarkdownEditor:
                     success=True,
                     operation=EditOperation.DELETE_SECTION,
                     modified_sections=[section_ref],
-                    errors=[],
-                    warnings=[],
+                    errors=(),
+                    warnings=(),
                     metadata={
                         'preserve_subsections': preserve_subsections,
                         'version': self._version
@@ -691,13 +1114,13 @@ class SafeMarkdownEditor:
                 return EditResult(
                     success=False,
                     operation=EditOperation.DELETE_SECTION,
-                    modified_sections=[],
+                    modified_sections=(),
                     errors=[SafeParseError(
                         message=f"Delete operation failed: {str(e)}",
                         error_code="DELETE_ERROR",
                         category=ErrorCategory.SYSTEM
                     )],
-                    warnings=[]
+                    warnings=()
                 )
     
     def move_section(self, section_ref: SectionReference, target_ref: SectionReference, 
@@ -713,46 +1136,46 @@ class SafeMarkdownEditor:
         Returns:
             EditResult with operation details
         """
-        with self._lock:
+        with self._lock.write_lock:
             try:
                 # Validate both sections exist
                 if not self._is_valid_section_reference(section_ref):
                     return EditResult(
                         success=False,
                         operation=EditOperation.MOVE_SECTION, 
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message=f"Source section not found: {section_ref.title}",
                             error_code="SECTION_NOT_FOUND",
                             category=ErrorCategory.VALIDATION
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 if not self._is_valid_section_reference(target_ref):
                     return EditResult(
                         success=False,
                         operation=EditOperation.MOVE_SECTION,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message=f"Target section not found: {target_ref.title}",
                             error_code="SECTION_NOT_FOUND", 
                             category=ErrorCategory.VALIDATION
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 if position not in ["before", "after"]:
                     return EditResult(
                         success=False,
                         operation=EditOperation.MOVE_SECTION,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message="Position must be 'before' or 'after'",
                             error_code="INVALID_POSITION",
                             category=ErrorCategory.VALIDATION
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 # Store rollback data
@@ -780,7 +1203,7 @@ class SafeMarkdownEditor:
                     success=True,
                     operation=EditOperation.MOVE_SECTION,
                     modified_sections=[section_ref, target_ref],
-                    errors=[],
+                    errors=(),
                     warnings=[SafeParseError(
                         message="Move operation is simplified - full implementation pending",
                         error_code="SIMPLIFIED_IMPLEMENTATION",
@@ -796,13 +1219,13 @@ class SafeMarkdownEditor:
                 return EditResult(
                     success=False,
                     operation=EditOperation.MOVE_SECTION,
-                    modified_sections=[],
+                    modified_sections=(),
                     errors=[SafeParseError(
                         message=f"Move operation failed: {str(e)}",
                         error_code="MOVE_ERROR",
                         category=ErrorCategory.SYSTEM
                     )],
-                    warnings=[]
+                    warnings=()
                 )
 
     def change_heading_level(self, section_ref: SectionReference, new_level: int) -> EditResult:
@@ -816,19 +1239,19 @@ class SafeMarkdownEditor:
         Returns:
             EditResult with operation details
         """
-        with self._lock:
+        with self._lock.write_lock:
             try:
                 if not 1 <= new_level <= 6:
                     return EditResult(
                         success=False,
                         operation=EditOperation.CHANGE_HEADING_LEVEL,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message=f"Heading level must be between 1 and 6, got {new_level}",
                             error_code="INVALID_HEADING_LEVEL",
                             category=ErrorCategory.VALIDATION
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 # Validate section exists
@@ -836,64 +1259,48 @@ class SafeMarkdownEditor:
                     return EditResult(
                         success=False,
                         operation=EditOperation.CHANGE_HEADING_LEVEL,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message=f"Section not found: {section_ref.title}",
                             error_code="SECTION_NOT_FOUND",
                             category=ErrorCategory.VALIDATION
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 # Store rollback data
                 rollback_data = self._current_text
                 
                 # Update heading level
-                lines = self._current_text.split('\n')
-                line_index = section_ref.line_start - 1  # Convert to 0-based
-                
-                # Find the actual heading line (might be off by one)
-                actual_heading_line = None
-                actual_line_index = None
-                
-                # Search around the expected line
-                for offset in [0, 1, -1, 2]:
-                    test_idx = line_index + offset
-                    if 0 <= test_idx < len(lines):
-                        test_line = lines[test_idx]
-                        heading_match = re.match(r'^(#+)\s*(.*)$', test_line.strip())
-                        if heading_match and heading_match.group(2).strip() == section_ref.title:
-                            actual_heading_line = test_line
-                            actual_line_index = test_idx
-                            break
+                actual_line_index = self._find_heading_line(section_ref)
                 
-                if actual_heading_line is None or actual_line_index is None:
+                if actual_line_index is None:
                     return EditResult(
                         success=False,
                         operation=EditOperation.CHANGE_HEADING_LEVEL,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message=f"Could not find heading line for '{section_ref.title}'",
                             error_code="HEADING_NOT_FOUND",
                             category=ErrorCategory.VALIDATION
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 # Extract and modify heading
-                heading_match = re.match(r'^(#+)\s*(.*)$', actual_heading_line.strip())
+                heading_match = _HEADING_LINE_RE.match(self.get_line(actual_line_index).strip())
                 
                 if not heading_match:
                     return EditResult(
                         success=False,
                         operation=EditOperation.CHANGE_HEADING_LEVEL,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message="Line is not a valid heading",
                             error_code="NOT_A_HEADING",
                             category=ErrorCategory.VALIDATION
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 old_level = len(heading_match.group(1))
@@ -901,12 +1308,11 @@ class SafeMarkdownEditor:
                 
                 # Create new heading
                 new_heading = '#' * new_level + ' ' + title
-                lines[actual_line_index] = new_heading
                 
                 # Update document
-                new_text = '\n'.join(lines)
+                new_text = self._splice_lines(actual_line_index, actual_line_index + 1, [new_heading])
                 self._current_text = new_text
-                self._current_result = self._parser.parse(new_text)
+                self._current_result = self._parse(new_text)
                 self._wrapper = ASTWrapper(self._current_result)
                 
                 # Record transaction
@@ -937,7 +1343,7 @@ class SafeMarkdownEditor:
                     success=True,
                     operation=EditOperation.CHANGE_HEADING_LEVEL,
                     modified_sections=[section_ref],
-                    errors=[],
+                    errors=(),
                     warnings=warnings,
                     metadata={
                         'old_level': old_level,
@@ -950,51 +1356,352 @@ class SafeMarkdownEditor:
                 return EditResult(
                     success=False,
                     operation=EditOperation.CHANGE_HEADING_LEVEL,
-                    modified_sections=[],
+                    modified_sections=(),
                     errors=[SafeParseError(
                         message=f"Heading level change failed: {str(e)}",
                         error_code="LEVEL_CHANGE_ERROR",
                         category=ErrorCategory.SYSTEM
                     )],
-                    warnings=[]
+                    warnings=()
+                )
+    
+    def apply_transaction(self, operations: List[Dict[str, Any]]) -> EditResult:
+        """
+        Apply several edits as one transaction, parsing the document once.
+        
+        Every operation refers to the document as it was before the
+        transaction, so references from get_sections() stay valid for all of
+        them. The lines they touch must not overlap. All edits are spliced
+        into the text together, and the result is parsed and validated once,
+        instead of once per edit. If any operation is invalid or the new text
+        has parse errors, the document is left unchanged.
+        
+        Args:
+            operations: Dicts with an 'operation' key and its parameters, as
+                recorded in the transaction history:
+                UPDATE_SECTION: 'section_ref', 'content', optional 'preserve_subsections'
+                INSERT_SECTION: 'after_section', 'level', 'title', optional
+                    'content' and 'auto_adjust_level'
+                DELETE_SECTION: 'section_ref'
+                CHANGE_HEADING_LEVEL: 'section_ref', 'new_level'
+        
+        Returns:
+            EditResult for the whole transaction; a single rollback undoes it
+        """
+        with self._lock.write_lock:
+            try:
+                errors = []
+                splices = []
+                for index, operation in enumerate(operations):
+                    splice = self._operation_splice(operation)
+                    if isinstance(splice, SafeParseError):
+                        splice.message = f"Operation {index}: {splice.message}"
+                        errors.append(splice)
+                    else:
+                        splices.append(splice)
+                
+                # Equal starts keep the given order, so inserts at one point stay in sequence
+                splices.sort(key=lambda splice: (splice[0], splice[1]))
+                for index in range(1, len(splices)):
+                    previous, following = splices[index - 1], splices[index]
+                    if (not following[2] and previous[0] < following[0] == previous[1] - 1
+                            and not self.get_line(following[0]).strip()):
+                        # A deletion sharing only the blank separator the previous edit
+                        # already replaces is adjacent to it, not overlapping
+                        following = splices[index] = (following[0] + 1, *following[1:])
+                    if following[0] < previous[1]:
+                        errors.append(SafeParseError(
+                            message=f"Operations overlap at line {following[0]}",
+                            error_code="OVERLAPPING_OPERATIONS",
+                            category=ErrorCategory.OPERATION,
+                            suggestions=["Combine edits to the same section into one operation"]
+                        ))
+                        break
+                
+                if errors:
+                    return EditResult(
+                        success=False,
+                        operation=EditOperation.BATCH_OPERATIONS,
+                        modified_sections=(),
+                        errors=errors,
+                        warnings=()
+                    )
+                
+                new_text = self._splice_line_ranges(splices)
+                
+                # Parse once; the result both validates the edits and becomes the new state
+                new_result = self._parse(new_text)
+                if new_result.has_errors:
+                    return EditResult(
+                        success=False,
+                        operation=EditOperation.BATCH_OPERATIONS,
+                        modified_sections=(),
+                        errors=[SafeParseError(
+                            message=error.message,
+                            line_number=error.line_number,
+                            level=error.level,
+                            error_code="PREVIEW_VALIDATION",
+                            category=ErrorCategory.VALIDATION
+                        ) for error in new_result.errors],
+                        warnings=(),
+                        preview=new_text
+                    )
+                
+                transaction = self._create_transaction(list(operations))
+                
+                # Update state
+                self._current_text = new_text
+                self._current_result = new_result
+                self._wrapper = ASTWrapper(self._current_result)
+                self._last_modified = datetime.now()
+                self._version += 1
+                
+                self._commit_transaction(transaction)
+                
+                return EditResult(
+                    success=True,
+                    operation=EditOperation.BATCH_OPERATIONS,
+                    modified_sections=(),  # References to the old document no longer apply
+                    errors=(),
+                    warnings=(),
+                    metadata={
+                        'transaction_id': transaction.transaction_id,
+                        'version': self._version,
+                        'operation_count': len(operations)
+                    }
+                )
+            
+            except Exception as e:
+                return EditResult(
+                    success=False,
+                    operation=EditOperation.BATCH_OPERATIONS,
+                    modified_sections=(),
+                    errors=[SafeParseError(
+                        message=f"Transaction failed: {str(e)}",
+                        error_code="TRANSACTION_ERROR",
+                        category=ErrorCategory.SYSTEM
+                    )],
+                    warnings=()
                 )
     
     # Private helper methods
     
-    def _build_section_references(self) -> List[SectionReference]:
-        """Build section references from current document state."""
-        headings = self._wrapper.get_headings()
-        sections = []
-        lines = self._current_text.split('\n')
+    def _parse(self, text: str) -> ParseResult:
+        """
+        Parse text, reusing the result when it was parsed recently.
         
-        for i, heading in enumerate(headings):
-            # Calculate section boundaries
-            line_start = heading.get('line', 1) - 1  # Convert to 0-indexed
-            line_end = len(lines) - 1  # Default to end of document
+        Edits preview a candidate text and then apply the same text, and
+        rollbacks return to earlier texts; a small LRU cache keyed on the text
+        lets those reuse the earlier parse. Other texts reparse only the
+        region that differs from the most recently used text, where that is
+        known to give the same tokens as a full parse.
+        """
+        with self._parse_cache_lock:
+            result = self._parse_cache.get(text)
+            if result is not None:
+                self._parse_cache.move_to_end(text)
+                return result
+            base = next(reversed(self._parse_cache.items()), None)
+        
+        result = self._reparse_region(base[0], base[1], text) if base is not None else None
+        if result is None:
+            result = self._parser.parse(text)
+        
+        with self._parse_cache_lock:
+            self._parse_cache[text] = result
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return result
+    
+    def _reparse_region(self, old_text: str, old_result: ParseResult, text: str) -> Optional[ParseResult]:
+        """
+        Parse text by reparsing only the lines that differ from old_text.
+        
+        The changed lines are widened to the nearest unchanged top-level ATX
+        headings on either side. An ATX heading always starts a new block and
+        ends any open paragraph, list or block quote, so the lines outside that
+        window parse the same as before. The window is parsed on its own, and
+        its tokens are spliced between the old tokens before and after it. The
+        tokens after it get their line maps shifted. Old tokens are never
+        mutated, so results shared with copies or the parse cache stay valid.
+        
+        Returns:
+            The ParseResult for text, or None when a full parse is needed:
+            reference and footnote definitions apply to the whole document,
+            and fences and HTML blocks in the window may not end inside it.
             
-            # Find the end line by looking for the next heading at same or higher level
-            for j in range(i + 1, len(headings)):
-                next_heading = headings[j]
-                next_level = next_heading['level']
-                if next_level <= heading['level']:
-                    line_end = next_heading.get('line', 1) - 2  # End before next heading
+        Complexity: one scan of the old tokens plus a parse of the window,
+        instead of a parse of the whole document
+        """
+        old_tokens = old_result.ast
+        if not isinstance(old_tokens, list) or old_result.has_errors or ']:' in old_text:
+            return None
+        
+        limit = min(len(old_text), len(text))
+        prefix = _common_prefix_length(old_text, text, limit)
+        suffix = _common_suffix_length(old_text, text, limit - prefix)
+        
+        # A reference definition can change links anywhere. The old text has none, so
+        # a new one must touch the changed span; only that span of text is scanned
+        if ']:' in text[max(prefix - 1, 0):len(text) - suffix + 1]:
+            return None
+        
+        # Lines [start_line, old_stop) of old_text became [start_line, new_stop) of text
+        start_line = old_text.count('\n', 0, prefix)
+        old_stop = old_text.count('\n', 0, len(old_text) - suffix) + 1
+        line_shift = text.count('\n', 0, len(text) - suffix) + 1 - old_stop
+        
+        # Widen to the unchanged top-level ATX headings around the change; only
+        # unindented ones, as an indented heading can join a list item above it
+        offsets = self._get_line_offsets() if old_text is self._current_text else _line_offsets(old_text)
+        first_line, first_index = 0, 0
+        last_line, last_index = None, len(old_tokens)
+        for index, token in enumerate(old_tokens):
+            if (token.type == 'heading_open' and token.level == 0 and token.markup.startswith('#')
+                    and old_text[offsets[token.map[0]]] == '#'):
+                if token.map[0] < start_line:
+                    first_line, first_index = token.map[0], index
+                elif token.map[0] >= old_stop:
+                    last_line, last_index = token.map[0], index
                     break
+        
+        if first_index == 0 and last_line is None:
+            return None  # The window is the whole document
+        
+        if last_line is None:
+            window = text[offsets[first_line]:]
+        else:
+            window = text[offsets[first_line]:offsets[last_line] + len(text) - len(old_text)]
+        if _OPEN_ENDED_BLOCK_RE.search(window):
+            return None
+        
+        window_result = self._parser.parse(window)
+        if window_result.has_errors:
+            return None
+        
+        window_tokens = window_result.ast
+        for token in window_tokens:
+            if token.map:
+                token.map = [token.map[0] + first_line, token.map[1] + first_line]
+        
+        # Window tokens equal to the old ones keep the old objects, so consumers
+        # can memoize on identity; past the edit only when no line moved
+        old_window_tokens = old_tokens[first_index:last_index]
+        shared = min(len(window_tokens), len(old_window_tokens))
+        leading = 0
+        while leading < shared and window_tokens[leading] == old_window_tokens[leading]:
+            window_tokens[leading] = old_window_tokens[leading]
+            leading += 1
+        if not line_shift:
+            for trailing in range(1, shared - leading + 1):
+                if window_tokens[-trailing] != old_window_tokens[-trailing]:
+                    break
+                window_tokens[-trailing] = old_window_tokens[-trailing]
+        
+        following_tokens = old_tokens[last_index:]
+        if line_shift:
+            following_tokens = [
+                token.copy(map=[token.map[0] + line_shift, token.map[1] + line_shift]) if token.map else token
+                for token in following_tokens
+            ]
+        
+        tokens = old_tokens[:first_index] + window_tokens + following_tokens
+        return self._parser.parser.build_result(tokens, text)
+    
+    def _get_section_snapshot(self) -> List[SectionReference]:
+        """Return section references for the current parse, building them once.
+        
+        Per-level buckets for get_sections_by_level and the id and title
+        indexes for the lookup methods are filled in the same pass.
+        The snapshot is shared by all readers until the next edit replaces the
+        AST wrapper; callers must not mutate the returned list.
+        """
+        if self._section_cache_wrapper is not self._wrapper:
+            sections = self._build_section_references()
+            sections_by_level: Dict[int, List[SectionReference]] = {}
+            sections_by_id: Dict[str, SectionReference] = {}
+            sections_by_title: Dict[str, SectionReference] = {}
+            for section in sections:
+                sections_by_level.setdefault(section.level, []).append(section)
+                sections_by_id.setdefault(section.id, section)
+                # Lookups by title return the first section with that heading
+                sections_by_title.setdefault(section.title, section)
             
-            # Build hierarchical path
-            path = self._build_section_path(heading, headings[:i])
+            self._section_cache = sections
+            self._sections_by_level = sections_by_level
+            self._sections_by_id = sections_by_id
+            self._sections_by_title = sections_by_title
+            self._section_cache_wrapper = self._wrapper
+        return self._section_cache
+    
+    def _get_line_offsets(self) -> List[int]:
+        """Return the start offset of every line in the current text."""
+        text = self._current_text
+        if self._line_offsets_text is not text:
+            self._line_offsets = _line_offsets(text)
+            self._line_offsets_text = text
+        return self._line_offsets
+    
+    def _build_section_references(self) -> List[SectionReference]:
+        """
+        Build section references from current document state.
+        
+        Paths and end lines come from one forward sweep over the headings with
+        a stack of the sections still open: a heading closes every open
+        section at its level or deeper, and the sections left open are its
+        ancestors.
+        
+        Complexity: O(H) for H headings, instead of rescanning the headings
+        before and after each one
+        """
+        # Collected when the text was parsed, so the tokens are not walked again
+        headings = self._current_result.headings
+        line_count = self._current_text.count('\n') + 1
+        
+        line_starts = []  # 0-indexed
+        titles = []
+        paths = []
+        parents = []  # Index of each heading's parent, the innermost section still open
+        # Default to end of document for sections no later heading closes
+        line_ends = [line_count - 1] * len(headings)
+        open_sections: List[Tuple[int, str, int]] = []  # (level, title, index)
+        for i, heading in enumerate(headings):
+            level = heading.level
+            # A heading without a line map counts as the first line
+            line_start = (heading.line or 1) - 1
+            while open_sections and open_sections[-1][0] >= level:
+                # End before this heading
+                line_ends[open_sections.pop()[2]] = line_start - 1
+            line_starts.append(line_start)
             
+            title = heading.content
+            if len(title) <= _MAX_INTERNED_TITLE_LENGTH:
+                title = sys.intern(title)
+            titles.append(title)
+            paths.append([open_title for _, open_title, _ in open_sections])
+            parents.append(open_sections[-1][2] if open_sections else None)
+            open_sections.append((level, title, i))
+        
+        sections: List[SectionReference] = []
+        section_ids: Set[str] = set()
+        for heading, line_start, title, path, line_end, parent in zip(headings, line_starts, titles, paths,
+                                                                      line_ends, parents):
             # Generate human-readable ID using new generator
             section_id = section_id_generator.generate_section_id(
-                title=heading['content'],
-                level=heading['level'],
+                title=title,
+                level=heading.level,
                 line_start=line_start,
-                existing_sections=sections  # Pass already processed sections for collision detection
+                existing_sections=sections,  # Pass already processed sections for collision detection
+                existing_ids=section_ids,
+                # Known from the sweep, so colliding IDs need no backwards search for it
+                parent_section=sections[parent] if parent is not None else None
             )
+            section_ids.add(section_id)
             
             section = SectionReference(
                 id=section_id,
-                title=heading['content'],
-                level=heading['level'],
+                title=title,
+                level=heading.level,
                 line_start=line_start,
                 line_end=line_end,
                 path=path
@@ -1003,37 +1710,36 @@ class SafeMarkdownEditor:
         
         return sections
     
-    def _build_section_path(self, current_heading: Dict[str, Any], 
-                          previous_headings: List[Dict[str, Any]]) -> List[str]:
-        """Build hierarchical path for a section."""
-        path = []
-        current_level = current_heading['level']
-        
-        # Find parent sections by looking backwards for lower level headings
-        for heading in reversed(previous_headings):
-            if heading['level'] < current_level:
-                path.insert(0, heading['content'])
-                current_level = heading['level']
-        
-        return path
-    
     def _is_valid_section_reference(self, section_ref: SectionReference) -> bool:
         """Check if a section reference is valid in the current document."""
-        current_sections = self.get_sections()
-        for section in current_sections:
-            if section.id == section_ref.id:
-                return True
-        return False
+        return self.get_section_by_id(section_ref.id) is not None
     
     def _record_transaction(self, operations: List[Dict[str, Any]], rollback_data: str) -> None:
         """Record a transaction for rollback purposes."""
         transaction = self._create_transaction(operations)
         transaction.rollback_data = rollback_data
+        self._commit_transaction(transaction)
+    
+    def _commit_transaction(self, transaction: EditTransaction) -> None:
+        """
+        Add an applied transaction to the history.
+        
+        The full prior text captured when the transaction was created is
+        swapped for the line delta back to it, so each history entry costs
+        the size of its change rather than the size of the document.
+        """
+        if isinstance(transaction.rollback_data, str):
+            transaction.rollback_data = _text_delta(transaction.rollback_data, self._current_text)
         self._transaction_history.append(transaction)
         self._trim_transaction_history()
     
-    def _validate_document_structure(self) -> List[SafeParseError]:
-        """Validate document structure and integrity."""
+    def _validate_document_structure(self, fail_fast: bool = False) -> List[SafeParseError]:
+        """
+        Validate document structure and integrity.
+        
+        Args:
+            fail_fast: Return as soon as the first error is found
+        """
         errors = []
         
         # Check for parsing errors first
@@ -1047,17 +1753,19 @@ class SafeMarkdownEditor:
                     error_code="PARSE_ERROR",
                     category=ErrorCategory.PARSE
                 ))
+                if fail_fast:
+                    return errors
         
-        # Check heading hierarchy
-        headings = self._wrapper.get_headings()
+        # Check heading hierarchy, on the headings collected when the text was parsed
+        headings = self._current_result.headings
         prev_level = 0
         
         for heading in headings:
-            level = heading['level']
+            level = heading.level
             if level > prev_level + 1:
                 error = SafeParseError(
-                    message=f"Heading level jump from h{prev_level} to h{level}: '{heading['content']}'",
-                    line_number=heading.get('line'),
+                    message=f"Heading level jump from h{prev_level} to h{level}: '{heading.content}'",
+                    line_number=heading.line,
                     level=ErrorLevel.WARNING,
                     error_code="HEADING_LEVEL_JUMP",
                     category=ErrorCategory.STRUCTURE,
@@ -1067,10 +1775,209 @@ class SafeMarkdownEditor:
                     ]
                 )
                 errors.append(error)
+                if fail_fast:
+                    break
             prev_level = level
         
         return errors
     
+    def _splice_lines(self, start: int, stop: int, new_lines: List[str]) -> str:
+        """
+        Return the current text with lines[start:stop] replaced by new_lines.
+        
+        Gives the same text as splitting into lines, splicing the list and
+        joining it again, but the unchanged text before and after is copied as
+        two slices instead of being split into a string per line.
+        
+        Complexity: O(document size) in two memory copies, with no per-line work
+        """
+        # Normalize like list slicing, so negative or out of range bounds behave the same
+        start, stop, _ = slice(start, stop).indices(len(self._get_line_offsets()))
+        return self._splice_line_ranges([(start, stop, new_lines)])
+    
+    def _splice_line_ranges(self, splices: List[Tuple[int, int, List[str]]]) -> str:
+        """
+        Return the current text with several line ranges replaced at once.
+        
+        Each splice is (start, stop, new_lines) in current line numbers, within
+        the document; splices must be in order and must not overlap. The
+        unchanged text between them is copied as one slice per gap.
+        """
+        text = self._current_text
+        offsets = self._get_line_offsets()
+        line_count = len(offsets)
+        
+        parts = []
+        copied_to = 0  # First line not yet copied into parts
+        for start, stop, new_lines in splices:
+            if start > copied_to:
+                parts.append(text[offsets[copied_to]:offsets[start] - 1] if start < line_count
+                             else text[offsets[copied_to]:])
+            if new_lines:
+                parts.append('\n'.join(new_lines))
+            copied_to = stop
+        if copied_to < line_count:
+            parts.append(text[offsets[copied_to]:])
+        return '\n'.join(parts)
+    
+    def _updated_section_text(self, section_ref: SectionReference, content: str,
+                              preserve_subsections: bool) -> str:
+        """Return the current text with the body of section_ref replaced by content."""
+        return self._splice_lines(*self._section_update_splice(section_ref, content, preserve_subsections))
+    
+    def _section_update_splice(self, section_ref: SectionReference, content: str,
+                               preserve_subsections: bool) -> Tuple[int, int, List[str]]:
+        """Return the (start, stop, new_lines) splice that replaces the body of section_ref."""
+        end_line = section_ref.line_end
+        if preserve_subsections:
+            # Find where section content ends and subsections begin
+            end_line = self._find_section_content_end(section_ref)
+        
+        # The content goes in as one piece; splicing joins lines with newlines anyway
+        new_content_lines = [content]
+        
+        # Check if the new content starts with a duplicate header
+        # If so, remove it to prevent duplication
+        first_line, _, rest = content.partition('\n')
+        expected_header = "#" * section_ref.level + " " + section_ref.title
+        # Only remove if it's an EXACT match (including spacing)
+        if first_line == expected_header:
+            # Skip the duplicate header and any following empty lines
+            blank_lines = _BLANK_LINES_RE.match(rest)
+            assert blank_lines is not None  # The pattern matches the empty string too
+            rest = rest[blank_lines.end():]
+            new_content_lines = [rest] if rest and not rest.isspace() else []
+        
+        # Replace content while preserving heading
+        return section_ref.line_start + 1, end_line + 1, new_content_lines
+    
+    def _operation_splice(self, operation: Dict[str, Any]) -> Union[Tuple[int, int, List[str]], SafeParseError]:
+        """
+        Return the (start, stop, new_lines) splice for one transaction operation.
+        
+        The splice is the same edit the matching single-operation method makes.
+        An invalid operation gives the SafeParseError describing it instead.
+        """
+        kind = operation.get('operation')
+        section_ref = operation.get('section_ref')
+        
+        if kind == EditOperation.INSERT_SECTION:
+            after_section = operation.get('after_section')
+            level = operation.get('level')
+            title = operation.get('title', '')
+            if after_section is None or not self._is_valid_section_reference(after_section):
+                return SafeParseError(
+                    message="Section to insert after not found",
+                    error_code="SECTION_NOT_FOUND",
+                    category=ErrorCategory.VALIDATION,
+                    suggestions=["Verify section ID", "Refresh section references"]
+                )
+            if not isinstance(level, int) or not (1 <= level <= 6):
+                return SafeParseError(
+                    message=f"Invalid heading level: {level}. Must be between 1 and 6.",
+                    error_code="INVALID_LEVEL",
+                    category=ErrorCategory.VALIDATION,
+                    suggestions=["Use a heading level between 1 and 6"]
+                )
+            if not title.strip():
+                return SafeParseError(
+                    message="Section title cannot be empty",
+                    error_code="EMPTY_TITLE",
+                    category=ErrorCategory.VALIDATION,
+                    suggestions=["Provide a non-empty title for the section"]
+                )
+            
+            if operation.get('auto_adjust_level', True):
+                child_sections = self.get_child_sections(after_section)
+                if child_sections:
+                    level = max(after_section.level + 1, min(s.level for s in child_sections))
+                else:
+                    level = min(level, after_section.level + 1)
+            insert_line = after_section.line_end + 1
+            return insert_line, insert_line, [f"{'#' * level} {title}", "", operation.get('content', ''), ""]
+        
+        if kind not in (EditOperation.UPDATE_SECTION, EditOperation.DELETE_SECTION,
+                        EditOperation.CHANGE_HEADING_LEVEL):
+            return SafeParseError(
+                message=f"Operation not supported in a transaction: {kind}",
+                error_code="UNSUPPORTED_OPERATION",
+                category=ErrorCategory.OPERATION,
+                suggestions=["Use update, insert, delete or heading level operations"]
+            )
+        
+        if section_ref is None or not self._is_valid_section_reference(section_ref):
+            return SafeParseError(
+                message=f"Section not found: {section_ref.title if section_ref else None}",
+                error_code="SECTION_NOT_FOUND",
+                category=ErrorCategory.VALIDATION,
+                suggestions=["Verify section ID", "Refresh section references"]
+            )
+        
+        if kind == EditOperation.UPDATE_SECTION:
+            content = operation.get('content')
+            if content is None:
+                return SafeParseError(
+                    message="Missing required parameter: content",
+                    error_code="MISSING_PARAMS",
+                    category=ErrorCategory.OPERATION
+                )
+            return self._section_update_splice(section_ref, content, operation.get('preserve_subsections', True))
+        
+        if kind == EditOperation.DELETE_SECTION:
+            return (*self._section_delete_range(section_ref), [])
+        
+        new_level = operation.get('new_level')
+        if not isinstance(new_level, int) or not 1 <= new_level <= 6:
+            return SafeParseError(
+                message=f"Heading level must be between 1 and 6, got {new_level}",
+                error_code="INVALID_HEADING_LEVEL",
+                category=ErrorCategory.VALIDATION
+            )
+        heading_line = self._find_heading_line(section_ref)
+        if heading_line is None:
+            return SafeParseError(
+                message=f"Could not find heading line for '{section_ref.title}'",
+                error_code="HEADING_NOT_FOUND",
+                category=ErrorCategory.VALIDATION
+            )
+        heading_match = _HEADING_LINE_RE.match(self.get_line(heading_line).strip())
+        if not heading_match:
+            return SafeParseError(
+                message="Line is not a valid heading",
+                error_code="NOT_A_HEADING",
+                category=ErrorCategory.VALIDATION
+            )
+        return heading_line, heading_line + 1, ['#' * new_level + ' ' + heading_match.group(2)]
+    
+    def _section_delete_range(self, section_ref: SectionReference) -> Tuple[int, int]:
+        """
+        Return the (start, stop) lines removed when section_ref is deleted.
+        
+        The range is the whole section, heading through its last line, plus
+        at most one blank line separating it from the text before it. That
+        blank line is taken only when the section does not already end with
+        one, so the sections around it keep a single separator between them.
+        """
+        start, stop = section_ref.line_start, section_ref.line_end + 1
+        if (start > 0 and self.get_line(stop - 1).strip()
+                and not self.get_line(start - 1).strip()):
+            start -= 1
+        return start, stop
+    
+    def _find_heading_line(self, section_ref: SectionReference) -> Optional[int]:
+        """Return the index of the heading line of section_ref, or None if it is not found."""
+        line_count = len(self._get_line_offsets())
+        line_index = section_ref.line_start - 1  # Convert to 0-based
+        
+        # Search around the expected line, which might be off by one
+        for offset in [0, 1, -1, 2]:
+            test_idx = line_index + offset
+            if 0 <= test_idx < line_count:
+                heading_match = _HEADING_LINE_RE.match(self.get_line(test_idx).strip())
+                if heading_match and heading_match.group(2).strip() == section_ref.title:
+                    return test_idx
+        return None
+    
     def _find_section_content_end(self, section_ref: SectionReference) -> int:
         """Find where a section's content ends (before subsections)."""
         # For now, use the full section range
@@ -1107,7 +2014,7 @@ class SafeMarkdownEditor:
         Returns:
             List of transactions in reverse chronological order
         """
-        with self._lock:
+        with self._lock.read_lock:
             history = list(reversed(self._transaction_history))
             if limit is not None:
                 history = history[:limit]
@@ -1123,19 +2030,19 @@ class SafeMarkdownEditor:
         Returns:
             EditResult indicating rollback success
         """
-        with self._lock:
+        with self._lock.write_lock:
             try:
                 if not self._transaction_history:
                     return EditResult(
                         success=False,
                         operation=EditOperation.BATCH_OPERATIONS,  # Rollback is like a batch op
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message="No transactions to rollback",
                             error_code="NO_TRANSACTIONS",
                             category=ErrorCategory.OPERATION
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
                 # Find target transaction
@@ -1158,19 +2065,25 @@ class SafeMarkdownEditor:
                     return EditResult(
                         success=False,
                         operation=EditOperation.BATCH_OPERATIONS,
-                        modified_sections=[],
+                        modified_sections=(),
                         errors=[SafeParseError(
                             message=f"Transaction not found: {transaction_id or 'last'}",
                             error_code="TRANSACTION_NOT_FOUND",
                             category=ErrorCategory.OPERATION
                         )],
-                        warnings=[]
+                        warnings=()
                     )
                 
-                # Restore state from transaction rollback data
+                # Undo the target and every later transaction, newest first
                 old_text = self._current_text
-                self._current_text = target_transaction.rollback_data
-                self._current_result = self._parser.parse(self._current_text)
+                lines = old_text.split('\n')
+                for txn in reversed(self._transaction_history[rollback_index:]):
+                    if isinstance(txn.rollback_data, TextDelta):
+                        txn.rollback_data.revert(lines)
+                    else:
+                        lines = txn.rollback_data.split('\n')
+                self._current_text = '\n'.join(lines)
+                self._current_result = self._parse(self._current_text)
                 self._wrapper = ASTWrapper(self._current_result)
                 
                 # Remove rolled-back transactions from history
@@ -1183,9 +2096,9 @@ class SafeMarkdownEditor:
                 return EditResult(
                     success=True,
                     operation=EditOperation.BATCH_OPERATIONS,
-                    modified_sections=[],  # Hard to determine what changed
-                    errors=[],
-                    warnings=[],
+                    modified_sections=(),  # Hard to determine what changed
+                    errors=(),
+                    warnings=(),
                     metadata={
                         'rollback_transaction_id': target_transaction.transaction_id,
                         'rolled_back_operations': len(target_transaction.operations),
@@ -1199,13 +2112,13 @@ class SafeMarkdownEditor:
                 return EditResult(
                     success=False,
                     operation=EditOperation.BATCH_OPERATIONS,
-                    modified_sections=[],
+                    modified_sections=(),
                     errors=[SafeParseError(
                         message=f"Rollback operation failed: {str(e)}",
                         error_code="ROLLBACK_ERROR",
                         category=ErrorCategory.SYSTEM
                     )],
-                    warnings=[]
+                    warnings=()
                 )
     
     def validate_document(self) -> List[SafeParseError]:
@@ -1215,20 +2128,34 @@ class SafeMarkdownEditor:
         Returns:
             List of validation errors and warnings
         """
-        with self._lock:
+        with self._lock.read_lock:
             return self._validate_document_structure()
     
     def to_html(self) -> str:
-        """Convert document to HTML."""
-        with self._lock:
+        """
+        Convert document to HTML.
+        
+        The HTML is rendered once per parsed document state, so repeated calls
+        without an edit in between return the same string. The lock is held
+        only to snapshot the parse result; rendering runs outside it so a long
+        render does not hold up waiting edits.
+        """
+        with self._lock.read_lock:
+            result = self._current_result
+            html_cache = self._html_cache
+        if html_cache is None or html_cache[0] is not result:
             # Use existing renderer infrastructure
             from .renderers import HTMLRenderer
             renderer = HTMLRenderer()
-            return renderer.render(self._current_result.ast)
+            # Stored as one tuple so concurrent readers never pair HTML with the wrong result
+            html_cache = self._html_cache = (result, renderer.render(result.ast))
+        return html_cache[1]
     
     def to_json(self) -> str:
         """Export document structure as JSON."""
-        with self._lock:
-            from .renderers import JSONRenderer
-            renderer = JSONRenderer()
-            return renderer.render(self._current_result.ast)
+        with self._lock.read_lock:
+            # Parse results are never mutated, so the snapshot can be rendered unlocked
+            result = self._current_result
+        from .renderers import JSONRenderer
+        renderer = JSONRenderer()
+        return renderer.render(result.ast)
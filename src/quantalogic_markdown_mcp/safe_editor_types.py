@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from .types import ParseError
 
@@ -70,15 +70,31 @@ class SectionReference:
                 self.line_start == other.line_start)
 
 
+@dataclass(frozen=True)
+class SectionSummary:
+    """Lightweight section record decoded from an MCP tool response."""
+    
+    id: str                    # Section identifier
+    title: str                 # Section heading text
+    level: int                 # Heading level (1-6)
+    line_start: int           # Starting line number (0-indexed)
+    line_end: int             # Ending line number (0-indexed)
+
+
 @dataclass
 class EditResult:
-    """Result of an edit operation with comprehensive feedback."""
+    """
+    Result of an edit operation with comprehensive feedback.
+    
+    The section and error fields are read-only sequences; empty ones share
+    the empty tuple rather than allocating a list per result.
+    """
     
     success: bool                           # Operation success status
     operation: EditOperation               # Type of operation performed
-    modified_sections: List[SectionReference]  # Sections affected by operation
-    errors: List[ParseError]              # Validation or execution errors
-    warnings: List[ParseError]            # Non-critical issues
+    modified_sections: Sequence[SectionReference] = ()  # Sections affected by operation
+    errors: Sequence[ParseError] = ()     # Validation or execution errors
+    warnings: Sequence[ParseError] = ()   # Non-critical issues
     preview: Optional[str] = None         # Markdown preview of changes
     metadata: Dict[str, Any] = field(default_factory=dict)  # Operation metadata
     
@@ -99,13 +115,58 @@ class EditResult:
         return "\n".join(f"- {error}" for error in self.errors)
 
 
+@dataclass(frozen=True)
+class TextDelta:
+    """
+    Line-level change recorded for rollback instead of a full document copy.
+    
+    The replaced lines are kept as one string rather than a list, so a
+    history entry holds one object for them however many lines they span.
+    """
+    
+    start_line: int                       # First line that differs
+    old_text: Optional[str]               # Lines replaced by the edit, newline-joined; None if there were none
+    new_line_count: int                   # Number of lines the edit put in their place
+    
+    @classmethod
+    def between(cls, old_text: str, new_text: str) -> "TextDelta":
+        """Build the delta that turns new_text back into old_text."""
+        old_lines = old_text.split('\n')
+        new_lines = new_text.split('\n')
+        limit = min(len(old_lines), len(new_lines))
+        
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix and
+               old_lines[-1 - suffix] == new_lines[-1 - suffix]):
+            suffix += 1
+        
+        replaced = old_lines[prefix:len(old_lines) - suffix]
+        return cls(
+            start_line=prefix,
+            old_text='\n'.join(replaced) if replaced else None,
+            new_line_count=len(new_lines) - prefix - suffix
+        )
+    
+    @property
+    def old_lines(self) -> List[str]:
+        """Lines replaced by the edit."""
+        return [] if self.old_text is None else self.old_text.split('\n')
+    
+    def revert(self, lines: List[str]) -> None:
+        """Undo the change in place on the document's lines."""
+        lines[self.start_line:self.start_line + self.new_line_count] = self.old_lines
+
+
 @dataclass
 class EditTransaction:
     """Atomic transaction with rollback capability."""
     
     transaction_id: str                    # Unique transaction identifier
     operations: List[Dict[str, Any]]      # List of operations in transaction
-    rollback_data: str                    # Document state for rollback
+    rollback_data: Union[str, TextDelta]  # Prior document state, or the delta back to it
     timestamp: datetime                   # Transaction creation time
     metadata: Dict[str, Any] = field(default_factory=dict)  # Transaction metadata
     
@@ -10,10 +10,29 @@ This module provides a new approach to generating section IDs that are:
 
 import re
 import unicodedata
-from typing import List, Optional, Set
+from enum import Enum
+from typing import List, Optional, Set, Union
 from .safe_editor_types import SectionReference
 
 
+# Patterns compiled once at import; IDs are generated for every section on every parse
+_SLUG_DISALLOWED_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATOR_RUN_RE = re.compile(r'[-\s]+')
+_SIGNIFICANT_WORD_RE = re.compile(r'\b\w{3,}\b')
+_NUMERIC_SUFFIX_RE = re.compile(r'^(.+)-\d+$')
+
+class _ParentLookup(Enum):
+    """Marker for a parent_section the caller did not supply."""
+    FIND = "find"
+
+
+# Default for parent_section: find the parent by scanning the existing sections
+_FIND_PARENT = _ParentLookup.FIND
+
+# A known parent, None for a top-level section, or _FIND_PARENT to look it up
+ParentSection = Union[SectionReference, None, _ParentLookup]
+
+
 class SectionIDGenerator:
     """
     Generates human-readable section IDs with intelligent collision resolution.
@@ -30,7 +49,9 @@ class SectionIDGenerator:
         self._used_ids: Set[str] = set()
     
     def generate_section_id(self, title: str, level: int, line_start: int, 
-                           existing_sections: List[SectionReference]) -> str:
+                           existing_sections: List[SectionReference],
+                           existing_ids: Optional[Set[str]] = None,
+                           parent_section: ParentSection = _FIND_PARENT) -> str:
         """
         Generate a human-readable section ID with collision resolution.
         
@@ -39,12 +60,19 @@ class SectionIDGenerator:
             level: The heading level (1-6)
             line_start: The 0-indexed line number (used as fallback only)
             existing_sections: List of existing sections for collision detection
+            existing_ids: IDs of existing_sections, kept up to date by callers
+                that generate IDs for a whole document so the set is not
+                rebuilt for every section
+            parent_section: The nearest earlier section with a lower level, or
+                None if there is none, when the caller already knows it;
+                otherwise it is found by scanning existing_sections
             
         Returns:
             A unique, human-readable section ID
         """
         # Build set of existing IDs for collision detection
-        existing_ids = {section.id for section in existing_sections}
+        if existing_ids is None:
+            existing_ids = {section.id for section in existing_sections}
         
         # Step 1: Create base slug from title
         base_slug = self._create_slug(title)
@@ -54,7 +82,8 @@ class SectionIDGenerator:
             return base_slug
             
         # Step 3: Smart collision resolution
-        return self._resolve_collision(base_slug, title, level, line_start, existing_sections, existing_ids)
+        return self._resolve_collision(base_slug, title, level, line_start, existing_sections, existing_ids,
+                                       parent_section)
     
     def _create_slug(self, title: str) -> str:
         """
@@ -76,8 +105,8 @@ class SectionIDGenerator:
         slug = slug.lower()
         
         # Replace common punctuation and spaces with hyphens
-        slug = re.sub(r'[^\w\s-]', '', slug)  # Remove special chars except word chars, spaces, hyphens
-        slug = re.sub(r'[-\s]+', '-', slug)   # Replace spaces and multiple hyphens with single hyphen
+        slug = _SLUG_DISALLOWED_RE.sub('', slug)  # Remove special chars except word chars, spaces, hyphens
+        slug = _SLUG_SEPARATOR_RUN_RE.sub('-', slug)   # Replace spaces and multiple hyphens with single hyphen
         
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
@@ -96,7 +125,8 @@ class SectionIDGenerator:
     
     def _resolve_collision(self, base_slug: str, title: str, level: int, 
                           line_start: int, existing_sections: List[SectionReference], 
-                          existing_ids: Set[str]) -> str:
+                          existing_ids: Set[str],
+                          parent_section: ParentSection = _FIND_PARENT) -> str:
         """
         Intelligently resolve ID collisions using multiple strategies.
         
@@ -107,12 +137,14 @@ class SectionIDGenerator:
             line_start: Line number (for fallback)
             existing_sections: All existing sections
             existing_ids: Set of existing IDs for fast lookup
+            parent_section: Parent section, if already known
             
         Returns:
             A unique section ID
         """
         # Strategy 1: Add hierarchical context if available
-        hierarchical_id = self._try_hierarchical_context(base_slug, level, existing_sections, existing_ids)
+        hierarchical_id = self._try_hierarchical_context(base_slug, level, existing_sections, existing_ids,
+                                                         parent_section)
         if hierarchical_id:
             return hierarchical_id
             
@@ -131,7 +163,8 @@ class SectionIDGenerator:
     
     def _try_hierarchical_context(self, base_slug: str, level: int, 
                                  existing_sections: List[SectionReference], 
-                                 existing_ids: Set[str]) -> Optional[str]:
+                                 existing_ids: Set[str],
+                                 parent_section: ParentSection = _FIND_PARENT) -> Optional[str]:
         """
         Try to create unique ID using hierarchical context.
         
@@ -140,16 +173,18 @@ class SectionIDGenerator:
             level: Current section level
             existing_sections: All existing sections
             existing_ids: Set of existing IDs
+            parent_section: Parent section, if already known
             
         Returns:
             Unique ID with hierarchical context, or None if not possible
         """
-        # Find the most recent parent section (lower level number)
-        parent_section = None
-        for section in reversed(existing_sections):
-            if section.level < level:
-                parent_section = section
-                break
+        if parent_section is _FIND_PARENT:
+            # Find the most recent parent section (lower level number)
+            parent_section = None
+            for section in reversed(existing_sections):
+                if section.level < level:
+                    parent_section = section
+                    break
         
         if parent_section:
             # Create hierarchical ID
@@ -180,7 +215,7 @@ class SectionIDGenerator:
             Unique ID with semantic suffix, or None if not possible
         """
         # Extract meaningful words from title that aren't in base slug
-        words = re.findall(r'\b\w{3,}\b', title.lower())  # Words with 3+ characters
+        words = _SIGNIFICANT_WORD_RE.findall(title.lower())  # Words with 3+ characters
         
         # Skip common words
         skip_words = {'the', 'and', 'for', 'with', 'from', 'that', 'this', 'are', 'was', 'will', 'can', 'how', 'what', 'when', 'where', 'why'}
@@ -242,7 +277,7 @@ class SectionIDGenerator:
             The base slug part
         """
         # Remove common numeric suffixes like "-2", "-3", etc.
-        match = re.match(r'^(.+)-\d+$', section_id)
+        match = _NUMERIC_SUFFIX_RE.match(section_id)
         if match:
             return match.group(1)
         
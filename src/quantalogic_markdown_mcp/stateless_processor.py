@@ -1,13 +1,25 @@
 """Stateless processor for Markdown operations."""
 
 import os
+import threading
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Hashable, List, Optional, TextIO, TypeGuard, Union, cast
 
 from .safe_editor import SafeMarkdownEditor
 from .safe_editor_types import EditResult, ValidationLevel
 
 
+# A filesystem path, or an in-memory text stream such as io.StringIO
+DocumentSource = Union[str, TextIO]
+
+# Edits lock one of a fixed set of stripes chosen by document, so concurrent
+# edits to one document are serialised while different documents rarely contend.
+# The locks are reentrant so callers can hold one around execute_operation.
+_DOCUMENT_LOCK_STRIPES = 8
+_document_locks = tuple(threading.RLock() for _ in range(_DOCUMENT_LOCK_STRIPES))
+
+
 class DocumentOperationError(Exception):
     """Base class for document operation errors."""
     pass
@@ -55,9 +67,31 @@ class StatelessMarkdownProcessor:
                 raise PermissionError(f"No read permission for path: {path}")
     
     @staticmethod
-    def load_document(document_path: str, validation_level: ValidationLevel = ValidationLevel.NORMAL) -> SafeMarkdownEditor:
+    def is_stream(document_path: DocumentSource) -> TypeGuard[TextIO]:
+        """Check whether a document source is an in-memory text stream, rather than a path."""
+        return hasattr(document_path, "read") and hasattr(document_path, "write")
+    
+    @staticmethod
+    def document_lock(document_path: DocumentSource) -> threading.RLock:
+        """Return the lock guarding load-modify-save cycles on a document."""
+        key: Hashable
+        if StatelessMarkdownProcessor.is_stream(document_path):
+            key = id(document_path)
+        else:
+            key = str(StatelessMarkdownProcessor.resolve_path(cast(str, document_path)))
+        return _document_locks[hash(key) % _DOCUMENT_LOCK_STRIPES]
+    
+    @staticmethod
+    def load_document(document_path: DocumentSource, validation_level: ValidationLevel = ValidationLevel.NORMAL) -> SafeMarkdownEditor:
         """Load a document and create a SafeMarkdownEditor instance."""
-        resolved_path = StatelessMarkdownProcessor.resolve_path(document_path)
+        if StatelessMarkdownProcessor.is_stream(document_path):
+            document_path.seek(0)
+            return SafeMarkdownEditor(
+                markdown_text=document_path.read(),
+                validation_level=validation_level
+            )
+        
+        resolved_path = StatelessMarkdownProcessor.resolve_path(cast(str, document_path))
         StatelessMarkdownProcessor.validate_file_path(resolved_path, must_exist=True, must_be_file=True)
         
         # Read the file content
@@ -83,9 +117,23 @@ class StatelessMarkdownProcessor:
         return editor
     
     @staticmethod
-    def save_document(editor: SafeMarkdownEditor, document_path: str, backup: bool = True) -> Dict[str, Any]:
-        """Save a document to the specified path."""
-        target_path = StatelessMarkdownProcessor.resolve_path(document_path)
+    def save_document(editor: SafeMarkdownEditor, document_path: DocumentSource, backup: bool = True) -> Dict[str, Any]:
+        """Save a document to the specified path or text stream."""
+        if StatelessMarkdownProcessor.is_stream(document_path):
+            # Streams are rewritten in place; there is no file to back up
+            content = editor.to_markdown()
+            document_path.seek(0)
+            document_path.truncate()
+            document_path.write(content)
+            return {
+                "success": True,
+                "message": "Successfully saved document to stream",
+                "file_path": None,
+                "backup_created": False,
+                "file_size": len(content)
+            }
+        
+        target_path = StatelessMarkdownProcessor.resolve_path(cast(str, document_path))
         
         # Create parent directories if they don't exist
         target_path.parent.mkdir(parents=True, exist_ok=True)
@@ -108,32 +156,88 @@ class StatelessMarkdownProcessor:
         }
     
     @staticmethod
-    def execute_operation(document_path: str, operation: Callable[[SafeMarkdownEditor], EditResult],
+    def execute_operation(document_path: DocumentSource, operation: Callable[[SafeMarkdownEditor], EditResult],
                          auto_save: bool = True, backup: bool = True,
-                         validation_level: ValidationLevel = ValidationLevel.NORMAL) -> Dict[str, Any]:
-        """Execute an operation on a document."""
+                         validation_level: ValidationLevel = ValidationLevel.NORMAL,
+                         editor: Optional[SafeMarkdownEditor] = None) -> Dict[str, Any]:
+        """Execute an operation on a document, or on an already loaded editor for it."""
+        try:
+            # Saving operations hold the document's lock from load to save so
+            # concurrent edits cannot overwrite each other
+            lock = StatelessMarkdownProcessor.document_lock(document_path) if auto_save else nullcontext()
+            with lock:
+                # Load the document unless the caller already has it parsed
+                if editor is None:
+                    editor = StatelessMarkdownProcessor.load_document(document_path, validation_level)
+                
+                # Execute the operation
+                result = operation(editor)
+                
+                # Handle the result
+                response = StatelessMarkdownProcessor.handle_edit_result(result)
+                
+                # Save if requested and operation was successful
+                if auto_save and result.success:
+                    save_result = StatelessMarkdownProcessor.save_document(editor, document_path, backup)
+                    response.update({
+                        "saved": True,
+                        "save_info": save_result
+                    })
+                
+                return response
+            
+        except Exception as e:
+            return StatelessMarkdownProcessor.create_error_response(str(e), type(e).__name__)
+    
+    @staticmethod
+    def execute_operations(document_path: DocumentSource, operations: List[Callable[[SafeMarkdownEditor], EditResult]],
+                           auto_save: bool = True, backup: bool = True,
+                           validation_level: ValidationLevel = ValidationLevel.NORMAL) -> Dict[str, Any]:
+        """Execute several operations on a document loaded and parsed once.
+        
+        Operations run in order against the same editor, so later operations
+        see the changes of earlier ones. The document is saved at most once,
+        after the last operation, and only if every operation succeeded and
+        the content changed; a batch with a failed operation leaves the file
+        as it was.
+        """
         try:
-            # Load the document
-            editor = StatelessMarkdownProcessor.load_document(document_path, validation_level)
+            lock = StatelessMarkdownProcessor.document_lock(document_path) if auto_save else nullcontext()
+        except Exception as e:
+            return StatelessMarkdownProcessor.create_error_response(str(e), type(e).__name__)
+        
+        with lock:
+            try:
+                editor = StatelessMarkdownProcessor.load_document(document_path, validation_level)
+            except Exception as e:
+                return StatelessMarkdownProcessor.create_error_response(str(e), type(e).__name__)
             
-            # Execute the operation
-            result = operation(editor)
+            original_content = editor.to_markdown()
+            results = []
+            for operation in operations:
+                try:
+                    result = operation(editor)
+                    results.append(StatelessMarkdownProcessor.handle_edit_result(result))
+                except Exception as e:
+                    results.append(StatelessMarkdownProcessor.create_error_response(str(e), type(e).__name__))
             
-            # Handle the result
-            response = StatelessMarkdownProcessor.handle_edit_result(result)
+            response = {
+                "success": all(result.get("success", False) for result in results),
+                "results": results,
+                "saved": False
+            }
             
-            # Save if requested and operation was successful
-            if auto_save and result.success:
-                save_result = StatelessMarkdownProcessor.save_document(editor, document_path, backup)
+            if auto_save and response["success"] and editor.to_markdown() != original_content:
+                try:
+                    save_result = StatelessMarkdownProcessor.save_document(editor, document_path, backup)
+                except Exception as e:
+                    return StatelessMarkdownProcessor.create_error_response(str(e), type(e).__name__)
                 response.update({
                     "saved": True,
                     "save_info": save_result
                 })
             
             return response
-            
-        except Exception as e:
-            return StatelessMarkdownProcessor.create_error_response(str(e), type(e).__name__)
     
     @staticmethod
     def handle_edit_result(result: EditResult) -> Dict[str, Any]:
@@ -1,7 +1,7 @@
 """Core data structures for the markdown parser."""
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional, Protocol
 from abc import ABC, abstractmethod
 from enum import Enum
 
@@ -32,6 +32,13 @@ class ParseError:
         return f"{self.level.value.title()}: {self.message}"
 
 
+class Heading(NamedTuple):
+    """A heading found while parsing: a compact, read-only record per heading."""
+    level: int
+    content: str
+    line: Optional[int]  # 1-indexed line of the heading, if the token was mapped
+
+
 @dataclass
 class ParseResult:
     """Result of parsing markdown text."""
@@ -40,6 +47,17 @@ class ParseResult:
     warnings: List[ParseError]
     metadata: Dict[str, Any]
     source_text: str
+    # Filled by the parser while it walks the tokens; computed on demand otherwise
+    _headings: Optional[List[Heading]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def headings(self) -> List[Heading]:
+        """Headings in document order, with the fields of ast_utils.get_headings."""
+        if self._headings is None:
+            from .ast_utils import get_headings
+            self._headings = ([Heading(**heading) for heading in get_headings(self.ast)]
+                              if isinstance(self.ast, list) else [])
+        return self._headings
 
     @property
     def has_errors(self) -> bool:
@@ -0,0 +1,16 @@
+"""Shared pytest fixtures for the test suite."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def thread_pool():
+    """One worker pool reused by every concurrency test in the session.
+
+    Tests that line their workers up on a barrier must use at most
+    max_workers of them, or the barrier waits for threads that never start.
+    """
+    with ThreadPoolExecutor(max_workers=8, thread_name_prefix="test-worker") as executor:
+        yield executor
@@ -8,6 +8,7 @@ from quantalogic_markdown_mcp import (
     markdown_to_html,
     markdown_to_latex,
     ParseResult,
+    ParseError,
     ErrorLevel,
 )
 
@@ -107,6 +108,19 @@ def hello_world():
         assert '*emphasis*' in md_output
         assert '**strong**' in md_output
 
+    def test_render_many(self, parser, sample_markdown):
+        """Test rendering one parse result to several formats."""
+        result = parser.parse(sample_markdown)
+        outputs = parser.render_many(result, ('html', 'latex', 'json'))
+        
+        assert list(outputs) == ['html', 'latex', 'json']
+        assert outputs['html'] == parser.render(result, 'html')
+        assert outputs['latex'] == parser.render(result, 'latex')
+        assert outputs['json'] == parser.render(result, 'json')
+        
+        with pytest.raises(ValueError):
+            parser.render_many(result, ('html', 'invalid_format'))
+
     def test_parse_and_render(self, parser, sample_markdown):
         """Test combined parse and render."""
         html, result = parser.parse_and_render(sample_markdown, 'html')
@@ -124,6 +138,17 @@ def hello_world():
         assert headings[0]['level'] == 1
         assert 'Heading 1' in headings[0]['content']
 
+    def test_parse_result_headings(self, parser, sample_markdown):
+        """Test headings collected during parsing."""
+        result = parser.parse(sample_markdown)
+        
+        assert [heading._asdict() for heading in result.headings] == parser.get_ast_wrapper(result).get_headings()
+        assert result.headings[0].level == 1
+        
+        # Results built outside the parser compute them on first access
+        rebuilt = ParseResult(ast=result.ast, errors=[], warnings=[], metadata={}, source_text=sample_markdown)
+        assert rebuilt.headings == result.headings
+
     def test_supported_features(self, parser):
         """Test feature detection."""
         features = parser.get_supported_features()
@@ -140,6 +165,13 @@ def hello_world():
         # Note: markdown-it-py is forgiving, so this might not produce errors
         assert isinstance(issues, list)
 
+    def test_validate_parse_result(self, parser):
+        """Test validating an already parsed result."""
+        result = parser.parse("# Heading\n\n[unclosed link")
+        result.warnings.append(ParseError("Suspicious link", level=ErrorLevel.WARNING))
+        
+        assert parser.validate(result) == [str(warning) for warning in result.warnings]
+
     def test_plugins(self):
         """Test plugin loading."""
         parser = QuantalogicMarkdownParser(plugins=['footnote'])
@@ -11,7 +11,8 @@ from quantalogic_markdown_mcp import (
     ErrorCategory,
     SectionReference,
     EditResult,
-    SafeParseError
+    SafeParseError,
+    TextDelta
 )
 from quantalogic_markdown_mcp.safe_editor import DocumentStructureError
 
@@ -66,6 +67,22 @@ Content for section C.
         editor_permissive = SafeMarkdownEditor(sample_markdown, ValidationLevel.PERMISSIVE)
         assert editor_permissive._validation_level == ValidationLevel.PERMISSIVE
 
+    def test_editors_share_default_parser(self, editor, sample_markdown, monkeypatch):
+        """Test that editors share one parser unless given their own."""
+        from quantalogic_markdown_mcp import QuantalogicMarkdownParser
+        
+        assert SafeMarkdownEditor(sample_markdown)._parser is editor._parser
+        
+        own_parser = QuantalogicMarkdownParser()
+        calls = []
+        original_parse = own_parser.parse
+        monkeypatch.setattr(own_parser, "parse", lambda text: calls.append(text) or original_parse(text))
+        own_editor = SafeMarkdownEditor(sample_markdown, parser=own_parser)
+        
+        assert own_editor._parser is own_parser
+        assert calls == [sample_markdown]
+        assert own_editor.to_markdown() == editor.to_markdown()
+
     def test_constructor_with_empty_content(self):
         """Test constructor with empty content."""
         editor = SafeMarkdownEditor("", ValidationLevel.NORMAL)
@@ -121,6 +138,48 @@ Content for section C.
         not_found = editor.get_section_by_id("nonexistent_id")
         assert not_found is None
 
+    def test_get_sections_snapshot_refreshes_after_edit(self, editor):
+        """Test that cached section references follow document edits."""
+        sections = editor.get_sections()
+        sections.clear()  # Callers get their own list
+        assert len(editor.get_sections()) == 6
+        
+        section_b = editor.get_section_by_title("Section B")
+        result = editor.insert_section_after(section_b, 2, "Section B2", "New content.")
+        assert result.success
+        
+        titles = [section.title for section in editor.get_sections()]
+        assert "Section B2" in titles
+        assert len(titles) == 7
+        assert len(editor.get_sections_by_level(2)) == 4
+
+    def test_get_section_by_title(self, editor):
+        """Test get_section_by_title method."""
+        found_section = editor.get_section_by_title("Section B")
+        assert found_section is not None
+        assert found_section.title == "Section B"
+        assert found_section.level == 2
+        
+        # Should return None for non-existent title
+        assert editor.get_section_by_title("Nonexistent Section") is None
+
+    def test_section_lookups_follow_edits(self):
+        """Test that id and title lookups return the first match and track edits."""
+        editor = SafeMarkdownEditor("# Doc\n\n## Notes\n\nFirst.\n\n## Notes\n\nSecond.\n")
+        notes = [s for s in editor.get_sections() if s.title == "Notes"]
+        assert len(notes) == 2
+        assert editor.get_section_by_title("Notes") == notes[0]
+        assert editor.get_section_by_id(notes[1].id) == notes[1]
+        
+        result = editor.insert_section_after(notes[1], 2, "Appendix", "More.")
+        assert result.success
+        appendix = editor.get_section_by_title("Appendix")
+        assert appendix is not None
+        assert editor.get_section_by_id(appendix.id) == appendix
+        
+        editor.delete_section(appendix)
+        assert editor.get_section_by_id(appendix.id) is None
+
     def test_get_sections_by_level(self, editor):
         """Test get_sections_by_level method."""
         # Test level 1 (should be 1 section)
@@ -300,6 +359,320 @@ Content for section C.
         # This is acceptable behavior for resilient editing
         assert result.success is True or (result.success is False and len(result.errors) > 0)
 
+    def test_insert_sections_after(self, editor):
+        """Test insert_sections_after inserts a block as one transaction."""
+        section_c = editor.get_sections()[-1]
+        original_count = len(editor.get_sections())
+        history_length = len(editor.get_transaction_history())
+        
+        result = editor.insert_sections_after(section_c, [
+            {"level": 2, "title": f"Bulk {i}", "content": f"Content {i}"}
+            for i in range(5)
+        ])
+        
+        assert result.success is True
+        assert [s.title for s in result.modified_sections] == [f"Bulk {i}" for i in range(5)]
+        assert len(editor.get_sections()) == original_count + 5
+        assert len(editor.get_transaction_history()) == history_length + 1
+        
+        # One rollback removes the whole block
+        assert editor.rollback_transaction().success is True
+        assert len(editor.get_sections()) == original_count
+        
+    def test_insert_sections_after_adjusts_each_level_in_turn(self):
+        """Test that mixed levels are adjusted against the entries placed before them."""
+        document = "# Top\n\n## A\n\ntext\n\n## B\n\nb\n"
+        
+        # Matches inserting at the end of A one at a time
+        editor = SafeMarkdownEditor(document)
+        sequential = SafeMarkdownEditor(document)
+        for index, level in enumerate([3, 2]):
+            sequential.insert_section_after(sequential.get_section_by_title("A"), level, f"N{index}")
+        result = editor.insert_sections_after(editor.get_section_by_title("A"), [
+            {"level": 3, "title": "N0"}, {"level": 2, "title": "N1"}
+        ])
+        
+        assert result.success is True
+        assert [s.level for s in result.modified_sections] == [3, 3]
+        assert editor.to_markdown() == sequential.to_markdown()
+        
+        # An entry that closes A becomes the parent of the entries after it
+        editor = SafeMarkdownEditor(document)
+        result = editor.insert_sections_after(editor.get_section_by_title("A"), [
+            {"level": 1, "title": "N0"}, {"level": 3, "title": "N1"}, {"level": 1, "title": "N2"}
+        ])
+        
+        assert result.success is True
+        assert [(s.level, s.title) for s in result.modified_sections] == [(1, "N0"), (2, "N1"), (2, "N2")]
+        levels = [s.level for s in editor.get_sections()]
+        assert all(later <= earlier + 1 for earlier, later in zip(levels, levels[1:]))
+
+    def test_insert_sections_after_invalid_title(self, editor):
+        """Test insert_sections_after rejects the whole block on a bad entry."""
+        original = editor.to_markdown()
+        
+        result = editor.insert_sections_after(editor.get_sections()[-1], [
+            {"level": 2, "title": "Fine"},
+            {"level": 2, "title": "   "},
+        ])
+        
+        assert result.success is False
+        assert result.errors[0].error_code == "EMPTY_TITLE"
+        assert editor.to_markdown() == original
+
+    def test_apply_transaction_matches_sequential_edits(self, editor, sample_markdown, monkeypatch):
+        """Test that a transaction gives the text of its edits applied one by one, with one parse."""
+        # A separate editor, so its parses do not fill this editor's parse cache
+        sequential = SafeMarkdownEditor(sample_markdown, ValidationLevel.NORMAL)
+        sequential.update_section_content(sequential.get_section_by_title("Section C"), "New C content.")
+        sequential.insert_section_after(sequential.get_section_by_title("Section C"), 2, "Section D", "D content.")
+        sequential.change_heading_level(sequential.get_section_by_title("Section B"), 3)
+        sequential.delete_section(sequential.get_section_by_title("Subsection A1"))
+        
+        calls = []
+        original_parse = editor._parser.parse
+        monkeypatch.setattr(editor._parser, "parse", lambda text: calls.append(text) or original_parse(text))
+        result = editor.apply_transaction([
+            {"operation": EditOperation.UPDATE_SECTION,
+             "section_ref": editor.get_section_by_title("Section C"), "content": "New C content."},
+            {"operation": EditOperation.INSERT_SECTION, "after_section": editor.get_section_by_title("Section C"),
+             "level": 2, "title": "Section D", "content": "D content."},
+            {"operation": EditOperation.CHANGE_HEADING_LEVEL,
+             "section_ref": editor.get_section_by_title("Section B"), "new_level": 3},
+            {"operation": EditOperation.DELETE_SECTION, "section_ref": editor.get_section_by_title("Subsection A1")},
+        ])
+        
+        assert result.success is True
+        assert result.metadata["operation_count"] == 4
+        assert len(calls) == 1
+        assert editor.to_markdown() == sequential.to_markdown()
+        
+        # One rollback undoes every operation in the transaction
+        assert editor.rollback_transaction().success is True
+        assert editor.get_section_by_title("Subsection A1") is not None
+        assert editor.get_section_by_title("Section D") is None
+
+    def test_apply_transaction_rejects_overlapping_operations(self, editor):
+        """Test that a transaction touching the same lines twice changes nothing."""
+        original = editor.to_markdown()
+        
+        result = editor.apply_transaction([
+            {"operation": EditOperation.UPDATE_SECTION,
+             "section_ref": editor.get_section_by_title("Section A"), "content": "New A content."},
+            {"operation": EditOperation.DELETE_SECTION, "section_ref": editor.get_section_by_title("Subsection A1")},
+            {"operation": EditOperation.MOVE_SECTION, "section_ref": editor.get_section_by_title("Section B")},
+        ])
+        
+        assert result.success is False
+        assert [error.error_code for error in result.errors] == ["UNSUPPORTED_OPERATION", "OVERLAPPING_OPERATIONS"]
+        assert editor.to_markdown() == original
+
+    def test_apply_transaction_updates_section_and_deletes_next_sibling(self):
+        """Test that updating a section and deleting the sibling after it matches doing both in turn."""
+        for document in ("# A\n\ntext\n\n# B\n\nmore", "# A\n\ntext\n\n# B\n\nmore\n\n# C\n\nlast\n"):
+            sequential = SafeMarkdownEditor(document)
+            sequential.update_section_content(sequential.get_section_by_title("A"), "new")
+            sequential.delete_section(sequential.get_section_by_title("B"))
+            
+            editor = SafeMarkdownEditor(document)
+            result = editor.apply_transaction([
+                {"operation": EditOperation.UPDATE_SECTION,
+                 "section_ref": editor.get_section_by_title("A"), "content": "new"},
+                {"operation": EditOperation.DELETE_SECTION, "section_ref": editor.get_section_by_title("B")},
+            ])
+            
+            assert result.success is True, result.errors
+            assert editor.to_markdown() == sequential.to_markdown()
+            # The updated body directly above B's heading is kept
+            assert editor.to_markdown().startswith("# A\nnew")
+
+    def test_update_parses_new_text_once(self, editor, monkeypatch):
+        """Test that validating and applying an update share one parse."""
+        calls = []
+        original_parse = editor._parser.parse
+        monkeypatch.setattr(editor._parser, "parse", lambda text: calls.append(text) or original_parse(text))
+        
+        result = editor.update_section_content(editor.get_sections()[1], "Replaced content.")
+        
+        assert result.success is True
+        assert len(calls) == 1
+        assert "Replaced content." in calls[0]
+
+    def test_sections_use_headings_collected_while_parsing(self, editor, monkeypatch):
+        """Test that section references are built without walking the tokens again."""
+        from quantalogic_markdown_mcp import ast_utils
+        
+        def fail(tokens):
+            raise AssertionError("headings should come from the parse result")
+        
+        monkeypatch.setattr(ast_utils, "get_headings", fail)
+        assert editor.update_section_content(editor.get_sections()[-1], "Replaced content.").success
+        
+        assert [section.title for section in editor.get_sections()] == [
+            "Main Document", "Section A", "Subsection A1", "Subsection A2", "Section B", "Section C"
+        ]
+
+    def test_section_paths_and_ends_follow_nesting(self):
+        """Test that each section ends before the next heading at its level or above."""
+        editor = SafeMarkdownEditor("# A\n## B\n### C\n## D\n#### E\n# F\ntext")
+        
+        assert [(section.title, section.path, section.line_end) for section in editor.get_sections()] == [
+            ("A", [], 4),
+            ("B", ["A"], 2),
+            ("C", ["A", "B"], 2),
+            ("D", ["A"], 4),
+            ("E", ["A", "D"], 4),
+            ("F", [], 6),
+        ]
+
+    def test_duplicate_titles_get_unique_ids(self):
+        """Test that repeated headings still get distinct section IDs."""
+        editor = SafeMarkdownEditor("# Notes\n\n## Notes\n\n## Notes\n\n# Notes\n")
+        
+        section_ids = [section.id for section in editor.get_sections()]
+        
+        assert len(set(section_ids)) == len(section_ids)
+        assert all(editor.get_section_by_id(section_id) for section_id in section_ids)
+
+    def test_duplicate_titles_take_parent_slug(self):
+        """Test that a repeated subsection title is disambiguated by its parent."""
+        editor = SafeMarkdownEditor("# Alpha\n## Intro\n# Beta\n## Intro\n### Intro\n")
+        
+        assert [section.id for section in editor.get_sections()] == [
+            "alpha", "intro", "beta", "beta-intro", "beta-intro-intro"
+        ]
+
+    def test_delete_section_on_first_line(self):
+        """Test that deleting a section whose heading is the first line keeps the rest intact."""
+        editor = SafeMarkdownEditor("# A\ntext\n# B\nb")
+        
+        assert editor.delete_section(editor.get_sections()[0]).success is True
+        assert editor.to_markdown() == "# B\nb"
+
+    def test_delete_section_in_tight_document(self):
+        """Test that deleting from a document without blank lines removes the whole section."""
+        editor = SafeMarkdownEditor("# A\ntext\n# B\nb\n# C\nc")
+        assert editor.delete_section(editor.get_section_by_title("B")).success is True
+        assert editor.to_markdown() == "# A\ntext\n# C\nc"
+        
+        # A subsection's body does not fall through to its parent
+        editor = SafeMarkdownEditor("# Top\n\n> q\n## Sub\nmore\n## Sub2\n")
+        assert editor.delete_section(editor.get_section_by_title("Sub")).success is True
+        assert editor.to_markdown() == "# Top\n\n> q\n## Sub2\n"
+
+    def test_delete_section_in_spaced_document(self):
+        """Test that deleting between blank-separated sections leaves one separator."""
+        document = "# A\n\ntext\n\n# B\n\nmore\n\n# C\n\nlast\n"
+        expected = {
+            "A": "# B\n\nmore\n\n# C\n\nlast\n",
+            "B": "# A\n\ntext\n\n# C\n\nlast\n",
+            "C": "# A\n\ntext\n\n# B\n\nmore\n",
+        }
+        for title, remaining in expected.items():
+            editor = SafeMarkdownEditor(document)
+            assert editor.delete_section(editor.get_section_by_title(title)).success is True
+            assert editor.to_markdown() == remaining
+        
+        # Without a trailing blank line, the separator before the section goes with it
+        editor = SafeMarkdownEditor("# A\n\ntext\n\n# B\n\nmore")
+        assert editor.delete_section(editor.get_section_by_title("B")).success is True
+        assert editor.to_markdown() == "# A\n\ntext"
+
+    def test_delete_last_section_runs_to_end_of_document(self, editor):
+        """Test that deleting the last section removes it through the end of the text."""
+        result = editor.delete_section(editor.get_section_by_title("Section C"))
+        
+        assert result.success is True
+        assert "Section C" not in editor.to_markdown()
+        assert editor.get_sections()[-1].title == "Section B"
+
+    def test_text_delta_matches_delta_between_whole_texts(self, sample_markdown):
+        """Test that the narrowed rollback delta equals the one built from every line."""
+        from quantalogic_markdown_mcp.safe_editor import _text_delta
+        
+        edited = sample_markdown.replace("Content for section B.", "New\nlines\nhere.")
+        for old_text, new_text in [(sample_markdown, edited), (edited, sample_markdown),
+                                   (sample_markdown, sample_markdown), ("", sample_markdown)]:
+            assert _text_delta(old_text, new_text) == TextDelta.between(old_text, new_text)
+
+    def test_splice_lines_matches_list_splicing(self, editor, sample_markdown):
+        """Test that splicing lines gives the same text as splicing a list of lines."""
+        lines = sample_markdown.split('\n')
+        line_count = len(lines)
+        for start, stop in [(0, 0), (0, 3), (4, 5), (5, 4), (-1, line_count), (line_count, line_count), (2, 99)]:
+            for new_lines in ([], ["New line"], ["", "Two", ""]):
+                expected = '\n'.join(lines[:start] + new_lines + lines[stop:])
+                assert editor._splice_lines(start, stop, new_lines) == expected
+
+    def test_update_preview_matches_applied_text(self, editor):
+        """Test that the update preview shows the text the update writes."""
+        section = editor.get_section_by_title("Section B")
+        content = "## Section B\n\nNew content for section B."
+        
+        preview = editor.preview_operation(EditOperation.UPDATE_SECTION, section_ref=section, content=content)
+        result = editor.update_section_content(section, content)
+        
+        assert result.success is True
+        assert preview.preview == editor.to_markdown()
+        assert editor.to_markdown().count("## Section B") == 1
+
+    def test_rollback_reuses_cached_parse(self, editor, monkeypatch):
+        """Test that rolling back to an earlier text does not parse it again."""
+        assert editor.update_section_content(editor.get_sections()[1], "Replaced content.").success
+        
+        calls = []
+        original_parse = editor._parser.parse
+        monkeypatch.setattr(editor._parser, "parse", lambda text: calls.append(text) or original_parse(text))
+        
+        result = editor.rollback_transaction()
+        
+        assert result.success is True
+        assert "Replaced content." not in editor.to_markdown()
+        assert calls == []
+
+    def test_reparse_keeps_unchanged_token_objects(self, editor):
+        """Test that tokens an edit did not change are the same objects after it."""
+        old_tokens = list(editor._current_result.ast)
+        section_b = editor.get_section_by_title("Section B")
+        
+        # Same number of lines, so nothing after the edit moves
+        assert editor.update_section_content(section_b, "\nSame length text.\n").success
+        
+        new_tokens = editor._current_result.ast
+        assert len(new_tokens) == len(old_tokens)
+        changed = [index for index, token in enumerate(new_tokens) if token is not old_tokens[index]]
+        # Only the inline token holding the new paragraph text is a new object
+        assert [new_tokens[index].content for index in changed] == ["Same length text."]
+        assert editor.to_markdown() is editor._current_text
+
+    def test_edits_reparse_only_changed_region(self, editor, monkeypatch):
+        """Test that edits reparse the changed section and match a full parse."""
+        calls = []
+        original_parse = editor._parser.parse
+        monkeypatch.setattr(editor._parser, "parse", lambda text: calls.append(text) or original_parse(text))
+        
+        sections = editor.get_sections()
+        assert editor.update_section_content(sections[2], "Replaced content.\n\n- one\n- two").success
+        assert editor.change_heading_level(editor.get_section_by_title("Section B"), 3).success
+        assert editor.delete_section(editor.get_section_by_title("Section C")).success
+        
+        # Each parse covered only the lines between the headings around the edit
+        assert calls and all("# Main Document" not in text for text in calls)
+        
+        full = original_parse(editor.to_markdown())
+        assert [token.as_dict() for token in editor._current_result.ast] == [token.as_dict() for token in full.ast]
+        assert editor._current_result.headings == full.headings
+        
+        # A fence could swallow the headings after it, so the whole document is parsed
+        calls.clear()
+        assert editor.update_section_content(editor.get_section_by_title("Section A"), "```\ncode\n```").success
+        assert calls == [editor.to_markdown()]
+        
+        # So is a new reference definition, which can change links in any section
+        calls.clear()
+        assert editor.update_section_content(editor.get_section_by_title("Section A"), "[home]: /index").success
+        assert calls == [editor.to_markdown()]
+
     def test_delete_section(self, editor):
         """Test delete_section method."""
         sections = editor.get_sections()
@@ -396,6 +769,21 @@ Content for section C.
         limited_history = editor.get_transaction_history(limit=1)
         assert len(limited_history) <= 1
 
+    def test_history_keeps_replaced_lines_as_one_string(self, editor):
+        """Test that a history entry stores the lines an edit replaced as one string."""
+        original = editor.to_markdown()
+        
+        assert editor.delete_section(editor.get_section_by_title("Section A")).success is True
+        
+        delta = editor.get_transaction_history()[-1].rollback_data
+        assert isinstance(delta.old_text, str)
+        assert "## Section A" in delta.old_text and "### Subsection A2" in delta.old_text
+        assert delta.old_lines == delta.old_text.split('\n')
+        
+        lines = editor.to_markdown().split('\n')
+        delta.revert(lines)
+        assert '\n'.join(lines) == original
+
     def test_rollback_transaction(self, editor):
         """Test rollback_transaction method."""
         # Get initial state
@@ -444,6 +832,25 @@ Content for section C.
         result = editor.rollback_transaction(target_id)
         assert result.success is True
 
+    def test_rollback_restores_exact_text_from_deltas(self, editor):
+        """Test that rolling back several mixed edits restores the original text."""
+        original = editor.to_markdown()
+        
+        editor.update_section_content(editor.get_section_by_title("Section A"), "Changed A")
+        editor.insert_section_after(editor.get_section_by_title("Section C"), 2, "Section D", "New D")
+        editor.delete_section(editor.get_section_by_title("Section B"))
+        
+        history = editor.get_transaction_history()
+        assert len(history) == 3
+        # History keeps line deltas, not copies of the whole document
+        assert all(isinstance(txn.rollback_data, TextDelta) for txn in history)
+        assert all(txn.can_rollback() for txn in history)
+        
+        result = editor.rollback_transaction(history[-1].transaction_id)
+        assert result.success is True
+        assert editor.to_markdown() == original
+        assert editor.get_transaction_history() == []
+
     def test_validate_document(self, editor):
         """Test validate_document method."""
         errors = editor.validate_document()
@@ -471,6 +878,16 @@ Content for section C.
             # This is also acceptable - STRICT mode can reject malformed documents
             assert "heading level jump" in str(e).lower() or "invalid document structure" in str(e).lower()
 
+    def test_validate_document_structure_fail_fast(self):
+        """Test that fail_fast stops structure validation at the first error."""
+        editor = SafeMarkdownEditor("# A\n\n### B\n\n# C\n\n#### D\n", ValidationLevel.NORMAL)
+        
+        all_errors = editor._validate_document_structure()
+        first_error = editor._validate_document_structure(fail_fast=True)
+        
+        assert [error.error_code for error in all_errors] == ["HEADING_LEVEL_JUMP"] * 2
+        assert first_error == all_errors[:1]
+
     def test_to_markdown(self, editor):
         """Test to_markdown export."""
         markdown = editor.to_markdown()
@@ -478,6 +895,49 @@ Content for section C.
         assert len(markdown) > 0
         assert "# Main Document" in markdown
 
+    def test_copy_is_independent(self, editor):
+        """Test that editing a copy leaves the original untouched."""
+        original_text = editor.to_markdown()
+        clone = editor.copy()
+        assert clone.to_markdown() == original_text
+        assert [s.id for s in clone.get_sections()] == [s.id for s in editor.get_sections()]
+        
+        section = clone.get_section_by_title("Section B")
+        result = clone.update_section_content(section, "Replaced content.")
+        assert result.success
+        
+        assert "Replaced content." in clone.to_markdown()
+        assert editor.to_markdown() == original_text
+        assert len(clone.get_transaction_history()) == len(editor.get_transaction_history()) + 1
+
+    def test_get_line(self, editor):
+        """Test single-line access matches splitting the document."""
+        lines = editor.to_markdown().split('\n')
+        assert editor.get_line_count() == len(lines)
+        for index, line in enumerate(lines):
+            assert editor.get_line(index) == line
+        
+        section = editor.get_section_by_title("Section B")
+        assert editor.get_line(section.line_start) == "## Section B"
+        
+        with pytest.raises(IndexError):
+            editor.get_line(len(lines))
+
+    def test_get_section_markdown(self, editor):
+        """Test section slices match joining the section's split lines."""
+        lines = editor.to_markdown().split('\n')
+        for section in editor.get_sections():
+            expected = '\n'.join(lines[section.line_start:section.line_end + 1])
+            assert editor.get_section_markdown(section) == expected
+        
+        last = editor.get_sections()[-1]
+        assert editor.get_section_markdown(last).startswith("## Section C")
+        
+        # A stale reference past the end of the shortened document is rejected
+        editor.delete_section(editor.get_section_by_title("Section A"))
+        with pytest.raises(IndexError):
+            editor.get_section_markdown(last)
+
     def test_to_html(self, editor):
         """Test to_html export."""
         html = editor.to_html()
@@ -486,6 +946,51 @@ Content for section C.
         # Should contain HTML tags
         assert "<h1>" in html or "<h2>" in html
 
+    def test_to_html_renders_once_per_edit(self, editor, monkeypatch):
+        """Test that to_html reuses its HTML until the document changes."""
+        from quantalogic_markdown_mcp.renderers import HTMLRenderer
+        
+        calls = []
+        original_render = HTMLRenderer.render
+        
+        def counting_render(self, ast, options=None):
+            calls.append(ast)
+            return original_render(self, ast, options)
+        
+        monkeypatch.setattr(HTMLRenderer, "render", counting_render)
+        first = editor.to_html()
+        assert editor.to_html() is first
+        assert len(calls) == 1
+        
+        editor.update_section_content(editor.get_section_by_title("Section B"), "Fresh content.")
+        
+        assert "Fresh content." in editor.to_html()
+        assert len(calls) == 2
+
+    def test_to_html_renders_outside_the_lock(self, editor, monkeypatch):
+        """Test that an edit from another thread can finish while HTML renders."""
+        from quantalogic_markdown_mcp.renderers import HTMLRenderer
+        
+        original_render = HTMLRenderer.render
+        edits = []
+        
+        def render_while_editing(self, ast, options=None):
+            section = editor.get_section_by_title("Section B")
+            writer = threading.Thread(
+                target=lambda: edits.append(editor.update_section_content(section, "Edited mid-render."))
+            )
+            writer.start()
+            writer.join(timeout=5)
+            return original_render(self, ast, options)
+        
+        monkeypatch.setattr(HTMLRenderer, "render", render_while_editing)
+        html = editor.to_html()
+        
+        assert len(edits) == 1 and edits[0].success
+        # The render used the snapshot taken before the edit
+        assert "Edited mid-render." not in html
+        assert "Edited mid-render." in editor.to_markdown()
+
     def test_to_json(self, editor):
         """Test to_json export."""
         json_str = editor.to_json()
@@ -510,13 +1015,16 @@ Content for section C.
         assert stats.section_distribution[2] == 3  # Three H2s
         assert stats.section_distribution[3] == 2  # Two H3s
 
-    def test_thread_safety_concurrent_reads(self, editor):
+    def test_thread_safety_concurrent_reads(self, editor, thread_pool):
         """Test thread safety with concurrent reads."""
         results = []
         errors = []
+        # Release all readers together so their calls actually overlap
+        barrier = threading.Barrier(5)
         
         def read_sections(thread_id):
             try:
+                barrier.wait(timeout=5)
                 sections = editor.get_sections()
                 stats = editor.get_statistics()
                 results.append({
@@ -527,19 +1035,8 @@ Content for section C.
             except Exception as e:
                 errors.append(f"Thread {thread_id}: {e}")
         
-        # Create multiple threads
-        threads = []
-        for i in range(5):
-            thread = threading.Thread(target=read_sections, args=(i,))
-            threads.append(thread)
-        
-        # Start all threads
-        for thread in threads:
-            thread.start()
-        
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        # Run the readers on the shared pool and wait for all of them
+        list(thread_pool.map(read_sections, range(5)))
         
         # Verify results
         assert len(errors) == 0, f"Thread errors: {errors}"
@@ -551,13 +1048,16 @@ Content for section C.
             assert result['section_count'] == first_result['section_count']
             assert result['word_count'] == first_result['word_count']
 
-    def test_thread_safety_concurrent_modifications(self, editor):
+    def test_thread_safety_concurrent_modifications(self, editor, thread_pool):
         """Test thread safety with concurrent modifications."""
         results = []
         errors = []
         
+        barrier = threading.Barrier(3)
+        
         def modify_document(thread_id):
             try:
+                barrier.wait(timeout=5)
                 sections = editor.get_sections()
                 if len(sections) > thread_id:
                     result = editor.update_section_content(
@@ -577,23 +1077,39 @@ Content for section C.
             except Exception as e:
                 errors.append(f"Thread {thread_id}: {e}")
         
-        # Create threads (limit to 3 to have enough sections)
-        threads = []
-        for i in range(3):
-            thread = threading.Thread(target=modify_document, args=(i,))
-            threads.append(thread)
+        # Run 3 writers on the shared pool (limit to 3 to have enough sections)
+        list(thread_pool.map(modify_document, range(3)))
         
-        # Start all threads
+        # Verify no exceptions occurred
+        assert len(errors) == 0, f"Thread errors: {errors}"
+        assert len(results) == 3
+
+    def test_readers_share_lock_and_writers_exclude(self, editor):
+        """Test that readers hold the lock together while a writer waits."""
+        lock = editor._lock
+        readers_inside = threading.Barrier(3)
+        write_done = threading.Event()
+        
+        def reader():
+            with lock.read_lock:
+                # Only passes if all three readers hold the lock at once
+                readers_inside.wait(timeout=5)
+        
+        threads = [threading.Thread(target=reader) for _ in range(3)]
         for thread in threads:
             thread.start()
-        
-        # Wait for completion
         for thread in threads:
             thread.join()
         
-        # Verify no exceptions occurred
-        assert len(errors) == 0, f"Thread errors: {errors}"
-        assert len(results) == 3
+        with lock.read_lock:
+            writer = threading.Thread(target=lambda: (editor.update_section_content(
+                editor.get_sections()[1], "Written"), write_done.set()))
+            writer.start()
+            # The writer cannot proceed while this thread reads
+            assert not write_done.wait(timeout=0.05)
+        writer.join(timeout=5)
+        assert write_done.is_set()
+        assert "Written" in editor.to_markdown()
 
     def test_helper_methods(self, editor):
         """Test private helper methods through public interface."""
@@ -705,6 +1221,16 @@ class TestSafeMarkdownEditorTypes:
         assert isinstance(result.errors, list)
         assert isinstance(result.warnings, list)
 
+    def test_edit_result_defaults_share_empty_tuple(self):
+        """Test that EditResult defaults its sequences to the empty tuple."""
+        first = EditResult(success=True, operation=EditOperation.UPDATE_SECTION)
+        second = EditResult(success=False, operation=EditOperation.DELETE_SECTION)
+        
+        assert first.modified_sections == () and first.errors == () and first.warnings == ()
+        assert first.errors is second.errors
+        assert not first.has_errors
+        assert not first.has_warnings
+
     def test_safe_parse_error_with_suggestions(self):
         """Test SafeParseError with suggestions."""
         error = SafeParseError(
@@ -133,6 +133,77 @@ Content for section C.
             assert result.success is True
             assert result.operation == EditOperation.UPDATE_SECTION
 
+    def test_preview_operation_section_scope(self, editor):
+        """Test that a section-scoped preview returns only the edited fragment."""
+        section_a = editor.get_sections()[1]
+        
+        result = editor.preview_operation(
+            EditOperation.UPDATE_SECTION,
+            section_ref=section_a,
+            content="New content for section A",
+            scope="section"
+        )
+        
+        assert result.success is True
+        assert result.preview == editor.get_line(section_a.line_start) + "\nNew content for section A"
+        assert result.metadata["before_fragment"] == editor.get_section_markdown(section_a)
+        
+        # The fragment replaces exactly what the full preview replaces
+        full = editor.preview_operation(
+            EditOperation.UPDATE_SECTION,
+            section_ref=section_a,
+            content="New content for section A"
+        )
+        text = editor.to_markdown()
+        before = result.metadata["before_fragment"]
+        assert full.preview == text.replace(before, result.preview, 1)
+        
+        inserted = editor.preview_operation(
+            EditOperation.INSERT_SECTION,
+            after_section=section_a,
+            level=2,
+            title="Inserted",
+            content="Inserted content.",
+            scope="section"
+        )
+        assert inserted.success is True
+        assert inserted.preview == "## Inserted\n\nInserted content.\n"
+        
+        invalid = editor.preview_operation(
+            EditOperation.UPDATE_SECTION,
+            section_ref=section_a,
+            content="x",
+            scope="chapter"
+        )
+        assert invalid.success is False
+        assert invalid.errors[0].error_code == "INVALID_SCOPE"
+
+    def test_section_scope_preview_skips_parsing_plain_text(self, editor, monkeypatch):
+        """Test that a section-scoped preview of plain prose is not parsed."""
+        section_a = editor.get_sections()[1]
+        calls = []
+        original_parse = editor._parser.parse
+        monkeypatch.setattr(editor._parser, "parse", lambda text: calls.append(text) or original_parse(text))
+        
+        plain = editor.preview_operation(
+            EditOperation.UPDATE_SECTION,
+            section_ref=section_a,
+            content="Just a sentence.\n\nAnd another, with *emphasis*.",
+            scope="section"
+        )
+        assert plain.success is True
+        assert calls == []
+        
+        # Content with block markup is still validated
+        fenced = editor.preview_operation(
+            EditOperation.UPDATE_SECTION,
+            section_ref=section_a,
+            content="```python\nprint('hi')\n```",
+            scope="section"
+        )
+        assert fenced.success is True
+        assert calls == [fenced.preview]
+
     def test_update_section_content(self, editor):
         """Test update_section_content method."""
         sections = editor.get_sections()
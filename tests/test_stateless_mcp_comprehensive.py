@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Comprehensive tests for the StatelessMarkdownMCPServer."""
 
+import os
+import subprocess
 import tempfile
 import sys
 import unittest
@@ -15,10 +17,13 @@ from quantalogic_markdown_mcp.mcp_server import MarkdownMCPServer
 class TestStatelessMCPServer(unittest.TestCase):
     """Test the StatelessMarkdownMCPServer functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one server for the class; tools are stateless, so tests can share it."""
+        cls.server = MarkdownMCPServer()
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.server = MarkdownMCPServer()
-        
         # Create test document content
         self.test_content = """# Test Document
 
@@ -155,6 +160,101 @@ End of the test document.
         updated_section = get_result["section"]
         self.assertIn("This is updated content", updated_section["content"])
     
+    def test_update_section_return_section(self):
+        """Test that update_section can return the updated section with its result."""
+        list_result = self.server.call_tool_sync("list_sections", {"document_path": self.temp_path})
+        section_id = list_result["sections"][1]["id"]
+        
+        result = self.server.call_tool_sync("update_section", {
+            "document_path": self.temp_path,
+            "section_id": section_id,
+            "content": "Returned update.",
+            "return_section": True
+        })
+        
+        self.assertTrue(result["success"])
+        section = result["section"]
+        self.assertEqual(section["id"], section_id)
+        self.assertIn("Returned update.", section["content"])
+        
+        # The returned section matches what get_section reports afterwards
+        get_result = self.server.call_tool_sync("get_section", {
+            "document_path": self.temp_path,
+            "section_id": section_id
+        })
+        self.assertEqual(get_result["section"], section)
+        
+        # Without the option the response is unchanged
+        plain = self.server.call_tool_sync("update_section", {
+            "document_path": self.temp_path, "section_id": section_id, "content": "Plain."
+        })
+        self.assertNotIn("section", plain)
+    
+    def test_consecutive_updates_return_same_version(self):
+        """Test that stateless edits to one file do not carry version or history over."""
+        list_result = self.server.call_tool_sync("list_sections", {"document_path": self.temp_path})
+        section_id = list_result["sections"][1]["id"]
+        
+        versions = []
+        for index in range(3):
+            result = self.server.call_tool_sync("update_section", {
+                "document_path": self.temp_path,
+                "section_id": section_id,
+                "content": f"Update number {index}."
+            })
+            self.assertTrue(result["success"])
+            versions.append(result["version"])
+        
+        self.assertEqual(versions, [2, 2, 2])
+    
+    def test_bulk_insert_sections_rejects_position_zero_and_empty_document(self):
+        """Test that bulk_insert_sections reports invalid placements as error responses."""
+        original = Path(self.temp_path).read_text()
+        sections = [{"heading": "Bulk Section", "content": "Bulk content."}]
+        
+        result = self.server.call_tool_sync("bulk_insert_sections", {
+            "document_path": self.temp_path, "sections": sections, "position": 0
+        })
+        self.assertFalse(result["success"])
+        self.assertIn("position 0", result["error"])
+        self.assertEqual(Path(self.temp_path).read_text(), original)
+        
+        Path(self.temp_path).write_text("")
+        result = self.server.call_tool_sync("bulk_insert_sections", {
+            "document_path": self.temp_path, "sections": sections
+        })
+        self.assertFalse(result["success"])
+        self.assertIn("empty document", result["error"])
+        self.assertEqual(Path(self.temp_path).read_text(), "")
+    
+    def test_insert_section_return_section(self):
+        """Test that insert_section can return the new section with its result."""
+        result = self.server.call_tool_sync("insert_section", {
+            "document_path": self.temp_path,
+            "heading": "Returned Section",
+            "content": "Returned content.",
+            "position": 2,
+            "return_section": True
+        })
+        
+        self.assertTrue(result["success"])
+        section = result["section"]
+        self.assertEqual(section["title"], "Returned Section")
+        self.assertEqual(section["id"], result["modified_sections"][0]["id"])
+        
+        # The returned section matches what get_section reports afterwards
+        get_result = self.server.call_tool_sync("get_section", {
+            "document_path": self.temp_path,
+            "section_id": section["id"]
+        })
+        self.assertEqual(get_result["section"], section)
+        
+        # Without the option the response is unchanged
+        plain = self.server.call_tool_sync("insert_section", {
+            "document_path": self.temp_path, "heading": "Plain", "content": "Plain.", "position": 2
+        })
+        self.assertNotIn("section", plain)
+    
     def test_delete_section(self):
         """Test deleting a section."""
         # First get a section to delete
@@ -240,7 +340,152 @@ End of the test document.
     def test_invalid_tool_name(self):
         """Test handling of invalid tool names."""
         result = self.server.call_tool_sync("nonexistent_tool", {"document_path": self.temp_path})
+
+        self.assertFalse(result["success"])
+        self.assertIn("error", result)
+
+    def test_mcp_app_built_on_first_use(self):
+        """Test that the FastMCP app is only built when something asks for it."""
+        server = MarkdownMCPServer("LazyServer")
+        self.assertIsNone(server._mcp)
+        
+        # Tool calls in Python do not need the app
+        result = server.call_tool_sync("list_sections", {"document_path": self.temp_path})
+        self.assertTrue(result["success"])
+        self.assertIsNone(server._mcp)
+        
+        app = server.mcp
+        self.assertIsNotNone(app)
+        self.assertIs(server.mcp, app)
+    
+    def test_module_import_does_not_build_app(self):
+        """Test that importing the server module leaves the global app unbuilt until mcp is read."""
+        script = (
+            "import quantalogic_markdown_mcp.mcp_server as module\n"
+            "assert module.server._mcp is None\n"
+            "from quantalogic_markdown_mcp.mcp_server import mcp\n"
+            "assert mcp is module.server.mcp\n"
+        )
+        # A fresh interpreter, since other tests may already have built the app here
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        completed = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True)
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+    
+    def test_direct_tool_methods(self):
+        """Test calling tools as methods instead of through call_tool_sync."""
+        direct = self.server.list_sections(document_path=self.temp_path)
+        dispatched = self.server.call_tool_sync("list_sections", {"document_path": self.temp_path})
+
+        self.assertTrue(direct["success"])
+        self.assertEqual(direct["sections"], dispatched["sections"])
+
+    def test_read_only_tools_reuse_parsed_document(self):
+        """Test that unchanged files are parsed once and rewritten files reparsed."""
+        first = self.server._load_cached_editor(self.temp_path)
+        self.assertIs(self.server._load_cached_editor(self.temp_path), first)
+
+        Path(self.temp_path).write_text(self.test_content + "\n## Appendix\nExtra.\n")
+        self.assertIsNot(self.server._load_cached_editor(self.temp_path), first)
+
+        result = self.server.call_tool_sync("list_sections", {"document_path": self.temp_path})
+        self.assertEqual(len(result["sections"]), 7)
+
+    def test_get_document_reuses_data_until_file_changes(self):
+        """Test that repeated get_document calls on an unchanged file share one build."""
+        first = self.server.call_tool_sync("get_document", {"document_path": self.temp_path})
+        editor = self.server._load_cached_editor(self.temp_path)
+        cached_content, _ = self.server._document_data_cache[editor]
+
+        second = self.server.call_tool_sync("get_document", {"document_path": self.temp_path})
+        self.assertIs(self.server._document_data_cache[editor][0], cached_content)
+        self.assertEqual(first, second)
+
+        # Mutating a response must not leak into later ones
+        second["sections"][0]["title"] = "Changed"
+        third = self.server.call_tool_sync("get_document", {"document_path": self.temp_path})
+        self.assertEqual(third["sections"][0]["title"], "Test Document")
+
+        self.server.call_tool_sync("insert_section", {
+            "document_path": self.temp_path, "heading": "Later", "content": "Added.", "position": 2
+        })
+        updated = self.server.call_tool_sync("get_document", {"document_path": self.temp_path})
+        self.assertIn("## Later", updated["content"])
+        self.assertEqual(len(updated["sections"]), len(first["sections"]) + 1)
+
+    def test_edit_tools_cache_saved_editor(self):
+        """Test that an edit leaves the saved document cached for the next call."""
+        before = self.server._load_cached_editor(self.temp_path)
+        section = before.get_section_by_title("Features")
         
+        result = self.server.call_tool_sync("update_section", {
+            "document_path": self.temp_path, "section_id": section.id, "content": "Cached content."
+        })
+        self.assertTrue(result["success"])
+        
+        # The cached editor is the edited copy, never the one readers already hold
+        after = self.server._load_cached_editor(self.temp_path)
+        self.assertIsNot(after, before)
+        self.assertEqual(after.to_markdown(), Path(self.temp_path).read_text())
+        self.assertNotIn("Cached content.", before.to_markdown())
+    
+    def test_sections_as_records(self):
+        """Test converting section dicts from a tool response into records."""
+        result = self.server.call_tool_sync("list_sections", {"document_path": self.temp_path})
+        records = self.server.sections_as_records(result)
+
+        self.assertEqual(len(records), len(result["sections"]))
+        self.assertEqual(records[0].title, "Test Document")
+        self.assertEqual(records[0].level, 1)
+        self.assertEqual(records[0].id, result["sections"][0]["id"])
+        self.assertEqual(records[0].line_start, result["sections"][0]["start_line"])
+
+    def test_call_tools_sync_batch(self):
+        """Test running several tools against one document in a single batch."""
+        result = self.server.call_tools_sync(self.temp_path, [
+            ("list_sections", {}),
+            ("insert_section", {"heading": "Batched Section", "content": "Batched content.", "position": 2}),
+            ("list_sections", {}),
+        ])
+
+        self.assertTrue(result["success"])
+        self.assertTrue(result["saved"])
+        before, inserted, after = result["results"]
+        self.assertTrue(inserted["success"])
+        self.assertEqual(len(after["sections"]), len(before["sections"]) + 1)
+
+        # The batch result is persisted once at the end
+        self.assertIn("## Batched Section", Path(self.temp_path).read_text())
+
+    def test_call_tools_sync_read_only_batch_does_not_save(self):
+        """Test that a batch without modifications leaves the file untouched."""
+        result = self.server.call_tools_sync(self.temp_path, [
+            ("get_document", {}),
+            ("analyze_document", {}),
+        ])
+
+        self.assertTrue(result["success"])
+        self.assertFalse(result["saved"])
+        self.assertFalse(Path(self.temp_path + ".bak").exists())
+
+    def test_call_tools_sync_failed_call_does_not_save(self):
+        """Test that a batch with a failing call leaves the file untouched."""
+        original = Path(self.temp_path).read_text()
+        result = self.server.call_tools_sync(self.temp_path, [
+            ("insert_section", {"heading": "Batched Section", "content": "Batched content.", "position": 2}),
+            ("delete_section", {"section_id": "nope"}),
+        ])
+
+        self.assertFalse(result["success"])
+        self.assertFalse(result["saved"])
+        inserted, deleted = result["results"]
+        self.assertTrue(inserted["success"])
+        self.assertFalse(deleted["success"])
+        self.assertEqual(Path(self.temp_path).read_text(), original)
+
+    def test_call_tools_sync_rejects_unbatchable_tool(self):
+        """Test that tools without an editor operation cannot be batched."""
+        result = self.server.call_tools_sync(self.temp_path, [("save_document", {})])
+
         self.assertFalse(result["success"])
         self.assertIn("error", result)
 
@@ -2,6 +2,8 @@
 
 import pytest
 import tempfile
+import threading
+from io import StringIO
 from pathlib import Path
 
 from quantalogic_markdown_mcp.stateless_processor import (
@@ -185,6 +187,63 @@ class TestStatelessMarkdownProcessor:
         
         temp_file.unlink()  # Cleanup
     
+    def test_concurrent_edits_to_one_document_are_not_lost(self):
+        """Test that concurrent saving operations on one file all land."""
+        temp_file = self.helper.create_temp_document(self.sample_content)
+        start = threading.Barrier(5)
+        results = []
+        
+        def insert(worker_id):
+            def operation(editor):
+                sections = editor.get_sections()
+                return editor.insert_section_after(sections[-1], 2, f"Worker {worker_id}", "Concurrent")
+            
+            start.wait(timeout=5)
+            results.append(self.processor.execute_operation(str(temp_file), operation, backup=False))
+        
+        threads = [threading.Thread(target=insert, args=(i,)) for i in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert all(result["success"] for result in results)
+        saved_content = temp_file.read_text()
+        for i in range(5):
+            assert f"Worker {i}" in saved_content
+        
+        temp_file.unlink()  # Cleanup
+    
+    def test_load_document_from_stream(self):
+        """Test loading a document from an in-memory text stream."""
+        stream = StringIO(self.sample_content)
+        stream.read()  # Loading must not depend on the stream position
+        
+        editor = self.processor.load_document(stream)
+        
+        assert editor.to_markdown() == self.sample_content
+        assert len(editor.get_sections()) > 0
+    
+    def test_execute_operation_saves_to_stream(self):
+        """Test that auto-save rewrites an in-memory stream in place."""
+        stream = StringIO(self.sample_content)
+        
+        def test_operation(editor):
+            sections = editor.get_sections()
+            return editor.insert_section_after(
+                after_section=sections[0],
+                level=2,
+                title="Stream Section",
+                content="Stream content"
+            )
+        
+        result = self.processor.execute_operation(stream, test_operation)
+        
+        self.helper.assert_operation_success(result)
+        assert result["saved"] is True
+        assert result["save_info"]["backup_created"] is False
+        assert "## Stream Section" in stream.getvalue()
+    
     @pytest.mark.parametrize("validation_level", [
         ValidationLevel.STRICT,
         ValidationLevel.NORMAL,